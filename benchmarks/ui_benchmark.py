@@ -0,0 +1,313 @@
+"""Headless timing benchmarks for the views.
+
+Runs each view scenario at several data sizes under the offscreen Qt
+platform and writes a JSON report of median/p95 times and widget counts.
+Reports are written with sorted keys so two runs can be diffed, or
+compared directly:
+
+    python -m benchmarks.ui_benchmark --output before.json
+    python -m benchmarks.ui_benchmark --output after.json \\
+        --baseline before.json
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QEvent, PYQT_VERSION_STR, QT_VERSION_STR  # noqa
+from PyQt6.QtWidgets import (  # noqa: E402
+    QApplication,
+    QScrollArea,
+    QVBoxLayout,
+    QWidget,
+)
+
+from src.models.follower import Follower  # noqa: E402
+from src.models.post import Post, Sentiment  # noqa: E402
+from src.models.user import User  # noqa: E402
+from src.services.logger_service import LoggerService  # noqa: E402
+from src.views.feed_widget import FeedWidget  # noqa: E402
+from src.views.follower_list_widget import FollowerListWidget  # noqa: E402
+from src.views.post_widget import PostWidget  # noqa: E402
+from src.views.refresh_coalescer import RefreshCoalescer  # noqa: E402
+from src.views.style_manager import StyleManager  # noqa: E402
+
+DEFAULT_SIZES = (10, 100, 1000, 10000)
+DEFAULT_REPEAT = 5
+
+# Window size the views are laid out and painted at
+VIEW_WIDTH = 800
+VIEW_HEIGHT = 600
+
+SENTIMENTS = (Sentiment.LEFT, Sentiment.NEUTRAL, Sentiment.RIGHT)
+
+
+def make_user(posts=0, followers=0):
+    """User with the given number of posts and followers."""
+    user = User("benchmark_user", "Benchmark account")
+    for i in range(posts):
+        post = Post(f"Benchmark post {i} " + "lorem ipsum " * (i % 20), user)
+        post.sentiment = SENTIMENTS[i % 3]
+        user._posts.append(post)
+    for i in range(followers):
+        user._followers.append(
+            Follower(SENTIMENTS[i % 3], f"follower_{i:06d}")
+        )
+    user._follower_count = followers
+    return user
+
+
+def settle():
+    """Run pending refreshes, layouts, paints and deletions."""
+    app = QApplication.instance()
+    RefreshCoalescer.get_instance().flush()
+    app.processEvents()
+    app.sendPostedEvents(None, QEvent.Type.DeferredDelete.value)
+
+
+def widget_count(root):
+    return 1 + len(root.findChildren(QWidget))
+
+
+def show(widget):
+    widget.resize(VIEW_WIDTH, VIEW_HEIGHT)
+    widget.show()
+    settle()
+
+
+def close(widget):
+    widget.hide()
+    widget.deleteLater()
+    settle()
+
+
+# Each benchmark sets up its data and returns (root, run, teardown). run()
+# does the timed work and returns the widget it created, which is closed
+# untimed before the next run, or None if it works on root instead
+
+
+def bench_feed_update(size):
+    """FeedWidget.update_feed over a user with size posts."""
+    feed = FeedWidget(make_user(posts=size))
+    show(feed)
+
+    def run():
+        feed.update_feed()
+        settle()
+
+    return feed, run, lambda: close(feed)
+
+
+def bench_follower_list(size):
+    """FollowerListWidget construction for a user with size followers."""
+    user = make_user(followers=size)
+
+    def run():
+        widget = FollowerListWidget(user)
+        show(widget)
+        return widget
+
+    return None, run, lambda: None
+
+
+def bench_theme_toggle(size):
+    """StyleManager.toggle_theme with a feed of size posts on screen."""
+    user = make_user(posts=size, followers=size)
+    window = QWidget()
+    layout = QVBoxLayout(window)
+    layout.addWidget(FeedWidget(user))
+    layout.addWidget(FollowerListWidget(user))
+    show(window)
+    theme_manager = StyleManager.get_instance()
+
+    def run():
+        theme_manager.toggle_theme()
+        settle()
+
+    def teardown():
+        theme_manager.set_theme("light")
+        close(window)
+
+    return window, run, teardown
+
+
+def bench_post_widgets(size):
+    """Creating and showing size PostWidgets in a scroll area."""
+    posts = make_user(posts=size).posts
+
+    def run():
+        # Scrolled like a real list, so only the viewport is backed by a
+        # window-sized buffer
+        container = QScrollArea()
+        container.setWidgetResizable(True)
+        content = QWidget()
+        layout = QVBoxLayout(content)
+        for post in posts:
+            layout.addWidget(PostWidget(post))
+        container.setWidget(content)
+        show(container)
+        return container
+
+    return None, run, lambda: None
+
+
+BENCHMARKS = {
+    "feed.update_feed": bench_feed_update,
+    "followers.construct": bench_follower_list,
+    "theme.toggle": bench_theme_toggle,
+    "post_widget.create": bench_post_widgets,
+}
+
+
+def percentile(samples, fraction):
+    """Linearly interpolated percentile of samples, fraction in [0, 1]."""
+    ordered = sorted(samples)
+    position = (len(ordered) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (
+        position - lower
+    )
+
+
+def run_benchmark(name, size, repeat):
+    """Time one scenario repeat times and summarise the samples."""
+    root, run, teardown = BENCHMARKS[name](size)
+    samples = []
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            created = run()
+            samples.append((time.perf_counter() - start) * 1000)
+            widgets = widget_count(created or root)
+            if created is not None:
+                close(created)
+    finally:
+        teardown()
+
+    return {
+        "benchmark": name,
+        "size": size,
+        "repeat": repeat,
+        "median_ms": round(statistics.median(samples), 3),
+        "p95_ms": round(percentile(samples, 0.95), 3),
+        "min_ms": round(min(samples), 3),
+        "widget_count": widgets,
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(names=None, sizes=DEFAULT_SIZES, repeat=DEFAULT_REPEAT):
+    """Run the named benchmarks at each size and build the report."""
+    app = QApplication.instance() or QApplication([])
+    StyleManager.get_instance().set_theme("light")
+
+    results = []
+    for name in names or BENCHMARKS:
+        for size in sizes:
+            results.append(run_benchmark(name, size, repeat))
+            print(
+                f"{name:<22} {size:>6}  "
+                f"median {results[-1]['median_ms']:>9.1f} ms  "
+                f"p95 {results[-1]['p95_ms']:>9.1f} ms",
+                file=sys.stderr,
+            )
+
+    return {
+        "environment": {
+            "commit": git_commit(),
+            "platform": platform.platform(),
+            "python": platform.python_version(),
+            "pyqt": PYQT_VERSION_STR,
+            "qt": QT_VERSION_STR,
+            "qpa_platform": app.platformName(),
+        },
+        "results": results,
+    }
+
+
+def compare(report, baseline):
+    """Lines comparing report's medians with a baseline report's."""
+    previous = {
+        (result["benchmark"], result["size"]): result
+        for result in baseline["results"]
+    }
+    lines = []
+    for result in report["results"]:
+        key = (result["benchmark"], result["size"])
+        if key not in previous or not previous[key]["median_ms"]:
+            continue
+        ratio = result["median_ms"] / previous[key]["median_ms"]
+        lines.append(
+            f"{key[0]:<22} {key[1]:>6}  "
+            f"{previous[key]['median_ms']:>9.1f} -> "
+            f"{result['median_ms']:>9.1f} ms  ({ratio:.2f}x)"
+        )
+    return lines
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--benchmark",
+        action="append",
+        choices=sorted(BENCHMARKS),
+        help="benchmark to run (repeatable, default: all)",
+    )
+    parser.add_argument(
+        "--sizes",
+        default=",".join(str(size) for size in DEFAULT_SIZES),
+        help="comma-separated item counts (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=DEFAULT_REPEAT,
+        help="timed runs per benchmark and size (default: %(default)s)",
+    )
+    parser.add_argument("--output", help="write the JSON report here")
+    parser.add_argument(
+        "--baseline", help="earlier JSON report to compare medians with"
+    )
+    args = parser.parse_args(argv)
+
+    # Keep per-item log output out of the timings
+    LoggerService.get_logger().setLevel(logging.WARNING)
+
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+    report = run_suite(args.benchmark, sizes, max(1, args.repeat))
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(text + "\n")
+    else:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+        for line in compare(report, baseline):
+            print(line, file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,8 @@
+import logging
 import random
 
 from src.models.follower import Follower
+from src.models.follower_store import import_numpy
 from src.models.post import Comment, Sentiment
 from src.patterns.command.post_commands import (
     CommentCommand,
@@ -31,10 +33,8 @@ class FollowerController:
 
         # Create a follower with the sentiment
         follower = Follower.create_with_random_handle(sentiment)
-        self.logger.info(
-            f"Created new follower: {
-                follower.handle} with {
-                sentiment.name} sentiment"
+        LoggerService.log_event(
+            "follower.generated", handle=follower.handle, sentiment=sentiment
         )
         return follower
 
@@ -84,18 +84,21 @@ class FollowerController:
         # Increase follow chance for debugging
         follow_chance = min(100, follow_chance * 2)
 
-        self.logger.debug(
-            f"Follower {
-                follower.handle} considering following with chance {follow_chance}%"
+        LoggerService.log_event(
+            "follower.follow_considered",
+            handle=follower.handle,
+            chance=follow_chance,
         )
 
         # For neutral posts, any follower might follow
         if post.sentiment == Sentiment.NEUTRAL:
             result = random.randint(1, 100) <= follow_chance
             if result:
-                self.logger.info(
-                    f"Follower {
-                        follower.handle} will follow due to neutral post"
+                LoggerService.log_event(
+                    "follower.will_follow",
+                    logging.INFO,
+                    handle=follower.handle,
+                    reason="neutral",
                 )
             return result
 
@@ -122,10 +125,11 @@ class FollowerController:
             )  # 70% reduction
 
         if result:
-            self.logger.info(
-                f"Follower {
-                    follower.handle} will follow due to {
-                    'aligned' if is_aligned else 'non-aligned'} post"
+            LoggerService.log_event(
+                "follower.will_follow",
+                logging.INFO,
+                handle=follower.handle,
+                reason="aligned" if is_aligned else "non-aligned",
             )
 
         return result
@@ -157,30 +161,9 @@ class FollowerController:
 
         # Calculate alignment between follower and post
         alignment = self.calculate_alignment(follower, post)
-
-        # Comment chance based on alignment
-        if alignment > 70:
-            comment_chance = 60
-        elif alignment > 40:
-            comment_chance = 30
-        else:
-            comment_chance = 10
-
-        # Like chance based on alignment
-        if alignment > 70:
-            like_chance = 80
-        elif alignment > 40:
-            like_chance = 40
-        else:
-            like_chance = 5
-
-        # Share chance based on alignment
-        if alignment > 70:
-            share_chance = 30
-        elif alignment > 40:
-            share_chance = 10
-        else:
-            share_chance = 1
+        comment_chance, like_chance, share_chance = (
+            self.interaction_chances(alignment)
+        )
 
         # Perform interactions
         interactions_occurred = False
@@ -200,9 +183,6 @@ class FollowerController:
             if hasattr(follower, "command_history"):
                 follower.command_history.push(comment_command)
 
-            self.logger.info(
-                f"Follower {follower.handle} commented on post: {comment_text[:30]}..."
-            )
             interactions_occurred = True
 
         # Try to like
@@ -214,7 +194,6 @@ class FollowerController:
             if hasattr(follower, "command_history"):
                 follower.command_history.push(like_command)
 
-            self.logger.info(f"Follower {follower.handle} liked post")
             interactions_occurred = True
 
         # Try to share
@@ -226,24 +205,35 @@ class FollowerController:
             if hasattr(follower, "command_history"):
                 follower.command_history.push(share_command)
 
-            self.logger.info(f"Follower {follower.handle} shared post")
             interactions_occurred = True
 
         return interactions_occurred
 
+    def interaction_chances(self, alignment):
+        # Percentage chances (comment, like, share) for an alignment
+        if alignment > 70:
+            return 60, 80, 30
+        elif alignment > 40:
+            return 30, 40, 10
+        return 10, 5, 1
+
     def calculate_alignment(self, follower, post):
         # Calculate how well follower aligns with post sentiment (0-100%)
-        if post.sentiment == Sentiment.LEFT:
+        return self.alignment_for_lean(follower.political_lean, post.sentiment)
+
+    def alignment_for_lean(self, political_lean, sentiment):
+        # Calculate how well a political lean aligns with a sentiment (0-100%)
+        if sentiment == Sentiment.LEFT:
             alignment = (
-                100 - follower.political_lean
+                100 - political_lean
             )  # Higher political_lean = less aligned with LEFT
-        elif post.sentiment == Sentiment.RIGHT:
+        elif sentiment == Sentiment.RIGHT:
             alignment = (
-                follower.political_lean
+                political_lean
             )  # Higher political_lean = more aligned with RIGHT
         else:
             # For neutral posts, alignment is based on how moderate the follower is
-            alignment = 100 - abs(50 - follower.political_lean) * 2
+            alignment = 100 - abs(50 - political_lean) * 2
 
         # Ensure alignment is between 0 and 100
         return max(0, min(100, alignment))
@@ -273,11 +263,13 @@ class FollowerController:
         )
 
         if old_lean != follower.political_lean:
-            self.logger.info(
-                f"Follower {
-                    follower.handle} political lean adjusted from {old_lean} to {
-                    follower.political_lean} due to {
-                    sentiment.name} content"
+            LoggerService.log_event(
+                "follower.lean_adjusted",
+                follower_id=follower.follower_id,
+                handle=follower.handle,
+                old_lean=old_lean,
+                new_lean=follower.political_lean,
+                sentiment=sentiment,
             )
 
     def get_comment_for_alignment(self, alignment, post_sentiment):
@@ -362,38 +354,44 @@ class FollowerController:
             return False
 
         # Log the alignment for debugging
-        self.logger.debug(
-            f"Follower {
-                follower.handle} (political lean: {
-                follower.political_lean}) has {alignment}% alignment with {
-                post.sentiment.name} post"
+        LoggerService.log_event(
+            "follower.unfollow_considered",
+            handle=follower.handle,
+            political_lean=follower.political_lean,
+            alignment=alignment,
+            sentiment=post.sentiment,
         )
 
         # Determine unfollow chance based on alignment
-        if alignment < 20:
-            unfollow_chance = 80
-        elif alignment < 40:
-            unfollow_chance = 50
-        elif alignment < 60:
-            unfollow_chance = 20
-        elif alignment < 80:
-            unfollow_chance = 10
-        else:
-            unfollow_chance = 0
+        unfollow_chance = self.unfollow_chance(alignment)
 
         # Roll the dice
         should_unfollow = random.randint(1, 100) <= unfollow_chance
 
         if should_unfollow:
-            self.logger.info(
-                f"Follower {
-                    follower.handle} (political lean: {
-                    follower.political_lean}) decided to unfollow due to low alignment ({alignment}%) with {
-                    post.sentiment.name} post"
+            LoggerService.log_event(
+                "follower.will_unfollow",
+                logging.INFO,
+                handle=follower.handle,
+                political_lean=follower.political_lean,
+                alignment=alignment,
+                sentiment=post.sentiment,
             )
 
         return should_unfollow
 
+    def unfollow_chance(self, alignment):
+        # Percentage chance that a follower unfollows a political post
+        if alignment < 20:
+            return 80
+        elif alignment < 40:
+            return 50
+        elif alignment < 60:
+            return 20
+        elif alignment < 80:
+            return 10
+        return 0
+
     def update_follower(self, follower, subject, post=None):
         if post:
             # Let the follower interact with the post using its own method
@@ -433,6 +431,88 @@ class FollowerController:
 
         return False  # No unfollowing occurred
 
+    def update_store(self, store, post, rng=None, chunk_size=None):
+        # update_follower for every follower in a FollowerStore, one chunk
+        # of columns at a time. Leans drift as in adjust_lean_from_sentiment,
+        # likes and shares are added to the post in bulk and followers who
+        # unfollow are dropped from the store. Comments need a Comment per
+        # follower and are not simulated here. Returns how many unfollowed
+        np = import_numpy()
+        if rng is None:
+            # Seeded from random so random.seed() still reproduces a run
+            rng = np.random.default_rng(random.getrandbits(64))
+
+        # Per-lean and per-alignment lookup tables built from the same
+        # rules the per-follower path uses
+        sentiment = post.sentiment
+        alignment_table = np.array(
+            [self.alignment_for_lean(lean, sentiment) for lean in range(101)]
+        )
+        chances = [self.interaction_chances(a) for a in range(101)]
+        like_table = np.array([chance[1] for chance in chances])
+        share_table = np.array([chance[2] for chance in chances])
+        unfollow_table = np.array(
+            [
+                (
+                    0
+                    if sentiment == Sentiment.NEUTRAL
+                    else self.unfollow_chance(alignment)
+                )
+                for alignment in range(101)
+            ]
+        )
+        totals = {"likes": 0, "shares": 0}
+
+        def update_chunk(columns):
+            lean = columns["political_lean"].astype("i2")
+            size = len(lean)
+            if sentiment == Sentiment.LEFT:
+                lean -= rng.integers(1, 4, size, dtype="i2")
+            elif sentiment == Sentiment.RIGHT:
+                lean += rng.integers(1, 4, size, dtype="i2")
+            else:
+                lean += np.sign(50 - lean) * rng.integers(
+                    0, 3, size, dtype="i2"
+                )
+            np.clip(lean, 0, 100, out=lean)
+            columns["political_lean"][:] = lean
+
+            alignment = alignment_table[lean]
+            liked = rng.integers(1, 101, size) <= like_table[alignment]
+            shared = rng.integers(1, 101, size) <= share_table[alignment]
+            unfollowed = (
+                rng.integers(1, 101, size) <= unfollow_table[alignment]
+            )
+            columns["activity"][:] += (
+                liked.astype("u4") + shared + unfollowed
+            )
+            totals["likes"] += int(liked.sum())
+            totals["shares"] += int(shared.sum())
+            return ~unfollowed
+
+        if chunk_size is None:
+            unfollowed = store.update(update_chunk)
+        else:
+            unfollowed = store.update(update_chunk, chunk_size)
+
+        if totals["likes"]:
+            post._increment_likes(totals["likes"])
+        if totals["shares"]:
+            post._increment_shares(totals["shares"])
+        if unfollowed:
+            post._add_follower_lost(unfollowed)
+
+        LoggerService.log_event(
+            "follower.store_updated",
+            logging.INFO,
+            post_id=post.post_id,
+            followers=len(store),
+            likes=totals["likes"],
+            shares=totals["shares"],
+            unfollowed=unfollowed,
+        )
+        return unfollowed
+
     def calculate_follow_chance(self, user, post_sentiment):
         # Apply reputation penalty
         reputation_penalty = min(
@@ -461,37 +541,78 @@ class FollowerController:
         final_chance = int(adjusted_chance * follower_multiplier)
 
         # Log the calculation
-        self.logger.debug(
-            f"Follow chance calculation: sentiment={post_sentiment.name}, "
-            f"base={base_chance}, reputation_penalty={reputation_penalty}, "
-            f"follower_multiplier={follower_multiplier}, final={final_chance}"
+        LoggerService.log_event(
+            "follower.follow_chance",
+            sentiment=post_sentiment,
+            base=base_chance,
+            reputation_penalty=reputation_penalty,
+            follower_multiplier=follower_multiplier,
+            final=final_chance,
         )
 
         return final_chance
 
     def generate_potential_followers(self, post, count=5):
         # Create distribution based on post sentiment
-        if post.sentiment == Sentiment.LEFT:
+        distribution = self.potential_follower_distribution(post.sentiment)
+
+        # Generate followers with the distribution
+        return self.create_followers_batch(count, distribution)
+
+    def potential_follower_distribution(self, post_sentiment):
+        # Sentiment mix of the audience a post reaches
+        if post_sentiment == Sentiment.LEFT:
             # Left-leaning post attracts more left-leaning followers
-            distribution = {
+            return {
                 Sentiment.LEFT: 0.6,
                 Sentiment.NEUTRAL: 0.3,
                 Sentiment.RIGHT: 0.1,
             }
-        elif post.sentiment == Sentiment.RIGHT:
+        elif post_sentiment == Sentiment.RIGHT:
             # Right-leaning post attracts more right-leaning followers
-            distribution = {
+            return {
                 Sentiment.RIGHT: 0.6,
                 Sentiment.NEUTRAL: 0.3,
                 Sentiment.LEFT: 0.1,
             }
         else:
             # Neutral post attracts balanced followers
-            distribution = {
+            return {
                 Sentiment.NEUTRAL: 0.5,
                 Sentiment.LEFT: 0.25,
                 Sentiment.RIGHT: 0.25,
             }
 
-        # Generate followers with the distribution
-        return self.create_followers_batch(count, distribution)
+    def estimate_follower_impact(self, user, post_sentiment, potential_count):
+        # Expected (gained, lost) followers for a post with this sentiment,
+        # using the same probabilities as should_follow and should_unfollow
+        follow_chance = min(
+            100, self.calculate_follow_chance(user, post_sentiment) * 2
+        )
+
+        if post_sentiment == Sentiment.NEUTRAL:
+            follow_probability = follow_chance / 100
+            expected_lost = 0.0
+        else:
+            # Only followers of the post's own sentiment fall outside the
+            # LEFT/RIGHT lean thresholds and count as aligned
+            aligned_share = self.potential_follower_distribution(
+                post_sentiment
+            )[post_sentiment]
+            follow_probability = (
+                aligned_share * min(100, follow_chance * 1.5)
+                + (1 - aligned_share) * follow_chance * 0.3
+            ) / 100
+            expected_lost = (
+                sum(
+                    self.unfollow_chance(
+                        self.alignment_for_lean(
+                            follower.political_lean, post_sentiment
+                        )
+                    )
+                    for follower in user.followers
+                )
+                / 100
+            )
+
+        return potential_count * follow_probability, expected_lost
@@ -1,8 +1,26 @@
+import os
+import sqlite3
+
+from PyQt6.QtCore import QTimer
+from PyQt6.QtWidgets import QApplication
+
 from src.controllers.follower_controller import FollowerController
 from src.controllers.post_controller import PostController
 from src.controllers.user_controller import UserController
 from src.models.user import User
+from src.services.analytics_exporter import AnalyticsExporter
 from src.services.company_service import CompanyService
+from src.services.event_stream import EventStreamWriter
+from src.services.journal import JournalWriter, replay_journal
+from src.services.logger_service import LoggerService
+from src.services.snapshot_service import (
+    Autosaver,
+    capture_snapshot,
+    load_snapshot,
+    read_manifest,
+    save_snapshot,
+)
+from src.services.sqlite_repository import SQLiteRepository
 from src.views.main_window import SocialMediaMainWindow
 
 
@@ -19,21 +37,63 @@ class MainController:
         # Set the singleton instance
         MainController._instance = self
 
-        self.user = User("default_user", "Default bio")
+        # Record simulation events to EVENT_STREAM_PATH if configured
+        self.event_stream = EventStreamWriter.from_env()
+        if self.event_stream:
+            LoggerService.add_event_sink(self.event_stream)
+
+        # Export analytics tables to ANALYTICS_EXPORT_DIR if configured
+        self.analytics = AnalyticsExporter.from_env()
+        if self.analytics:
+            LoggerService.add_event_sink(self.analytics)
+
+        # Initialize the company service
+        self.company_service = CompanyService.get_instance()
+
+        # Resume the simulation saved at SNAPSHOT_PATH, if any, with the
+        # changes journaled at JOURNAL_PATH since replayed on top
+        self.snapshot_path = os.getenv("SNAPSHOT_PATH")
+        restored_user = self._load_snapshot()
+        restored_user = self._replay_journal(restored_user)
+        self.user = (
+            User("default_user", "Default bio")
+            if restored_user is None
+            else restored_user
+        )
+
+        # Record posts, followers, comments and interactions in the SQLite
+        # database at SQLITE_PATH if configured; the views then read from
+        # it. Opened once the snapshot has advanced the ids, so reuse of
+        # the database by another world is detected
+        self.repository = self._open_repository()
 
         # Create controllers
         self.user_controller = UserController(self.user)
         self.post_controller = PostController()
         self.follower_controller = FollowerController()
 
-        # Initialize the company service
-        self.company_service = CompanyService.get_instance()
-
         # Initialise UI
         self.init_ui()
 
         # Generate some initial followers
-        self._generate_initial_followers()
+        if restored_user is None:
+            self._generate_initial_followers()
+
+        # Save on exit, and every SNAPSHOT_AUTOSAVE_SECONDS if set
+        self.autosaver = None
+        if self.snapshot_path:
+            self._start_autosave()
+            QApplication.instance().aboutToQuit.connect(self._save_on_exit)
+        if self.journal:
+            QApplication.instance().aboutToQuit.connect(self._close_journal)
+
+        # Sample the lean distribution periodically and finish the export
+        # on exit
+        if self.analytics:
+            self._start_analytics()
+            QApplication.instance().aboutToQuit.connect(
+                self._close_analytics
+            )
 
     def init_ui(self):
         self.main_window = SocialMediaMainWindow(self.user)
@@ -42,6 +102,164 @@ class MainController:
         self.main_window.set_user_controller(self.user_controller)
         self.main_window.set_post_controller(self.post_controller)
 
+    def _load_snapshot(self):
+        # Restored user, or None if there is no snapshot to resume
+        self.journal_seq = 0
+        if not self.snapshot_path or not os.path.exists(self.snapshot_path):
+            return None
+        try:
+            user = load_snapshot(self.snapshot_path, self.company_service)
+            self.journal_seq = read_manifest(self.snapshot_path).get(
+                "journal_seq", 0
+            )
+            return user
+        except (OSError, ValueError, KeyError) as e:
+            LoggerService.get_logger().error(
+                f"Could not load snapshot {self.snapshot_path}: {e}"
+            )
+            return None
+
+    def _replay_journal(self, restored_user):
+        # Apply the journal records newer than the snapshot, then keep
+        # journaling. Returns the user to resume, or None to start afresh
+        self.journal = None
+        journal_path = os.getenv("JOURNAL_PATH")
+        if not journal_path:
+            return restored_user
+
+        user = restored_user or User("default_user", "Default bio")
+        applied = 0
+        try:
+            user, applied, self.journal_seq = replay_journal(
+                journal_path, user, self.company_service, self.journal_seq
+            )
+            self.journal = JournalWriter.from_env(start_seq=self.journal_seq)
+        except (OSError, ValueError, KeyError) as e:
+            LoggerService.get_logger().error(
+                f"Could not replay journal {journal_path}: {e}"
+            )
+        if self.journal:
+            LoggerService.add_event_sink(self.journal)
+
+        if restored_user is None and not applied:
+            return None
+        return user
+
+    def _open_repository(self):
+        # Registered repository, or None if unset or unusable
+        repository = None
+        try:
+            repository = SQLiteRepository.from_env()
+            if repository is None:
+                return None
+            repository.check_ids()
+            # Restored and replayed state was never logged as events
+            repository.sync(self.user)
+        except (sqlite3.Error, ValueError) as e:
+            LoggerService.get_logger().error(
+                f"Not recording to SQLite database: {e}"
+            )
+            if repository is not None:
+                repository.close()
+            return None
+        LoggerService.add_event_sink(repository)
+        SQLiteRepository.set_instance(repository)
+        return repository
+
+    def _checkpoint_journal(self, snapshot):
+        # Drop the journal records a written snapshot includes
+        if self.journal is not None:
+            self.journal.checkpoint(snapshot.state["journal_seq"])
+
+    def _close_journal(self):
+        if self.journal is not None:
+            LoggerService.remove_event_sink(self.journal)
+            self.journal.close()
+            self.journal = None
+
+    def _journal_seq(self):
+        # Without a journal (e.g. it failed to open) snapshots keep the seq
+        # that was loaded and replayed, so those records are not re-applied
+        if self.journal is not None:
+            return self.journal.last_seq
+        return self.journal_seq
+
+    def _start_autosave(self):
+        interval = float(os.getenv("SNAPSHOT_AUTOSAVE_SECONDS", "0"))
+        if interval <= 0:
+            return
+
+        # State is captured on the GUI thread by the timer, then compressed
+        # and written on the autosaver's background thread
+        self.autosaver = Autosaver(
+            self.snapshot_path,
+            lambda: capture_snapshot(
+                self.user_controller.user,
+                self.company_service,
+                self._journal_seq(),
+            ),
+            on_saved=self._checkpoint_journal,
+        )
+        self.autosave_timer = QTimer(self.main_window)
+        self.autosave_timer.setInterval(int(interval * 1000))
+        self.autosave_timer.timeout.connect(self.autosaver.save_async)
+        self.autosave_timer.start()
+
+    def _start_analytics(self):
+        self.analytics_timer = None
+        self._record_lean_distribution()
+        interval = float(os.getenv("ANALYTICS_LEAN_INTERVAL_SECONDS", "60"))
+        if interval <= 0:
+            return
+
+        self.analytics_timer = QTimer(self.main_window)
+        self.analytics_timer.setInterval(int(interval * 1000))
+        self.analytics_timer.timeout.connect(self._record_lean_distribution)
+        self.analytics_timer.start()
+
+    def _record_lean_distribution(self):
+        self.analytics.write_lean_distribution(
+            self.user_controller.user._followers
+        )
+
+    def _close_analytics(self):
+        # Write the final lean distribution and every post's engagement,
+        # then close the files so Parquet footers are written
+        if self.analytics is None:
+            return
+        if self.analytics_timer is not None:
+            self.analytics_timer.stop()
+        self._record_lean_distribution()
+        self.analytics.write_posts(self.user_controller.user._posts)
+        LoggerService.remove_event_sink(self.analytics)
+        self.analytics.close()
+        self.analytics = None
+
+    def save_snapshot(self, path=None):
+        # Save the whole simulation to path (default SNAPSHOT_PATH).
+        # Returns the path written, or None if there is nowhere to save
+        path = path or self.snapshot_path
+        if not path:
+            return None
+        # Let a background autosave finish so it cannot overwrite this one
+        if self.autosaver is not None:
+            self.autosaver.wait()
+        snapshot = save_snapshot(
+            path,
+            self.user_controller.user,
+            self.company_service,
+            self._journal_seq(),
+        )
+        self._checkpoint_journal(snapshot)
+        return path
+
+    def _save_on_exit(self):
+        if self.autosaver is not None:
+            self.autosave_timer.stop()
+            self.autosaver.shutdown()
+            self.autosaver = None
+        self.save_snapshot()
+
     def _generate_initial_followers(self, count=10):
         # Create a batch of followers with balanced distribution
         followers = self.follower_controller.create_followers_batch(count)
@@ -1,24 +1,18 @@
 import random
+from concurrent.futures import Future
 
 from src.models.post import Comment, Sentiment
 from src.services.logger_service import LoggerService
 from src.services.sentiment_service import SentimentService
 
-try:
-    from google import genai
-    from google.api_core import exceptions as google_exceptions
-
-    GOOGLE_AI_AVAILABLE = True
-except ImportError:
-    GOOGLE_AI_AVAILABLE = False
-
-
 class PostController:
     # Controller for Post model operations
 
-    def __init__(self):
+    def __init__(self, sentiment_service=None):
         self.logger = LoggerService.get_logger()
-        self.sentiment_service = SentimentService()
+        self.sentiment_service = (
+            sentiment_service or SentimentService.get_instance()
+        )
 
     def like_post(self, post):
         # Like a post
@@ -168,26 +162,52 @@ class PostController:
                 sentiment_float = 0.0  # Default to neutral
 
             # Convert the result to a Sentiment enum
-            if sentiment_float <= -0.1:
-                self.logger.info(
-                    f"Content classified as LEFT-leaning with score {sentiment_float}"
-                )
-                return Sentiment.LEFT
-            elif sentiment_float >= 0.1:
-                self.logger.info(
-                    f"Content classified as RIGHT-leaning with score {sentiment_float}"
-                )
-                return Sentiment.RIGHT
-            else:
-                self.logger.info(
-                    f"Content classified as NEUTRAL with score {sentiment_float}"
-                )
-                return Sentiment.NEUTRAL
+            return self._sentiment_from_score(sentiment_float)
         except Exception as e:
             # Log the error and default to neutral
             self.logger.error(f"Error analyzing sentiment: {e}")
             return Sentiment.NEUTRAL
 
+    def analyze_sentiment_async(self, content):
+        # Start analysing content in the background and return a Future that
+        # resolves to a Sentiment. Cancel the Future if the result is no
+        # longer needed
+        cached = self.get_cached_sentiment(content)
+        if cached is not None:
+            future = Future()
+            future.set_result(cached)
+            return future
+
+        return self.sentiment_service.executor.submit(
+            self.analyze_sentiment, content
+        )
+
+    def get_cached_sentiment(self, content):
+        # Return the sentiment for already analysed content without calling
+        # the model, or None if the content has not been analysed yet
+        score = self.sentiment_service.get_cached_sentiment(content)
+        if score is None:
+            return None
+        return self._sentiment_from_score(score)
+
+    def _sentiment_from_score(self, sentiment_float):
+        # Map a -1.0..1.0 score onto a Sentiment enum
+        if sentiment_float <= -0.1:
+            self.logger.info(
+                f"Content classified as LEFT-leaning with score {sentiment_float}"
+            )
+            return Sentiment.LEFT
+        elif sentiment_float >= 0.1:
+            self.logger.info(
+                f"Content classified as RIGHT-leaning with score {sentiment_float}"
+            )
+            return Sentiment.RIGHT
+        else:
+            self.logger.info(
+                f"Content classified as NEUTRAL with score {sentiment_float}"
+            )
+            return Sentiment.NEUTRAL
+
     def initial_impressions(self, post):
         # Analyze initial impressions of a post based on its sentiment
         try:
@@ -312,7 +332,7 @@ class PostController:
         return {
             "likes": post.likes,
             "shares": post.shares,
-            "comments": len(post.comments),
+            "comments": post.comment_count,
             "sentiment": post.sentiment.name,
         }
 
@@ -350,7 +370,7 @@ class PostController:
 
         # Calculate engagement score (likes + shares + comments)
         def engagement_score(post):
-            return post.likes + post.shares + len(post.comments)
+            return post.likes + post.shares + post.comment_count
 
         # Sort posts by engagement score
         sorted_posts = sorted(posts, key=engagement_score, reverse=True)
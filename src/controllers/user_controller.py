@@ -1,7 +1,6 @@
+import logging
 from datetime import datetime
 
-from PyQt6.QtWidgets import QMessageBox
-
 from src.controllers.follower_controller import FollowerController
 from src.controllers.post_controller import PostController
 from src.models.post import Comment, Sentiment
@@ -22,11 +21,11 @@ from src.services.logger_service import LoggerService
 class UserController:
     # Controller for User model operations
 
-    def __init__(self, user=None):
+    def __init__(self, user=None, post_controller=None):
         self.user = user or User("default_user", "Default bio")
         self.logger = LoggerService.get_logger()
         self.follower_controller = FollowerController()
-        self.post_controller = PostController()
+        self.post_controller = post_controller or PostController()
 
         # Initialize the dispatcher and add interceptors
         self.dispatcher = Dispatcher()
@@ -60,12 +59,25 @@ class UserController:
         # Store reference to dispatcher in post for warning collection
         post._dispatcher = self.dispatcher
 
-        # Process the post through the interceptor chain
-        self.dispatcher.process_post(post)
+        # Sentiment only depends on the content, so score it speculatively
+        # while the interceptor chain runs
+        speculative_sentiment = self.post_controller.analyze_sentiment_async(
+            content
+        )
+
+        # Process the post through the interceptor chain, dropping the
+        # speculative analysis if an interceptor fails
+        try:
+            self.dispatcher.process_post(post)
+        except Exception:
+            speculative_sentiment.cancel()
+            raise
 
         # Check if there are any warnings
         warnings = self.dispatcher.get_warnings()
         if warnings and parent_widget:
+            from PyQt6.QtWidgets import QMessageBox
+
             # Display warnings to the user
             warning_text = "\n\n".join(warnings)
 
@@ -89,6 +101,7 @@ class UserController:
                 self.logger.info(
                     "User cancelled post creation after seeing warnings"
                 )
+                speculative_sentiment.cancel()
                 return None
 
             # User clicked OK, proceed with post creation despite warnings
@@ -98,9 +111,10 @@ class UserController:
 
         # Only proceed if the post is valid after interceptor processing
         if not hasattr(post, "is_valid") or post.is_valid:
-            # Analyze sentiment and set it on the post
-            sentiment = self.post_controller.analyze_sentiment(content)
-            post.sentiment = sentiment
+            # Wait for the speculative analysis and set it on the post
+            post.sentiment = self._resolve_sentiment(
+                speculative_sentiment, content
+            )
 
             # Add the post to the user's posts
             self.user._posts.append(post)
@@ -108,9 +122,17 @@ class UserController:
             # Emit the post_created signal
             self.user.post_created.emit(post)
 
-            # Log the post creation
-            self.logger.info(
-                f"User {self.user.handle} created a post: {content[:30]}..."
+            # Record the post creation
+            LoggerService.log_event(
+                "post.created",
+                logging.INFO,
+                post_id=post.post_id,
+                user=self.user.handle,
+                sentiment=post.sentiment,
+                has_image=bool(image_path),
+                image_path=image_path,
+                is_spam=post.is_spam,
+                content=content,
             )
 
             # Generate new followers based on the post
@@ -136,8 +158,20 @@ class UserController:
         else:
             # Post was invalid, log the reason and return None
             self.logger.warning("Post creation failed: Post validation failed")
+            speculative_sentiment.cancel()
             return None
 
+    def _resolve_sentiment(self, future, content):
+        # Result of a speculative analysis, analysing synchronously if the
+        # background task was cancelled or failed
+        try:
+            return future.result()
+        except Exception as e:
+            self.logger.warning(
+                f"Speculative sentiment analysis failed: {str(e)}"
+            )
+            return self.post_controller.analyze_sentiment(content)
+
     def add_follower(self, follower, post=None):
         """Add a follower to the user."""
         if follower not in self.user._followers:
@@ -152,9 +186,17 @@ class UserController:
             if post:
                 follower.interact_with_post(post)
 
-            # Log the follower addition
-            self.logger.info(
-                f"User {self.user.handle} gained a follower: {follower.handle}"
+            # Record the follower addition
+            LoggerService.log_event(
+                "follower.added",
+                logging.INFO,
+                user=self.user.handle,
+                follower_id=follower.follower_id,
+                handle=follower.handle,
+                sentiment=follower.sentiment,
+                political_lean=follower.political_lean,
+                post_id=post.post_id if post else None,
+                follower_count=self.user._follower_count,
             )
 
             # Check if the user has reached the verification threshold
@@ -172,8 +214,13 @@ class UserController:
 
                 # Log the verification
                 self.logger.info(f"User {self.user.handle} is now verified!")
+                LoggerService.log_event(
+                    "user.verified", logging.INFO, user=self.user.handle
+                )
 
                 # Show verification popup
+                from PyQt6.QtWidgets import QMessageBox
+
                 msg_box = QMessageBox()
                 msg_box.setIcon(QMessageBox.Icon.Information)
                 msg_box.setWindowTitle("Account Verified!")
@@ -210,18 +257,34 @@ class UserController:
             # Detach follower as observer
             self.user.detach(follower)
 
-            # Log the follower removal
-            self.logger.info(
-                f"User {self.user.handle} lost a follower: {follower.handle}"
+            # Record the follower removal
+            LoggerService.log_event(
+                "follower.removed",
+                logging.INFO,
+                user=self.user.handle,
+                follower_id=follower.follower_id,
+                handle=follower.handle,
+                political_lean=follower.political_lean,
+                follower_count=self.user._follower_count,
             )
 
+    def potential_follower_count(self):
+        # Default to a number based on current follower count
+        base_count = 5
+        follower_bonus = min(15, self.user._follower_count // 10)
+        return base_count + follower_bonus
+
+    def estimate_post_impact(self, sentiment):
+        # Expected (gained, lost) followers if a post with this sentiment
+        # were published now
+        return self.follower_controller.estimate_follower_impact(
+            self.user, sentiment, self.potential_follower_count()
+        )
+
     def generate_new_followers(self, post, count=None):
         # Generate new followers based on a post
         if count is None:
-            # Default to a number based on current follower count
-            base_count = 5
-            follower_bonus = min(15, self.user._follower_count // 10)
-            count = base_count + follower_bonus
+            count = self.potential_follower_count()
 
         # Calculate follow chance based on post sentiment
         follow_chance = self.follower_controller.calculate_follow_chance(
@@ -257,6 +320,7 @@ class UserController:
             self.user.reputation_changed.emit(
                 self.user._recent_follower_losses
             )
+            self._log_reputation()
 
             self.logger.warning(
                 "Lost %d followers. Total recent losses: %d",
@@ -308,6 +372,15 @@ class UserController:
                     self.user._recent_follower_losses,
                 )
             self.user._last_reputation_check = current_time
+            self._log_reputation()
+
+    def _log_reputation(self):
+        # Record the reputation state (replayed by services/journal)
+        LoggerService.log_event(
+            "user.reputation_changed",
+            recent_follower_losses=self.user._recent_follower_losses,
+            last_reputation_check=self.user._last_reputation_check,
+        )
 
     def edit_post(self, post, new_content=None, new_image_path=None):
         # Edit a post
@@ -316,6 +389,13 @@ class UserController:
                 post.content = new_content
             if new_image_path:
                 post.image_path = new_image_path
+            LoggerService.log_event(
+                "post.edited",
+                logging.INFO,
+                post_id=post.post_id,
+                content=post.content,
+                image_path=post.image_path,
+            )
 
             self.logger.info(
                 f"User {self.user.handle} edited a post: {post.content[:30]}..."
@@ -325,6 +405,9 @@ class UserController:
         # Delete a post
         if post in self.user._posts:
             self.user._posts.remove(post)
+            LoggerService.log_event(
+                "post.deleted", logging.INFO, post_id=post.post_id
+            )
             self.logger.info(
                 f"User {self.user.handle} deleted a post: {post.content[:30]}..."
             )
@@ -337,6 +420,13 @@ class UserController:
             self.user.bio = bio
         if profile_picture_path:
             self.user.profile_picture_path = profile_picture_path
+        LoggerService.log_event(
+            "user.profile_updated",
+            logging.INFO,
+            handle=handle,
+            bio=bio,
+            profile_picture_path=profile_picture_path,
+        )
 
         self.logger.info(
             f"User profile updated: handle={self.user.handle}, bio={self.user.bio[:30]}..."
@@ -369,3 +459,17 @@ class UserController:
             )
 
         return unfollowed_count
+
+    def notify_follower_store(self, store, post):
+        # notify_followers for a population kept in a FollowerStore, in
+        # chunks rather than one Follower at a time
+        unfollowed_count = self.follower_controller.update_store(store, post)
+        if unfollowed_count > 0:
+            self.user._follower_count = max(
+                0, self.user._follower_count - unfollowed_count
+            )
+            self.logger.info(
+                f"{unfollowed_count} stored followers unfollowed due to post"
+            )
+
+        return unfollowed_count
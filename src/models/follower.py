@@ -1,3 +1,4 @@
+import itertools
 from random import randint
 
 from PyQt6.QtCore import QObject, pyqtSignal
@@ -29,8 +30,38 @@ class Follower(QObject):
         "NEUTRAL": ["moderate_", "centrist_", "balanced_", "neutral_"],
     }
 
+    # Comments by how much the follower agrees with a post, shared by all
+    # followers
+    _positive_comments = [
+        "Couldn't agree more!",
+        "This is exactly what I've been saying!",
+        "Great point!",
+        "Thanks for sharing this important message!",
+        "Absolutely spot on!",
+    ]
+
+    _neutral_comments = [
+        "Interesting perspective.",
+        "Something to think about.",
+        "I see your point.",
+        "Worth considering.",
+        "Thanks for sharing.",
+    ]
+
+    _negative_comments = [
+        "I respectfully disagree.",
+        "Not sure I can agree with this.",
+        "You might want to reconsider this.",
+        "I see it differently.",
+        "Let's agree to disagree.",
+    ]
+
+    # Source of process-unique follower ids
+    _ids = itertools.count(1)
+
     def __init__(self, sentiment: Sentiment, handle: str):
         super().__init__()
+        self._follower_id = next(Follower._ids)
         self._handle = handle
         self.logger = LoggerService.get_logger()
 
@@ -43,36 +74,45 @@ class Follower(QObject):
             self._political_lean = randint(40, 60)  # Neutral: 40-60
 
         self._sentiment = sentiment
-        self.command_history = CommandHistory()
-
-        self._positive_comments = [
-            "Couldn't agree more!",
-            "This is exactly what I've been saying!",
-            "Great point!",
-            "Thanks for sharing this important message!",
-            "Absolutely spot on!",
-        ]
-
-        self._neutral_comments = [
-            "Interesting perspective.",
-            "Something to think about.",
-            "I see your point.",
-            "Worth considering.",
-            "Thanks for sharing.",
-        ]
-
-        self._negative_comments = [
-            "I respectfully disagree.",
-            "Not sure I can agree with this.",
-            "You might want to reconsider this.",
-            "I see it differently.",
-            "Let's agree to disagree.",
-        ]
-
-        self.logger.debug(
-            f"Follower created: {handle} with {sentiment.name} sentiment and political lean {self._political_lean}"
+        self._command_history = None
+
+        LoggerService.log_event(
+            "follower.created",
+            follower_id=self._follower_id,
+            handle=handle,
+            sentiment=sentiment,
+            political_lean=self._political_lean,
         )
 
+    @classmethod
+    def _restore_batch(cls, follower_ids, handles, sentiments, leans):
+        # Recreate saved followers (used by services/snapshot_service).
+        # Skips the constructor so no new ids or leans are drawn and
+        # nothing is logged, and sets the fields directly, as this runs
+        # once per follower when loading a large world
+        new = cls.__new__
+        init = QObject.__init__
+        logger = LoggerService.get_logger()
+        followers = []
+        for follower_id, handle, sentiment, lean in zip(
+            follower_ids, handles, sentiments, leans
+        ):
+            follower = new(cls)
+            init(follower)
+            fields = follower.__dict__
+            fields["_follower_id"] = follower_id
+            fields["_handle"] = handle
+            fields["_sentiment"] = sentiment
+            fields["_political_lean"] = lean
+            fields["_command_history"] = None
+            fields["logger"] = logger
+            followers.append(follower)
+        return followers
+
+    @property
+    def follower_id(self):
+        return self._follower_id
+
     @property
     def handle(self):
         return self._handle
@@ -89,6 +129,13 @@ class Follower(QObject):
     def political_lean(self, value):
         self._political_lean = max(0, min(100, value))
 
+    @property
+    def command_history(self):
+        # Created on first use, as most followers never record a command
+        if self._command_history is None:
+            self._command_history = CommandHistory()
+        return self._command_history
+
     @classmethod
     def create_with_random_handle(cls, sentiment: Sentiment):
         # Generate a follower with a sentiment-based random handle
@@ -132,11 +179,15 @@ class Follower(QObject):
             # For neutral posts, alignment is based on how moderate the follower is
             alignment = 100 - abs(50 - self.political_lean) * 2
 
-        author_info = (
-            f"by {post.author.handle}" if post.author else "(no author)"
-        )
-        self.logger.info(
-            f"Follower {self.handle} (political lean: {self.political_lean}) has {alignment}% alignment with {post.sentiment.name} post {author_info}"
+        LoggerService.log_event(
+            "follower.alignment",
+            follower_id=self._follower_id,
+            post_id=post.post_id,
+            handle=self.handle,
+            political_lean=self.political_lean,
+            alignment=alignment,
+            sentiment=post.sentiment,
+            author=post.author.handle if post.author else None,
         )
 
         # Emit signal for interaction
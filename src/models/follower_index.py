@@ -0,0 +1,49 @@
+from bisect import bisect_left
+
+
+class FollowerHandleIndex:
+    # Followers sorted by lower-cased handle, so every follower whose handle
+    # starts with a prefix sits in one contiguous run that two binary
+    # searches can find without scanning
+
+    # Sorts after every character that can appear in a handle
+    _PREFIX_END = "\U0010ffff"
+
+    def __init__(self, followers=()):
+        followers = list(followers)
+        keys = [self._key(follower) for follower in followers]
+        order = sorted(range(len(followers)), key=keys.__getitem__)
+        self._keys = [keys[i] for i in order]
+        self._followers = [followers[i] for i in order]
+
+    def __len__(self):
+        return len(self._followers)
+
+    @staticmethod
+    def _key(follower):
+        return follower.handle.lower()
+
+    @staticmethod
+    def _normalize(prefix):
+        # Handles are shown as "@handle", so accept a typed "@"
+        return prefix.strip().lstrip("@").lower()
+
+    def follower_at(self, position):
+        # Follower at a position in handle order
+        return self._followers[position]
+
+    def prefix_range(self, prefix):
+        # Half-open range of positions whose handle starts with prefix
+        prefix = self._normalize(prefix)
+        if not prefix:
+            return 0, len(self._keys)
+        start = bisect_left(self._keys, prefix)
+        stop = bisect_left(self._keys, prefix + self._PREFIX_END, lo=start)
+        return start, stop
+
+    def search(self, prefix, limit=None):
+        # Followers whose handle starts with prefix, in handle order
+        start, stop = self.prefix_range(prefix)
+        if limit is not None:
+            stop = min(stop, start + limit)
+        return self._followers[start:stop]
@@ -0,0 +1,297 @@
+import json
+import os
+
+from src.models.follower import Follower
+from src.models.post import SENTIMENT_CODES, SENTIMENTS, Sentiment
+
+STORE_FORMAT = "social-media-simulator-followers"
+STORE_VERSION = 1
+
+META_NAME = "meta.json"
+HANDLES_NAME = "handles.bin"
+
+# One file per column, little-endian so a store can be copied between
+# machines. Handles are UTF-8 in handles.bin, at handle_start with
+# handle_length bytes
+COLUMNS = {
+    "follower_id": "<i8",
+    "political_lean": "u1",
+    "sentiment": "u1",
+    "activity": "<u4",
+    "handle_start": "<i8",
+    "handle_length": "<u2",
+}
+
+DEFAULT_CAPACITY = 1024
+DEFAULT_CHUNK_SIZE = 65536
+
+
+def import_numpy():
+    # numpy is optional: imported on first use by the store and by code
+    # that works on its columns
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError("FollowerStore requires the 'numpy' package") from e
+    return numpy
+
+
+class FollowerStore:
+    # Follower population kept column by column in numpy.memmap files, for
+    # worlds too large for a Follower object per follower.
+    #
+    # Only the pages being touched need to be resident; the OS page cache
+    # decides the rest. Passes over the population go chunk by chunk (see
+    # chunks and update). After flush the directory is a consistent,
+    # self-describing snapshot that other processes can open with
+    # readonly=True and map without copying
+
+    def __init__(self, directory, readonly=False, capacity=DEFAULT_CAPACITY):
+        # Open the store in directory, creating an empty one if there is
+        # none (unless readonly)
+        self._np = import_numpy()
+        self.directory = directory
+        self.readonly = readonly
+
+        meta_path = os.path.join(directory, META_NAME)
+        if os.path.exists(meta_path):
+            with open(meta_path, encoding="utf-8") as file:
+                meta = json.load(file)
+            if meta.get("format") != STORE_FORMAT:
+                raise ValueError(f"{directory} is not a follower store")
+            if meta.get("version", 0) > STORE_VERSION:
+                raise ValueError(
+                    f"Follower store version {meta.get('version')} is newer "
+                    f"than supported version {STORE_VERSION}"
+                )
+            self._count = meta["count"]
+            self._capacity = meta["capacity"]
+            self._handle_bytes = meta["handle_bytes"]
+            self._handle_capacity = meta["handle_capacity"]
+        elif readonly:
+            raise FileNotFoundError(meta_path)
+        else:
+            os.makedirs(directory, exist_ok=True)
+            self._count = 0
+            self._capacity = max(1, capacity)
+            self._handle_bytes = 0
+            self._handle_capacity = self._capacity * 16
+            for name, dtype in COLUMNS.items():
+                self._resize_file(
+                    self._path(name),
+                    self._capacity * self._np.dtype(dtype).itemsize,
+                )
+            self._resize_file(
+                os.path.join(directory, HANDLES_NAME), self._handle_capacity
+            )
+            self._write_meta()
+
+        self._columns = {
+            name: self._map(self._path(name), dtype, self._capacity)
+            for name, dtype in COLUMNS.items()
+        }
+        self._handles = self._map(
+            os.path.join(directory, HANDLES_NAME), "u1", self._handle_capacity
+        )
+
+    def __len__(self):
+        return self._count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _path(self, name):
+        return os.path.join(self.directory, f"{name}.bin")
+
+    def _map(self, path, dtype, length):
+        return self._np.memmap(
+            path,
+            dtype=dtype,
+            mode="r" if self.readonly else "r+",
+            shape=(length,),
+        )
+
+    @staticmethod
+    def _resize_file(path, size):
+        with open(path, "ab") as file:
+            file.truncate(size)
+
+    def _write_meta(self):
+        meta = {
+            "format": STORE_FORMAT,
+            "version": STORE_VERSION,
+            "count": self._count,
+            "capacity": self._capacity,
+            "handle_bytes": self._handle_bytes,
+            "handle_capacity": self._handle_capacity,
+            "columns": COLUMNS,
+        }
+        path = os.path.join(self.directory, META_NAME)
+        temp_path = path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(meta, file)
+        os.replace(temp_path, path)
+
+    def _check_writable(self):
+        if self.readonly:
+            raise ValueError("Follower store is open read-only")
+
+    def _reserve(self, rows, handle_bytes):
+        # Grow the column and handle files, doubling, to fit the new data
+        if self._count + rows > self._capacity:
+            self._capacity = max(self._capacity * 2, self._count + rows)
+            for name, dtype in COLUMNS.items():
+                self._columns[name].flush()
+                self._resize_file(
+                    self._path(name),
+                    self._capacity * self._np.dtype(dtype).itemsize,
+                )
+                self._columns[name] = self._map(
+                    self._path(name), dtype, self._capacity
+                )
+
+        if self._handle_bytes + handle_bytes > self._handle_capacity:
+            self._handle_capacity = max(
+                self._handle_capacity * 2, self._handle_bytes + handle_bytes
+            )
+            path = os.path.join(self.directory, HANDLES_NAME)
+            self._handles.flush()
+            self._resize_file(path, self._handle_capacity)
+            self._handles = self._map(path, "u1", self._handle_capacity)
+
+    def column(self, name):
+        # The live rows of a column, as a memory-mapped view
+        return self._columns[name][: self._count]
+
+    def handle(self, index):
+        start = int(self._columns["handle_start"][index])
+        length = int(self._columns["handle_length"][index])
+        return bytes(self._handles[start : start + length]).decode("utf-8")
+
+    def handles(self, start=0, stop=None):
+        stop = self._count if stop is None else min(stop, self._count)
+        return [self.handle(index) for index in range(start, stop)]
+
+    def append_columns(
+        self, follower_ids, political_leans, sentiments, handles
+    ):
+        # Append followers given column by column. sentiments may be
+        # Sentiment members or their codes in SENTIMENTS
+        self._check_writable()
+        np = self._np
+        follower_ids = np.asarray(follower_ids, dtype=COLUMNS["follower_id"])
+        rows = len(follower_ids)
+        if not rows:
+            return
+
+        encoded = [handle.encode("utf-8") for handle in handles]
+        lengths = np.fromiter(
+            (len(handle) for handle in encoded), dtype="<i8", count=rows
+        )
+        data = b"".join(encoded)
+        self._reserve(rows, len(data))
+
+        start, stop = self._count, self._count + rows
+        columns = self._columns
+        columns["follower_id"][start:stop] = follower_ids
+        columns["political_lean"][start:stop] = political_leans
+        columns["sentiment"][start:stop] = [
+            SENTIMENT_CODES[id(sentiment)]
+            if isinstance(sentiment, Sentiment)
+            else sentiment
+            for sentiment in sentiments
+        ]
+        columns["activity"][start:stop] = 0
+        columns["handle_length"][start:stop] = lengths
+        offsets = np.cumsum(lengths) - lengths
+        columns["handle_start"][start:stop] = offsets + self._handle_bytes
+
+        self._handles[
+            self._handle_bytes : self._handle_bytes + len(data)
+        ] = np.frombuffer(data, dtype="u1")
+        self._handle_bytes += len(data)
+        self._count = stop
+
+    def append_followers(self, followers):
+        # Append Follower objects, e.g. to move an existing population
+        # out of memory
+        followers = list(followers)
+        self.append_columns(
+            [follower.follower_id for follower in followers],
+            [follower.political_lean for follower in followers],
+            [follower.sentiment for follower in followers],
+            [follower.handle for follower in followers],
+        )
+
+    def followers(self, start=0, stop=None):
+        # Follower objects for rows [start, stop), for the views and
+        # anything else that needs the full model
+        stop = self._count if stop is None else min(stop, self._count)
+        codes = self._columns["sentiment"][start:stop].tolist()
+        return Follower._restore_batch(
+            self._columns["follower_id"][start:stop].tolist(),
+            self.handles(start, stop),
+            [SENTIMENTS[code] for code in codes],
+            self._columns["political_lean"][start:stop].tolist(),
+        )
+
+    def chunks(self, chunk_size=DEFAULT_CHUNK_SIZE):
+        # Yield (start, columns) for consecutive row ranges, where columns
+        # maps each column name to a memory-mapped view of the range
+        for start in range(0, self._count, chunk_size):
+            stop = min(start + chunk_size, self._count)
+            yield start, {
+                name: column[start:stop]
+                for name, column in self._columns.items()
+            }
+
+    def update(self, function, chunk_size=DEFAULT_CHUNK_SIZE):
+        # Run function(columns) over every chunk. It may change the views in
+        # place and returns a boolean mask of the rows to keep, or None to
+        # keep them all. Dropped rows are compacted away in the same pass;
+        # returns how many were dropped
+        self._check_writable()
+        write = 0
+        for start, columns in self.chunks(chunk_size):
+            keep = function(columns)
+            if keep is None:
+                kept = len(columns["follower_id"])
+                if write != start:
+                    for name, view in columns.items():
+                        self._columns[name][write : write + kept] = view
+            else:
+                kept = int(keep.sum())
+                for name, view in columns.items():
+                    self._columns[name][write : write + kept] = view[keep]
+            write += kept
+
+        removed = self._count - write
+        self._count = write
+        return removed
+
+    def lean_counts(self, chunk_size=DEFAULT_CHUNK_SIZE):
+        # Number of followers at each political lean, 0 to 100
+        counts = self._np.zeros(101, dtype="<i8")
+        for _, columns in self.chunks(chunk_size):
+            counts += self._np.bincount(
+                columns["political_lean"], minlength=101
+            )[:101]
+        return counts
+
+    def flush(self):
+        # Write changes and the row count to disk, leaving the directory a
+        # consistent snapshot
+        if self.readonly:
+            return
+        for column in self._columns.values():
+            column.flush()
+        self._handles.flush()
+        self._write_meta()
+
+    def close(self):
+        self.flush()
+        self._columns = {}
+        self._handles = None
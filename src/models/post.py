@@ -1,3 +1,4 @@
+import itertools
 from datetime import datetime
 from enum import Enum
 from typing import TYPE_CHECKING
@@ -9,14 +10,6 @@ from src.services.logger_service import LoggerService
 if TYPE_CHECKING:
     pass
 
-try:
-    from google import genai
-    from google.api_core import exceptions as google_exceptions
-
-    GOOGLE_AI_AVAILABLE = True
-except ImportError:
-    GOOGLE_AI_AVAILABLE = False
-
 
 class Sentiment(Enum):
     LEFT = "left"
@@ -24,6 +17,17 @@ class Sentiment(Enum):
     NEUTRAL = "neutral"
 
 
+# Sentiments stored as integer codes (snapshots, follower stores) use
+# their index in this tuple
+SENTIMENTS = tuple(Sentiment)
+
+# Codes looked up by id(sentiment): members are singletons, and hashing an
+# Enum runs in Python, which adds up over a million followers
+SENTIMENT_CODES = {
+    id(sentiment): code for code, sentiment in enumerate(SENTIMENTS)
+}
+
+
 class Comment(QObject):
     # Comment model representing a comment on a post
 
@@ -34,6 +38,17 @@ class Comment(QObject):
         self._author = author
         self._timestamp = datetime.now()
 
+    @classmethod
+    def _restore(cls, content, sentiment, author, timestamp):
+        # Recreate a saved comment with its original timestamp
+        comment = cls.__new__(cls)
+        QObject.__init__(comment)
+        comment._content = content
+        comment._sentiment = sentiment
+        comment._author = author
+        comment._timestamp = timestamp
+        return comment
+
     @property
     def content(self):
         return self._content
@@ -71,9 +86,13 @@ class Post(QObject):
     followers_gained_changed = pyqtSignal(int)
     followers_lost_changed = pyqtSignal(int)
 
+    # Source of process-unique post ids
+    _ids = itertools.count(1)
+
     def __init__(self, content, author=None, image_path=None):
         # Initialize a post with content, author, and optional image
         super().__init__()
+        self._post_id = next(Post._ids)
         self._content = content
         self._author = author
         self._image_path = image_path
@@ -88,12 +107,14 @@ class Post(QObject):
         self._is_valid = True  # Default is valid
         self.logger = LoggerService.get_logger()
 
-        self.logger.debug(
-            f"Post initialized with content: {content[:50]}..."
-            if len(content) > 50
-            else content
+        LoggerService.log_event(
+            "post.initialized", post_id=self._post_id, content=content
         )
 
+    @property
+    def post_id(self):
+        return self._post_id
+
     @property
     def content(self):
         return self._content
@@ -134,6 +155,15 @@ class Post(QObject):
     def comments(self):
         return self._comments.copy()
 
+    @property
+    def comment_count(self):
+        # Number of comments without copying the list
+        return len(self._comments)
+
+    def comments_page(self, start, count):
+        # Up to count comments from position start, oldest first
+        return self._comments[start : start + count]
+
     @property
     def sentiment(self):
         return self._sentiment
@@ -148,6 +178,11 @@ class Post(QObject):
         if old_sentiment != value:
             self.sentiment_changed.emit(value)
             self.logger.info(f"Post sentiment set to: {value.name}")
+            LoggerService.log_event(
+                "post.sentiment_changed",
+                post_id=self._post_id,
+                sentiment=value,
+            )
 
     @property
     def followers_gained(self):
@@ -177,56 +212,118 @@ class Post(QObject):
         # Mark the post as valid or not
         self._is_valid = value
 
-    def _increment_likes(self):
+    def _increment_likes(self, count=1):
         # Increment the like count (called by PostController)
-        self._likes += 1
+        self._likes += count
         self.likes_changed.emit(self._likes)
+        self._log_engagement()
 
     def _decrement_likes(self):
         # Decrement the like count (called by PostController)
         if self._likes > 0:
             self._likes -= 1
             self.likes_changed.emit(self._likes)
+            self._log_engagement()
 
-    def _increment_shares(self):
+    def _increment_shares(self, count=1):
         # Increment the share count (called by PostController)
-        self._shares += 1
+        self._shares += count
         self.shares_changed.emit(self._shares)
+        self._log_engagement()
 
     def _decrement_shares(self):
         # Decrement the share count (called by PostController)
         if self._shares > 0:
             self._shares -= 1
             self.shares_changed.emit(self._shares)
+            self._log_engagement()
+
+    def _log_engagement(self):
+        # Record the new counters (replayed by services/journal)
+        LoggerService.log_event(
+            "post.engagement_changed",
+            post_id=self._post_id,
+            likes=self._likes,
+            shares=self._shares,
+        )
 
     def _add_comment(self, comment):
         # Add a comment to the post (called by PostController)
         self._comments.append(comment)
+        # Recorded before the signal, so views reading comments from the
+        # SQLite repository see the new one
+        author = comment.author
+        LoggerService.log_event(
+            "post.comment_added",
+            post_id=self._post_id,
+            content=comment.content,
+            sentiment=comment.sentiment,
+            # Follower handles are kept; other authors mean the user
+            author=author if isinstance(author, str) else None,
+            timestamp=comment.timestamp,
+        )
         self.comments_changed.emit(self._comments.copy())
 
     def _remove_comment(self, comment):
         # Remove a comment from the post (called by PostController)
         if comment in self._comments:
             self._comments.remove(comment)
+            author = comment.author
+            LoggerService.log_event(
+                "post.comment_removed",
+                post_id=self._post_id,
+                content=comment.content,
+                author=author if isinstance(author, str) else None,
+                timestamp=comment.timestamp,
+            )
             self.comments_changed.emit(self._comments.copy())
 
-    def _add_follower_lost(self):
-        # Track a follower lost due to this post
-        self._followers_lost += 1
+    def _add_follower_lost(self, count=1):
+        # Track followers lost due to this post
+        self._followers_lost += count
         self.followers_lost_changed.emit(self._followers_lost)
-        self.logger.debug(
-            f"Follower lost. Total followers lost: {self._followers_lost}"
+        LoggerService.log_event(
+            "post.follower_lost",
+            post_id=self._post_id,
+            total=self._followers_lost,
         )
 
     def _add_follower_gained(self):
         # Track a follower gained due to this post
         self._followers_gained += 1
         self.followers_gained_changed.emit(self._followers_gained)
-        self.logger.debug(
-            f"Follower gained. Total followers gained: {self._followers_gained}"
+        LoggerService.log_event(
+            "post.follower_gained",
+            post_id=self._post_id,
+            total=self._followers_gained,
         )
 
     @classmethod
     def _create(cls, content: str):
         # Factory method used by builders
         return cls(content)
+
+    @classmethod
+    def _restore(
+        cls, post_id, content, author=None, image_path=None, **state
+    ):
+        # Recreate a saved post (used by services/snapshot_service) with
+        # its id, timestamp, counters and flags. state holds the remaining
+        # fields by name, e.g. likes=3, is_spam=False
+        post = cls.__new__(cls)
+        QObject.__init__(post)
+        post._post_id = post_id
+        post._content = content
+        post._author = author
+        post._image_path = image_path
+        post._likes = state.get("likes", 0)
+        post._shares = state.get("shares", 0)
+        post._comments = list(state.get("comments", ()))
+        post._timestamp = state.get("timestamp") or datetime.now()
+        post._sentiment = state.get("sentiment", Sentiment.NEUTRAL)
+        post._followers_gained = state.get("followers_gained", 0)
+        post._followers_lost = state.get("followers_lost", 0)
+        post._is_spam = state.get("is_spam", False)
+        post._is_valid = state.get("is_valid", True)
+        post.logger = LoggerService.get_logger()
+        return post
@@ -3,7 +3,14 @@ from src.patterns.interfaces.command import Command
 from src.services.logger_service import LoggerService
 
 
-class LikeCommand(Command):
+class _PostCommand(Command):
+    # Shared helpers for commands that act on a post
+
+    def _author_handle(self):
+        return self.post.author.handle if self.post.author else None
+
+
+class LikeCommand(_PostCommand):
     # Command for liking a post
 
     def __init__(self, post: Post, follower_handle: str):
@@ -12,31 +19,27 @@ class LikeCommand(Command):
         self.logger = LoggerService.get_logger()
 
     def execute(self) -> None:
-        # Increment post likes and log the action
+        # Increment post likes and record the event
         self.post._increment_likes()
-        author_info = (
-            f"@{self.post.author.handle}"
-            if self.post.author
-            else "(no author)"
-        )
-        self.logger.info(
-            f"Follower '{self.follower_handle}' liked post by {author_info}"
+        LoggerService.log_event(
+            "interaction.like",
+            follower=self.follower_handle,
+            post_id=self.post.post_id,
+            author=self._author_handle(),
         )
 
     def undo(self) -> None:
-        # Decrement post likes and log the undo action
+        # Decrement post likes and record the undo
         self.post._decrement_likes()
-        author_info = (
-            f"@{self.post.author.handle}"
-            if self.post.author
-            else "(no author)"
-        )
-        self.logger.info(
-            f"Undid: Follower '{self.follower_handle}' liked post by {author_info}"
+        LoggerService.log_event(
+            "interaction.like.undo",
+            follower=self.follower_handle,
+            post_id=self.post.post_id,
+            author=self._author_handle(),
         )
 
 
-class CommentCommand(Command):
+class CommentCommand(_PostCommand):
     # Command to add a comment to a post
 
     def __init__(self, post: Post, comment: Comment):
@@ -46,32 +49,29 @@ class CommentCommand(Command):
         self.logger = LoggerService.get_logger()
 
     def execute(self) -> None:
-        # Add comment to post and log the action
+        # Add comment to post and record the event
         self.post._add_comment(self.comment)
-        author_info = (
-            f"@{self.post.author.handle}"
-            if self.post.author
-            else "(no author)"
-        )
-        self.logger.info(
-            f"Follower '{self.comment.author}' commented on post by {author_info}"
+        LoggerService.log_event(
+            "interaction.comment",
+            follower=self.comment.author,
+            comment=self.comment.content,
+            post_id=self.post.post_id,
+            author=self._author_handle(),
         )
 
     def undo(self) -> None:
-        # Remove comment from post and log the undo action
+        # Remove comment from post and record the undo
         if self.comment in self.post.comments:
             self.post._remove_comment(self.comment)
-            author_info = (
-                f"@{self.post.author.handle}"
-                if self.post.author
-                else "(no author)"
-            )
-            self.logger.info(
-                f"Undid: Follower '{self.comment.author}' commented on post by {author_info}"
+            LoggerService.log_event(
+                "interaction.comment.undo",
+                follower=self.comment.author,
+                post_id=self.post.post_id,
+                author=self._author_handle(),
             )
 
 
-class ShareCommand(Command):
+class ShareCommand(_PostCommand):
     # Command for sharing a post
 
     def __init__(self, post: Post, follower_handle: str):
@@ -80,25 +80,21 @@ class ShareCommand(Command):
         self.logger = LoggerService.get_logger()
 
     def execute(self) -> None:
-        # Increment post shares and log the action
+        # Increment post shares and record the event
         self.post._increment_shares()
-        author_info = (
-            f"@{self.post.author.handle}"
-            if self.post.author
-            else "(no author)"
-        )
-        self.logger.info(
-            f"Follower '{self.follower_handle}' shared post by {author_info}"
+        LoggerService.log_event(
+            "interaction.share",
+            follower=self.follower_handle,
+            post_id=self.post.post_id,
+            author=self._author_handle(),
         )
 
     def undo(self) -> None:
-        # Decrement post shares and log the undo action
+        # Decrement post shares and record the undo
         self.post._decrement_shares()
-        author_info = (
-            f"@{self.post.author.handle}"
-            if self.post.author
-            else "(no author)"
-        )
-        self.logger.info(
-            f"Undid: Follower '{self.follower_handle}' shared post by {author_info}"
+        LoggerService.log_event(
+            "interaction.share.undo",
+            follower=self.follower_handle,
+            post_id=self.post.post_id,
+            author=self._author_handle(),
         )
@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+
+
+class EventSink(ABC):
+    # Receives every structured event recorded through
+    # LoggerService.log_event, independently of the log level
+
+    @abstractmethod
+    def write_event(self, event: str, fields: dict, timestamp: float) -> None:
+        pass
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.flush()
@@ -0,0 +1,32 @@
+from abc import ABC, abstractmethod
+
+
+class SentimentBackendError(Exception):
+    # Raised when a backend fails to produce a response
+    pass
+
+
+class SentimentBackendThrottled(SentimentBackendError):
+    # Raised when a backend rejects a request because of rate limiting
+
+    def __init__(self, message, retry_after=None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class SentimentBackend(ABC):
+    # Interface for the text generation model used by SentimentService
+
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        pass
+
+    @property
+    def available(self) -> bool:
+        return True
+
+    @abstractmethod
+    def generate(self, prompt: str) -> str:
+        # Return the raw text response for a prompt
+        pass
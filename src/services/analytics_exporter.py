@@ -0,0 +1,262 @@
+import csv
+import importlib.util
+import os
+import threading
+import time
+
+from src.patterns.interfaces.event_sink import EventSink
+
+FORMATS = ("parquet", "csv")
+DEFAULT_ROW_GROUP_SIZE = 10000
+
+# Exported tables and their (column, type) pairs. Types are pyarrow type
+# names; CSV files carry the same columns
+TABLES = {
+    "posts": (
+        ("post_id", "int64"),
+        ("author", "string"),
+        ("content", "string"),
+        ("sentiment", "string"),
+        ("created_at", "float64"),
+        ("likes", "int64"),
+        ("shares", "int64"),
+        ("comments", "int64"),
+        ("followers_gained", "int64"),
+        ("followers_lost", "int64"),
+        ("is_spam", "bool_"),
+    ),
+    "interactions": (
+        ("timestamp", "float64"),
+        ("kind", "string"),
+        ("follower", "string"),
+        ("post_id", "int64"),
+        ("author", "string"),
+    ),
+    "lean_distribution": (
+        ("timestamp", "float64"),
+        ("political_lean", "int64"),
+        ("followers", "int64"),
+    ),
+}
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError(
+            "Parquet analytics export requires the 'pyarrow' package"
+        ) from e
+    return pyarrow
+
+
+class _CsvTableWriter:
+    # Appends rows to one CSV file with a header line
+
+    def __init__(self, path, columns):
+        self._file = open(path, "w", newline="", encoding="utf-8")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow([name for name, _ in columns])
+
+    def write_rows(self, rows):
+        self._writer.writerows(rows)
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+class _ParquetTableWriter:
+    # Writes each batch of rows as one Parquet row group
+
+    def __init__(self, path, columns):
+        pyarrow = _import_pyarrow()
+        self._pyarrow = pyarrow
+        self._schema = pyarrow.schema(
+            [
+                (name, getattr(pyarrow, type_name)())
+                for name, type_name in columns
+            ]
+        )
+        self._writer = pyarrow.parquet.ParquetWriter(path, self._schema)
+
+    def write_rows(self, rows):
+        columns = list(zip(*rows))
+        self._writer.write_table(
+            self._pyarrow.Table.from_arrays(
+                [
+                    self._pyarrow.array(column, type=field.type)
+                    for column, field in zip(columns, self._schema)
+                ],
+                schema=self._schema,
+            ),
+            row_group_size=len(rows),
+        )
+
+    def close(self):
+        self._writer.close()
+
+
+_WRITERS = {"parquet": _ParquetTableWriter, "csv": _CsvTableWriter}
+
+
+class AnalyticsExporter(EventSink):
+    # Streams simulation results into one file per table in a directory,
+    # for loading into notebooks: posts with their engagement, interaction
+    # events and follower lean distributions over time.
+    #
+    # Rows are buffered per table and written row_group_size at a time, as
+    # a Parquet row group or a CSV chunk, so memory stays bounded however
+    # long the run. A table's file is created with its first row group.
+    # Parquet files are only readable once close() has written their footer
+
+    def __init__(
+        self,
+        directory,
+        export_format=None,
+        row_group_size=DEFAULT_ROW_GROUP_SIZE,
+    ):
+        if export_format is None:
+            # Parquet when pyarrow is available, CSV otherwise
+            export_format = (
+                "parquet"
+                if importlib.util.find_spec("pyarrow") is not None
+                else "csv"
+            )
+        if export_format not in FORMATS:
+            raise ValueError(
+                f"Unknown analytics export format: {export_format}"
+            )
+        if export_format == "parquet":
+            _import_pyarrow()
+
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.format = export_format
+        self.row_group_size = row_group_size
+
+        self._lock = threading.Lock()
+        self._buffers = {name: [] for name in TABLES}
+        self._writers = {}
+        self._closed = False
+
+    @classmethod
+    def from_env(cls):
+        # Build an exporter from ANALYTICS_EXPORT_DIR, or None if it is
+        # not set
+        directory = os.getenv("ANALYTICS_EXPORT_DIR")
+        if not directory:
+            return None
+        row_group_size = os.getenv("ANALYTICS_ROW_GROUP_SIZE")
+        return cls(
+            directory,
+            export_format=os.getenv("ANALYTICS_EXPORT_FORMAT") or None,
+            row_group_size=(
+                int(row_group_size)
+                if row_group_size
+                else DEFAULT_ROW_GROUP_SIZE
+            ),
+        )
+
+    def path(self, table):
+        return os.path.join(self.directory, f"{table}.{self.format}")
+
+    def _append(self, table, rows):
+        with self._lock:
+            if self._closed:
+                return
+            buffer = self._buffers[table]
+            buffer.extend(rows)
+            while len(buffer) >= self.row_group_size:
+                self._write(table, buffer[: self.row_group_size])
+                del buffer[: self.row_group_size]
+
+    def _write(self, table, rows):
+        writer = self._writers.get(table)
+        if writer is None:
+            writer = _WRITERS[self.format](self.path(table), TABLES[table])
+            self._writers[table] = writer
+        writer.write_rows(rows)
+
+    def write_event(self, event, fields, timestamp):
+        if not event.startswith("interaction."):
+            return
+        get = fields.get
+        self._append(
+            "interactions",
+            [
+                (
+                    timestamp,
+                    event[len("interaction.") :],
+                    get("follower"),
+                    get("post_id"),
+                    get("author"),
+                )
+            ],
+        )
+
+    def write_posts(self, posts):
+        # Append one row per post with its current engagement. posts can
+        # be any iterable; it is consumed a row group at a time
+        batch = []
+        for post in posts:
+            author = post.author
+            batch.append(
+                (
+                    post.post_id,
+                    author.handle if author is not None else None,
+                    post.content,
+                    post.sentiment.name,
+                    post.timestamp.timestamp(),
+                    post.likes,
+                    post.shares,
+                    post.comment_count,
+                    post.followers_gained,
+                    post.followers_lost,
+                    bool(post.is_spam),
+                )
+            )
+            if len(batch) >= self.row_group_size:
+                self._append("posts", batch)
+                batch = []
+        self._append("posts", batch)
+
+    def write_lean_distribution(self, followers, timestamp=None):
+        # Append the number of followers at each political lean at
+        # timestamp (default now). followers is an iterable of Followers
+        # or anything with lean_counts(), such as a FollowerStore
+        timestamp = time.time() if timestamp is None else timestamp
+        if hasattr(followers, "lean_counts"):
+            counts = [int(count) for count in followers.lean_counts()]
+        else:
+            counts = [0] * 101
+            for follower in followers:
+                counts[follower.political_lean] += 1
+        self._append(
+            "lean_distribution",
+            [
+                (timestamp, lean, count)
+                for lean, count in enumerate(counts)
+                if count
+            ],
+        )
+
+    def flush(self):
+        # Write every buffered row. Each call can add a short row group,
+        # so this is meant for the end of a run rather than a timer
+        with self._lock:
+            if self._closed:
+                return
+            for table, buffer in self._buffers.items():
+                if buffer:
+                    self._write(table, buffer)
+                    buffer.clear()
+
+    def close(self):
+        self.flush()
+        with self._lock:
+            self._closed = True
+            for writer in self._writers.values():
+                writer.close()
+            self._writers = {}
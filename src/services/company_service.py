@@ -1,3 +1,5 @@
+import logging
+
 from src.models.company import Company
 from src.models.post import Sentiment
 from src.patterns.decorator.sponsered_user import SponsoredUser
@@ -132,6 +134,12 @@ class CompanyService:
             # Apply decorator and add to company's list
             sponsored_user = SponsoredUser(user, company.name)
             company.sponsor_user(sponsored_user)
+            LoggerService.log_event(
+                "sponsorship.started",
+                logging.INFO,
+                user=user.handle,
+                company=company.name,
+            )
             return sponsored_user, f"You are now sponsored by {company.name}!"
 
         return user, message
@@ -158,6 +166,13 @@ class CompanyService:
                 company.remove_sponsorship(user)
                 break
 
+        LoggerService.log_event(
+            "sponsorship.ended",
+            logging.INFO,
+            user=user.handle,
+            company=company_name,
+        )
+
         return (
             unwrapped_user,
             f"Your sponsorship with {company_name} has been terminated.",
@@ -215,6 +230,15 @@ class CompanyService:
                 else:
                     setattr(user, "_misaligned_posts", misaligned_count)
 
+                LoggerService.log_event(
+                    "sponsorship.strike",
+                    logging.INFO,
+                    user=user.handle,
+                    company=company_name,
+                    post_id=post.post_id,
+                    strikes=misaligned_count,
+                )
+
                 # Terminate after 3 strikes
                 if misaligned_count >= 3:
                     if isinstance(user, VerifiedUser) and hasattr(
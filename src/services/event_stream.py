@@ -0,0 +1,232 @@
+import gzip
+import io
+import json
+import os
+import struct
+import threading
+from datetime import datetime
+from enum import Enum
+
+from src.patterns.interfaces.event_sink import EventSink
+
+FORMATS = ("jsonl", "msgpack")
+COMPRESSIONS = (None, "gzip", "zstd")
+
+# msgpack records are prefixed with their length as a big-endian uint32
+_LENGTH_PREFIX = struct.Struct(">I")
+
+
+def _import_msgpack():
+    try:
+        import msgpack
+    except ImportError as e:
+        raise ImportError(
+            "The msgpack event stream format requires the 'msgpack' package"
+        ) from e
+    return msgpack
+
+
+def _import_zstandard():
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError(
+            "zstd event stream compression requires the 'zstandard' package"
+        ) from e
+    return zstandard
+
+
+def _encode_value(value):
+    # Fallback encoder for values JSON and msgpack do not handle natively
+    if isinstance(value, Enum):
+        return value.name
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, (set, tuple)):
+        return list(value)
+    raise TypeError(f"Cannot encode {type(value).__name__} in event stream")
+
+
+def infer_stream_options(path):
+    # Guess (format, compression) from a file name such as
+    # "run.jsonl.gz" or "run.msgpack.zst"
+    name = os.path.basename(path).lower()
+    compression = None
+    if name.endswith(".gz"):
+        compression = "gzip"
+        name = name[: -len(".gz")]
+    elif name.endswith(".zst"):
+        compression = "zstd"
+        name = name[: -len(".zst")]
+
+    stream_format = (
+        "msgpack" if name.endswith((".msgpack", ".mpk")) else "jsonl"
+    )
+    return stream_format, compression
+
+
+class EventStreamWriter(EventSink):
+    # Writes simulation events as compact records to a file.
+    #
+    # Records are buffered in memory and written in blocks of about
+    # buffer_size bytes. With compression each block is written as an
+    # independent gzip member / zstd frame, so a file that was not closed
+    # cleanly can still be read up to its last complete block
+
+    DEFAULT_BUFFER_SIZE = 64 * 1024
+
+    def __init__(
+        self,
+        path,
+        stream_format=None,
+        compression=None,
+        buffer_size=DEFAULT_BUFFER_SIZE,
+    ):
+        inferred_format, inferred_compression = infer_stream_options(path)
+        self.path = path
+        self.format = stream_format or inferred_format
+        self.compression = compression or inferred_compression
+        self.buffer_size = buffer_size
+
+        if self.format not in FORMATS:
+            raise ValueError(f"Unknown event stream format: {self.format}")
+        if self.compression not in COMPRESSIONS:
+            raise ValueError(
+                f"Unknown event stream compression: {self.compression}"
+            )
+
+        # Resolve optional dependencies up front so a bad configuration
+        # fails when the stream is opened, not on the first flush
+        self._packer = (
+            _import_msgpack().Packer(default=_encode_value)
+            if self.format == "msgpack"
+            else None
+        )
+        self._compressor = (
+            _import_zstandard().ZstdCompressor()
+            if self.compression == "zstd"
+            else None
+        )
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, "ab")
+        self._buffer = bytearray()
+        self._lock = threading.Lock()
+        self.event_count = 0
+
+    @classmethod
+    def from_env(cls):
+        # Build a writer from EVENT_STREAM_PATH, or None if it is not set.
+        # The format and compression follow the file extension
+        path = os.getenv("EVENT_STREAM_PATH")
+        if not path:
+            return None
+        buffer_kb = os.getenv("EVENT_STREAM_BUFFER_KB")
+        return cls(
+            path,
+            buffer_size=(
+                int(buffer_kb) * 1024
+                if buffer_kb
+                else cls.DEFAULT_BUFFER_SIZE
+            ),
+        )
+
+    def write_event(self, event, fields, timestamp):
+        record = {"ts": timestamp, "event": event}
+        record.update(fields)
+
+        if self._packer is not None:
+            payload = self._packer.pack(record)
+            data = _LENGTH_PREFIX.pack(len(payload)) + payload
+        else:
+            data = (
+                json.dumps(
+                    record, separators=(",", ":"), default=_encode_value
+                )
+                + "\n"
+            ).encode("utf-8")
+
+        with self._lock:
+            self._buffer += data
+            self.event_count += 1
+            if len(self._buffer) >= self.buffer_size:
+                self._write_block()
+
+    def flush(self):
+        with self._lock:
+            self._write_block()
+            if not self._file.closed:
+                self._file.flush()
+
+    def close(self):
+        with self._lock:
+            self._write_block()
+            self._file.close()
+
+    def _write_block(self):
+        if not self._buffer or self._file.closed:
+            return
+
+        block = bytes(self._buffer)
+        if self.compression == "gzip":
+            block = gzip.compress(block)
+        elif self.compression == "zstd":
+            block = self._compressor.compress(block)
+
+        self._file.write(block)
+        self._buffer.clear()
+
+
+def _open_stream(path, compression):
+    if compression == "gzip":
+        return gzip.open(path, "rb")
+    if compression == "zstd":
+        zstandard = _import_zstandard()
+        reader = zstandard.ZstdDecompressor().stream_reader(
+            open(path, "rb"), read_across_frames=True, closefd=True
+        )
+        # Buffered so JSONL records can be read line by line
+        return io.BufferedReader(reader)
+    return open(path, "rb")
+
+
+def _read_exact(stream, size):
+    # Decompressing readers may return short reads
+    data = b""
+    while len(data) < size:
+        chunk = stream.read(size - len(data))
+        if not chunk:
+            break
+        data += chunk
+    return data
+
+
+def read_events(path, stream_format=None, compression=None):
+    # Yield the records of an event stream one at a time, without loading
+    # the whole file into memory
+    inferred_format, inferred_compression = infer_stream_options(path)
+    stream_format = stream_format or inferred_format
+    compression = compression or inferred_compression
+
+    unpackb = (
+        _import_msgpack().unpackb if stream_format == "msgpack" else None
+    )
+
+    with _open_stream(path, compression) as stream:
+        if unpackb is None:
+            for line in stream:
+                if line.strip():
+                    yield json.loads(line)
+            return
+
+        while True:
+            header = _read_exact(stream, _LENGTH_PREFIX.size)
+            if len(header) < _LENGTH_PREFIX.size:
+                return
+            (length,) = _LENGTH_PREFIX.unpack(header)
+            payload = _read_exact(stream, length)
+            if len(payload) < length:
+                return  # Truncated final record
+            yield unpackb(payload)
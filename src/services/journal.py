@@ -0,0 +1,523 @@
+import json
+import logging
+import os
+import struct
+import threading
+import time
+import zlib
+from datetime import datetime
+
+from src.models.follower import Follower
+from src.models.post import Comment, Post, Sentiment
+from src.patterns.decorator.sponsered_user import SponsoredUser
+from src.patterns.decorator.verified_user import VerifiedUser
+from src.patterns.interfaces.event_sink import EventSink
+from src.patterns.interfaces.user_decorator import UserDecorator
+from src.services.event_stream import _encode_value
+from src.services.logger_service import LoggerService
+from src.services.snapshot_service import _advance_ids, _user_layers
+
+JOURNAL_MAGIC = b"SMSJRNL1"
+
+# Each record is a header (sequence number, payload length), the JSON
+# payload and a CRC32 of header and payload, all big-endian
+_HEADER = struct.Struct(">QI")
+_CRC = struct.Struct(">I")
+
+# How long the commit thread gathers records before one write and fsync
+DEFAULT_SYNC_INTERVAL = 0.05
+
+# Events that change the model. Only these are journaled and replayed
+JOURNALED_EVENTS = frozenset(
+    {
+        "post.created",
+        "post.edited",
+        "post.deleted",
+        "post.sentiment_changed",
+        "post.engagement_changed",
+        "post.comment_added",
+        "post.comment_removed",
+        "post.follower_gained",
+        "post.follower_lost",
+        "follower.added",
+        "follower.removed",
+        "follower.lean_adjusted",
+        "user.verified",
+        "user.reputation_changed",
+        "user.profile_updated",
+        "sponsorship.started",
+        "sponsorship.ended",
+        "sponsorship.strike",
+    }
+)
+
+
+def _read_records(file):
+    # Yield (seq, payload, end offset) for each intact record, stopping at
+    # the first torn or corrupt one, which is where a crash cut it off
+    magic = file.read(len(JOURNAL_MAGIC))
+    if not magic:
+        return
+    if magic != JOURNAL_MAGIC:
+        raise ValueError("Not a simulation journal")
+
+    offset = len(JOURNAL_MAGIC)
+    while True:
+        header = file.read(_HEADER.size)
+        if len(header) < _HEADER.size:
+            return
+        seq, length = _HEADER.unpack(header)
+        payload = file.read(length)
+        crc = file.read(_CRC.size)
+        if len(payload) < length or len(crc) < _CRC.size:
+            return
+        if _CRC.unpack(crc)[0] != zlib.crc32(payload, zlib.crc32(header)):
+            return
+        offset += _HEADER.size + length + _CRC.size
+        yield seq, payload, offset
+
+
+def read_journal(path, after_seq=0):
+    # Yield (seq, event, timestamp, fields) for the intact records in a
+    # journal with a sequence number above after_seq
+    with open(path, "rb") as file:
+        for seq, payload, _ in _read_records(file):
+            if seq > after_seq:
+                record = json.loads(payload)
+                yield seq, record["event"], record["ts"], record["fields"]
+
+
+def _fsync_directory(path):
+    # Make a rename in path's directory durable, where the OS allows it
+    try:
+        fd = os.open(os.path.dirname(path) or ".", os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class JournalWriter(EventSink):
+    # Append-only write-ahead journal of model changes.
+    #
+    # Records are queued by write_event and a commit thread writes and
+    # fsyncs everything queued every sync_interval seconds, so one fsync
+    # covers a group of records and at most sync_interval of changes can
+    # be lost. With sync_interval=0 every record is synced before
+    # write_event returns. After a snapshot, checkpoint() drops the
+    # records it includes, so replay time only depends on the changes
+    # made since
+
+    def __init__(
+        self, path, sync_interval=DEFAULT_SYNC_INTERVAL, start_seq=0
+    ):
+        self.path = path
+        self.sync_interval = sync_interval
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # Continue after the last intact record, dropping any torn tail
+        last_seq, end = 0, 0
+        if (
+            os.path.exists(path)
+            and os.path.getsize(path) >= len(JOURNAL_MAGIC)
+        ):
+            with open(path, "rb") as file:
+                end = len(JOURNAL_MAGIC)
+                for last_seq, _, end in _read_records(file):
+                    pass
+        self._file = open(path, "r+b" if end else "w+b")
+        self._file.truncate(end)
+        self._file.seek(end)
+        if not end:
+            self._file.write(JOURNAL_MAGIC)
+            self._sync()
+
+        self._seq = max(last_seq, start_seq)
+        self._pending = bytearray()
+        self._lock = threading.Lock()
+        self._condition = threading.Condition(self._lock)
+        # Held while writing to the file, so commits stay in order
+        self._io_lock = threading.Lock()
+        self._closed = False
+        self.record_count = 0
+        self.commit_count = 0
+
+        self._thread = None
+        if sync_interval > 0:
+            self._thread = threading.Thread(
+                target=self._run, name="journal-commit", daemon=True
+            )
+            self._thread.start()
+
+    @classmethod
+    def from_env(cls, start_seq=0):
+        # Build a journal from JOURNAL_PATH, or None if it is not set
+        path = os.getenv("JOURNAL_PATH")
+        if not path:
+            return None
+        sync_interval = os.getenv("JOURNAL_SYNC_SECONDS")
+        return cls(
+            path,
+            sync_interval=(
+                float(sync_interval)
+                if sync_interval
+                else DEFAULT_SYNC_INTERVAL
+            ),
+            start_seq=start_seq,
+        )
+
+    @property
+    def last_seq(self):
+        # Sequence number of the last record written
+        with self._lock:
+            return self._seq
+
+    def write_event(self, event, fields, timestamp):
+        if event not in JOURNALED_EVENTS:
+            return
+        payload = json.dumps(
+            {"event": event, "ts": timestamp, "fields": fields},
+            default=_encode_value,
+            separators=(",", ":"),
+        ).encode("utf-8")
+
+        with self._condition:
+            if self._closed:
+                return
+            self._seq += 1
+            header = _HEADER.pack(self._seq, len(payload))
+            self._pending += header
+            self._pending += payload
+            self._pending += _CRC.pack(
+                zlib.crc32(payload, zlib.crc32(header))
+            )
+            self.record_count += 1
+            if self._thread is not None:
+                self._condition.notify()
+                return
+        self._commit()
+
+    def _sync(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def _commit(self):
+        # Write and fsync everything queued so far
+        with self._io_lock:
+            with self._lock:
+                data, self._pending = self._pending, bytearray()
+            if data and not self._file.closed:
+                self._file.write(data)
+                self._sync()
+                self.commit_count += 1
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+                if self._closed:
+                    return
+            # Let more records join this commit
+            time.sleep(self.sync_interval)
+            self._commit()
+
+    def flush(self):
+        self._commit()
+
+    def checkpoint(self, seq):
+        # Drop the records up to seq, once a snapshot including them has
+        # been written. The rest are copied to a new file that atomically
+        # replaces the journal
+        with self._io_lock:
+            with self._lock:
+                data, self._pending = self._pending, bytearray()
+            if self._file.closed:
+                return
+            if data:
+                self._file.write(data)
+            self._file.flush()
+
+            self._file.seek(0)
+            keep_from = None
+            end = len(JOURNAL_MAGIC)
+            for record_seq, payload, end in _read_records(self._file):
+                if keep_from is None and record_seq > seq:
+                    keep_from = end - len(payload) - _HEADER.size - _CRC.size
+            self._file.seek(keep_from if keep_from is not None else end)
+            tail = self._file.read(end - self._file.tell())
+
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, "wb") as file:
+                file.write(JOURNAL_MAGIC)
+                file.write(tail)
+                file.flush()
+                os.fsync(file.fileno())
+            self._file.close()
+            os.replace(temp_path, self.path)
+            _fsync_directory(self.path)
+
+            self._file = open(self.path, "r+b")
+            self._file.seek(0, os.SEEK_END)
+            self.commit_count += 1
+
+    def close(self):
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join()
+        self._commit()
+        with self._io_lock:
+            self._file.close()
+
+
+def _comment_time(timestamp):
+    # Comment times to the millisecond, as snapshots store them as floats
+    return round(timestamp.timestamp(), 3)
+
+
+class _Replay:
+    # Applies journaled events to a restored (or new) user. Events carry
+    # absolute values or are matched against the existing state, so a
+    # change the snapshot already includes is harmless to apply again
+
+    def __init__(self, user, company_service):
+        self.user = user
+        self.company_service = company_service
+        _, self.base = _user_layers(user)
+        self.posts = {post.post_id: post for post in self.base._posts}
+        self.followers = {
+            follower.follower_id: follower
+            for follower in self.base._followers
+        }
+
+    def apply(self, event, timestamp, fields):
+        handler = getattr(self, "_" + event.replace(".", "_"), None)
+        if handler is not None:
+            handler(timestamp, fields)
+
+    def _company(self, name):
+        if self.company_service is None:
+            return None
+        return next(
+            (c for c in self.company_service.companies if c.name == name),
+            None,
+        )
+
+    def _sponsored_layer(self):
+        # Where CompanyService keeps sponsorship strikes
+        if isinstance(self.user, VerifiedUser) and hasattr(
+            self.user._user, "company_name"
+        ):
+            return self.user._user
+        return self.user
+
+    def _post_created(self, timestamp, fields):
+        if fields["post_id"] in self.posts:
+            return
+        post = Post._restore(
+            fields["post_id"],
+            fields["content"],
+            self.user,
+            fields.get("image_path"),
+            timestamp=datetime.fromtimestamp(timestamp),
+            sentiment=Sentiment[fields["sentiment"]],
+            is_spam=bool(fields.get("is_spam")),
+        )
+        self.base._posts.append(post)
+        self.posts[post.post_id] = post
+
+    def _post_edited(self, timestamp, fields):
+        post = self.posts.get(fields["post_id"])
+        if post is not None:
+            post._content = fields["content"]
+            post._image_path = fields["image_path"]
+
+    def _post_deleted(self, timestamp, fields):
+        post = self.posts.pop(fields["post_id"], None)
+        if post is not None:
+            self.base._posts.remove(post)
+
+    def _post_sentiment_changed(self, timestamp, fields):
+        post = self.posts.get(fields["post_id"])
+        if post is not None:
+            post._sentiment = Sentiment[fields["sentiment"]]
+
+    def _post_engagement_changed(self, timestamp, fields):
+        post = self.posts.get(fields["post_id"])
+        if post is not None:
+            post._likes = fields["likes"]
+            post._shares = fields["shares"]
+
+    def _find_comment(self, post, fields):
+        # The post's comment matching a comment event, or None. Comments
+        # are matched by content, author and time rather than position, so
+        # events the snapshot already includes are found and skipped
+        key = (
+            fields["content"],
+            fields["author"],
+            _comment_time(datetime.fromisoformat(fields["timestamp"])),
+        )
+        for comment in post._comments:
+            author = comment.author
+            if (
+                comment.content,
+                author if isinstance(author, str) else None,
+                _comment_time(comment.timestamp),
+            ) == key:
+                return comment
+        return None
+
+    def _post_comment_added(self, timestamp, fields):
+        post = self.posts.get(fields["post_id"])
+        if post is None or self._find_comment(post, fields) is not None:
+            return
+        author = fields["author"]
+        post._comments.append(
+            Comment._restore(
+                fields["content"],
+                Sentiment[fields["sentiment"]],
+                self.user if author is None else author,
+                datetime.fromisoformat(fields["timestamp"]),
+            )
+        )
+
+    def _post_comment_removed(self, timestamp, fields):
+        post = self.posts.get(fields["post_id"])
+        if post is None:
+            return
+        comment = self._find_comment(post, fields)
+        if comment is not None:
+            post._comments.remove(comment)
+
+    def _post_follower_gained(self, timestamp, fields):
+        post = self.posts.get(fields["post_id"])
+        if post is not None:
+            post._followers_gained = fields["total"]
+
+    def _post_follower_lost(self, timestamp, fields):
+        post = self.posts.get(fields["post_id"])
+        if post is not None:
+            post._followers_lost = fields["total"]
+
+    def _follower_added(self, timestamp, fields):
+        if fields["follower_id"] not in self.followers:
+            (follower,) = Follower._restore_batch(
+                [fields["follower_id"]],
+                [fields["handle"]],
+                [Sentiment[fields["sentiment"]]],
+                [fields["political_lean"]],
+            )
+            self.base._followers.append(follower)
+            self.base._observers.append(follower)
+            self.followers[follower.follower_id] = follower
+        self.base._follower_count = fields["follower_count"]
+
+    def _follower_removed(self, timestamp, fields):
+        follower = self.followers.pop(fields["follower_id"], None)
+        if follower is not None:
+            self.base._followers.remove(follower)
+            if follower in self.base._observers:
+                self.base._observers.remove(follower)
+        self.base._follower_count = fields["follower_count"]
+
+    def _follower_lean_adjusted(self, timestamp, fields):
+        follower = self.followers.get(fields.get("follower_id"))
+        if follower is not None:
+            follower._political_lean = fields["new_lean"]
+
+    def _user_verified(self, timestamp, fields):
+        layers, _ = _user_layers(self.user)
+        if not any(isinstance(layer, VerifiedUser) for layer in layers):
+            self.user = VerifiedUser(self.user)
+
+    def _user_reputation_changed(self, timestamp, fields):
+        self.base._recent_follower_losses = fields["recent_follower_losses"]
+        self.base._last_reputation_check = fields["last_reputation_check"]
+
+    def _user_profile_updated(self, timestamp, fields):
+        if fields["handle"]:
+            self.base._handle = fields["handle"]
+        if fields["bio"]:
+            self.base._bio = fields["bio"]
+        if fields["profile_picture_path"]:
+            self.base._profile_picture_path = fields["profile_picture_path"]
+
+    def _sponsor_name(self):
+        # Company sponsoring the user, or None
+        layers, _ = _user_layers(self.user)
+        return next(
+            (
+                layer.company_name
+                for layer in layers
+                if isinstance(layer, SponsoredUser)
+            ),
+            None,
+        )
+
+    def _sponsorship_started(self, timestamp, fields):
+        # A user has at most one sponsor, so an already sponsored user
+        # means this event is included in the restored state
+        if self._sponsor_name() is not None:
+            return
+        # Same wrapping as CompanyService.sponsor_user
+        self.user = SponsoredUser(self.user, fields["company"])
+        company = self._company(fields["company"])
+        if company is not None:
+            company.sponsor_user(self.user)
+
+    def _sponsorship_ended(self, timestamp, fields):
+        if self._sponsor_name() != fields["company"]:
+            return
+        # Same unwrapping as CompanyService.remove_sponsorship
+        sponsored = self.user
+        if isinstance(sponsored, VerifiedUser) and hasattr(
+            sponsored._user, "company_name"
+        ):
+            self.user = VerifiedUser(sponsored._user._user)
+        elif isinstance(sponsored, UserDecorator):
+            self.user = sponsored._user
+        company = self._company(fields["company"])
+        if company is not None:
+            company.remove_sponsorship(sponsored)
+
+    def _sponsorship_strike(self, timestamp, fields):
+        self._sponsored_layer()._misaligned_posts = fields["strikes"]
+
+
+def replay_journal(path, user, company_service=None, after_seq=0):
+    # Apply the journal's records after after_seq (the snapshot's
+    # journal_seq) to user. Returns (user, records applied, last seq); the
+    # user can come back re-wrapped if verification or sponsorship changed
+    if not os.path.exists(path):
+        return user, 0, after_seq
+
+    start = time.perf_counter()
+    replay = _Replay(user, company_service)
+    applied = 0
+    last_seq = after_seq
+    for last_seq, event, timestamp, fields in read_journal(path, after_seq):
+        replay.apply(event, timestamp, fields)
+        applied += 1
+
+    if replay.followers:
+        _advance_ids(Follower, max(replay.followers))
+    if replay.posts:
+        _advance_ids(Post, max(replay.posts))
+
+    LoggerService.log_event(
+        "journal.replayed",
+        logging.INFO,
+        path=path,
+        records=applied,
+        seconds=round(time.perf_counter() - start, 3),
+    )
+    return replay.user, applied, last_seq
@@ -1,7 +1,11 @@
+import gzip
 import logging
 import os
+import queue
+import shutil
 import sys
-from logging.handlers import RotatingFileHandler
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 # ANSI color codes for terminal output
 COLORS = {
@@ -35,6 +39,168 @@ class ColoredFormatter(logging.Formatter):
         return result
 
 
+class _DeferredFlushMixin:
+    # Lets a listener write a batch of records before flushing the stream
+
+    defer_flush = False
+
+    def flush(self):
+        if not self.defer_flush:
+            super().flush()
+
+
+class BatchedStreamHandler(_DeferredFlushMixin, logging.StreamHandler):
+    pass
+
+
+class BatchedRotatingFileHandler(_DeferredFlushMixin, RotatingFileHandler):
+    # Rotating file handler that can gzip rotated files
+
+    def __init__(self, *args, compress=False, **kwargs):
+        super().__init__(*args, **kwargs)
+        if compress:
+            self.namer = self._gzip_namer
+            self.rotator = self._gzip_rotator
+
+    @staticmethod
+    def _gzip_namer(name):
+        return f"{name}.gz"
+
+    @staticmethod
+    def _gzip_rotator(source, dest):
+        with open(source, "rb") as src, gzip.open(dest, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        os.remove(source)
+
+
+class BoundedQueueHandler(QueueHandler):
+    # Queue handler that either drops records or blocks the caller when the
+    # queue is full
+
+    POLICIES = ("drop", "block")
+
+    def __init__(self, log_queue, policy="drop", block_timeout=None):
+        super().__init__(log_queue)
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unknown queue policy: {policy}")
+        self.policy = policy
+        self.block_timeout = block_timeout
+        self.dropped = 0
+        self.listener = None
+
+    def prepare(self, record):
+        # The listener runs in this process, so the record is passed as is
+        # and formatted on the listener thread rather than the caller's
+        return record
+
+    def enqueue(self, record):
+        try:
+            if self.policy == "block":
+                self.queue.put(record, timeout=self.block_timeout)
+            else:
+                self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class BatchingQueueListener(QueueListener):
+    # Queue listener that handles records in batches and flushes each
+    # handler once per batch. It runs its own thread rather than the base
+    # class's, so only the documented QueueListener API is relied on.
+    # Records a queue_handler dropped are reported as a warning after the
+    # batch they were dropped during, and when the listener stops
+
+    # Put on the queue to stop the listener thread
+    _STOP = object()
+
+    def __init__(
+        self,
+        log_queue,
+        *handlers,
+        batch_size=100,
+        queue_handler=None,
+        logger_name="logging",
+    ):
+        super().__init__(log_queue, *handlers, respect_handler_level=True)
+        self.batch_size = batch_size
+        self.queue_handler = queue_handler
+        self.logger_name = logger_name
+        self.reported_drops = 0
+        self._batch_thread = None
+
+    def start(self):
+        self._batch_thread = threading.Thread(
+            target=self._run, name="log-listener", daemon=True
+        )
+        self._batch_thread.start()
+
+    def stop(self):
+        # Handle every record queued so far, then stop the thread
+        if self._batch_thread is None:
+            return
+        self.enqueue_sentinel()
+        self._batch_thread.join()
+        self._batch_thread = None
+
+    def enqueue_sentinel(self):
+        # Wait for room rather than failing when the queue is full
+        self.queue.put(self._STOP)
+
+    def _run(self):
+        while True:
+            batch = [self.dequeue(True)]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.dequeue(False))
+                except queue.Empty:
+                    break
+
+            stopping = self._handle_batch(batch)
+            for _ in batch:
+                self.queue.task_done()
+            if stopping:
+                return
+
+    def _handle_batch(self, batch):
+        # Returns True once the stop sentinel has been reached
+        for handler in self.handlers:
+            handler.defer_flush = True
+        try:
+            stopping = False
+            for record in batch:
+                if record is self._STOP:
+                    stopping = True
+                    break
+                self.handle(record)
+            self._report_drops()
+            return stopping
+        finally:
+            for handler in self.handlers:
+                handler.defer_flush = False
+                handler.flush()
+
+
+    def _report_drops(self):
+        # Warn about records dropped since the last report
+        if self.queue_handler is None:
+            return
+        dropped = self.queue_handler.dropped - self.reported_drops
+        if dropped <= 0:
+            return
+        self.reported_drops += dropped
+        self.handle(
+            logging.LogRecord(
+                self.logger_name,
+                logging.WARNING,
+                __file__,
+                0,
+                "Dropped %d log records because the log queue was full",
+                (dropped,),
+                None,
+            )
+        )
+
+
 def setup_logger(name, config):
     # Configure and return a logger instance
 
@@ -46,6 +212,7 @@ def setup_logger(name, config):
 
     # Clear existing handlers
     logger.handlers = []
+    handlers = []
 
     # Get log format from config
     log_format = config.get(
@@ -62,23 +229,48 @@ def setup_logger(name, config):
         # Create logs directory
         os.makedirs(os.path.dirname(log_file), exist_ok=True)
 
-        # Add rotating file handler
-        file_handler = RotatingFileHandler(
-            log_file, maxBytes=max_bytes, backupCount=backup_count
+        # Add rotating file handler, optionally gzipping rotated files
+        file_handler = BatchedRotatingFileHandler(
+            log_file,
+            maxBytes=max_bytes,
+            backupCount=backup_count,
+            compress=file_config.get("compress", False),
         )
         file_handler.setFormatter(logging.Formatter(log_format))
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
 
     # Setup console logging if enabled
     console_config = config.get("console", {})
     if console_config.get("enabled", True):
-        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler = BatchedStreamHandler(sys.stdout)
 
         # Use colored output if configured
         use_colors = console_config.get("colored", True)
         console_handler.setFormatter(
             ColoredFormatter(use_colors=use_colors, fmt=log_format)
         )
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
+
+    # In async mode the handlers run on a listener thread behind a bounded
+    # queue. The listener is started by LoggerService.set_logger
+    async_config = config.get("async", {})
+    if async_config.get("enabled", False):
+        log_queue = queue.Queue(maxsize=async_config.get("queue_size", 10000))
+        queue_handler = BoundedQueueHandler(
+            log_queue,
+            policy=async_config.get("policy", "drop"),
+            block_timeout=async_config.get("block_timeout"),
+        )
+        queue_handler.listener = BatchingQueueListener(
+            log_queue,
+            *handlers,
+            batch_size=async_config.get("batch_size", 100),
+            queue_handler=queue_handler,
+            logger_name=name,
+        )
+        logger.addHandler(queue_handler)
+    else:
+        for handler in handlers:
+            logger.addHandler(handler)
 
     return logger
@@ -1,15 +1,295 @@
+import atexit
 import logging
+import threading
+import time
+from collections import Counter
+from enum import Enum
+
+
+class LogEvent:
+    # Structured log message: an event name plus fields. The text is only
+    # built if a handler actually emits the record
+
+    # Longest string field value shown in the formatted message
+    MAX_VALUE_LENGTH = 50
+
+    __slots__ = ("name", "fields")
+
+    def __init__(self, name, fields=None):
+        self.name = name
+        self.fields = fields or {}
+
+    @property
+    def category(self):
+        # Events are named "<category>.<action>", e.g. "interaction.like"
+        return self.name.split(".", 1)[0]
+
+    def as_tuple(self):
+        return (self.name, self.fields)
+
+    def __eq__(self, other):
+        if not isinstance(other, LogEvent):
+            return NotImplemented
+        return self.as_tuple() == other.as_tuple()
+
+    def __repr__(self):
+        return f"LogEvent({self.name!r}, {self.fields!r})"
+
+    def __str__(self):
+        if not self.fields:
+            return self.name
+        details = " ".join(
+            f"{key}={self._format_value(value)}"
+            for key, value in self.fields.items()
+        )
+        return f"{self.name} {details}"
+
+    @classmethod
+    def _format_value(cls, value):
+        if isinstance(value, Enum):
+            return value.name
+        if isinstance(value, str) and len(value) > cls.MAX_VALUE_LENGTH:
+            return f"{value[:cls.MAX_VALUE_LENGTH]}..."
+        return value
+
+
+class EventSamplingFilter(logging.Filter):
+    # Samples and rate-limits structured events per category, and replaces
+    # the suppressed ones with a periodic summary of event counts.
+    #
+    # rules maps a category ("interaction", "follower", ...) to a dict with
+    # "sample_rate" (fraction of events kept, e.g. 0.01) and/or
+    # "max_per_interval" (events kept per summary interval). Categories
+    # without a rule and plain string messages always pass
+
+    def __init__(self, rules, interval=1.0, clock=time.monotonic):
+        super().__init__()
+        self.rules = {}
+        for category, rule in rules.items():
+            sample_rate = rule.get("sample_rate", 1.0)
+            if not 0 < sample_rate <= 1:
+                raise ValueError(
+                    f"sample_rate for '{category}' must be in (0, 1]"
+                )
+            self.rules[category] = (
+                round(1 / sample_rate),
+                rule.get("max_per_interval"),
+            )
+        self.interval = interval
+        self.clock = clock
+        self.logger = None
+
+        self._lock = threading.Lock()
+        self._window_start = clock()
+        self._seen = Counter()  # Events per category, for sampling
+        self._kept = Counter()  # Events kept per category in this window
+        self._counts = Counter()  # Events per name in this window
+        self._suppressed = 0
+        self._timer = None
+
+    def filter(self, record):
+        if getattr(record, "event_summary", False):
+            return True
+        if getattr(record, "event_sampled", False):
+            # Already counted by LoggerService.log_event
+            return True
+
+        event = record.msg
+        if not isinstance(event, LogEvent):
+            return True
+        if self.logger is None:
+            self.logger = logging.getLogger(record.name)
+        return self.admit(event)
+
+    def admit(self, event, enabled=True):
+        # Count event and return whether it should be logged. enabled is
+        # False when the logger would drop it for its level, so disabled
+        # events still show up in the summaries
+        rule = self.rules.get(event.category)
+        if rule is None:
+            return enabled
+
+        sample_every, max_per_interval = rule
+        with self._lock:
+            summary = self._roll_window()
+
+            category = event.category
+            self._counts[event.name] += 1
+            self._seen[category] += 1
+            keep = (
+                enabled
+                and (self._seen[category] - 1) % sample_every == 0
+                and (
+                    max_per_interval is None
+                    or self._kept[category] < max_per_interval
+                )
+            )
+            if keep:
+                self._kept[category] += 1
+            else:
+                self._suppressed += 1
+
+        if summary:
+            self._emit_summary(*summary)
+        return keep
+
+    def is_sampled(self, category):
+        return category in self.rules
+
+    def start(self):
+        # Close windows every interval on a background thread, so the
+        # last window of a burst is reported without waiting for the next
+        # event
+        if self._timer is not None:
+            return
+        self._stopped = threading.Event()
+        self._timer = threading.Thread(
+            target=self._run_timer, name="event-sampling", daemon=True
+        )
+        self._timer.start()
+
+    def stop(self):
+        if self._timer is None:
+            return
+        self._stopped.set()
+        self._timer.join()
+        self._timer = None
+        self.flush()
+
+    def _run_timer(self):
+        while not self._stopped.wait(self.interval):
+            with self._lock:
+                summary = self._roll_window()
+            if summary:
+                self._emit_summary(*summary)
+
+    def flush(self):
+        # Emit the summary for the current window now, e.g. on shutdown
+        with self._lock:
+            summary = self._take_window()
+        if summary:
+            self._emit_summary(*summary)
+
+    def _roll_window(self):
+        # Close the current window once the interval has elapsed
+        if self.clock() - self._window_start < self.interval:
+            return None
+        return self._take_window()
+
+    def _take_window(self):
+        now = self.clock()
+        elapsed = now - self._window_start
+        counts, suppressed = self._counts, self._suppressed
+
+        self._window_start = now
+        self._kept = Counter()
+        self._counts = Counter()
+        self._suppressed = 0
+
+        if not suppressed:
+            return None
+        return counts, suppressed, elapsed
+
+    def _emit_summary(self, counts, suppressed, elapsed):
+        totals = ", ".join(
+            f"{count:,} {event}" for event, count in counts.most_common()
+        )
+        logger = self.logger or logging.getLogger()
+        logger.log(
+            logging.INFO,
+            f"{totals} in last {elapsed:.1f}s "
+            f"({suppressed:,} not logged individually)",
+            extra={"event_summary": True},
+        )
 
 
 class LoggerService:
     # Service for logging application events
     _logger = None
 
+    # Queue listeners of async loggers (see services/logger.setup_logger)
+    _listeners = []
+    _atexit_registered = False
+
+    # Sampling filter installed by configure_sampling
+    _sampling_filter = None
+
+    # Sinks that receive every structured event (see EventSink)
+    _event_sinks = []
+
     @classmethod
     def set_logger(cls, logger):
-        # Set the logger instance
+        # Set the logger instance, stopping the listeners of the previous
+        # logger and starting those of the new one
+        cls.shutdown()
+
+        # Keep event sampling in place on the new logger
+        if cls._sampling_filter is not None:
+            if cls._logger is not None:
+                cls._logger.removeFilter(cls._sampling_filter)
+            logger.addFilter(cls._sampling_filter)
+            cls._sampling_filter.logger = logger
+
         cls._logger = logger
 
+        for handler in getattr(logger, "handlers", []):
+            listener = getattr(handler, "listener", None)
+            if listener is not None:
+                listener.start()
+                cls._listeners.append(listener)
+
+        if cls._listeners:
+            cls._register_atexit()
+
+    @classmethod
+    def _register_atexit(cls):
+        if not cls._atexit_registered:
+            atexit.register(cls.shutdown)
+            cls._atexit_registered = True
+
+    @classmethod
+    def add_event_sink(cls, sink):
+        # Send every structured event to sink, whatever the log level
+        if sink not in cls._event_sinks:
+            cls._event_sinks.append(sink)
+        cls._register_atexit()
+
+    @classmethod
+    def remove_event_sink(cls, sink):
+        if sink in cls._event_sinks:
+            cls._event_sinks.remove(sink)
+            sink.flush()
+
+    @classmethod
+    def configure_sampling(cls, rules, interval=1.0):
+        # Sample/rate-limit structured events per category on the current
+        # logger. Pass an empty rules dict to log every event again
+        logger = cls.get_logger()
+        if cls._sampling_filter is not None:
+            cls._sampling_filter.stop()
+            logger.removeFilter(cls._sampling_filter)
+            cls._sampling_filter = None
+
+        if rules:
+            cls._sampling_filter = EventSamplingFilter(rules, interval)
+            cls._sampling_filter.logger = logger
+            logger.addFilter(cls._sampling_filter)
+            cls._sampling_filter.start()
+        return cls._sampling_filter
+
+    @classmethod
+    def shutdown(cls):
+        # Flush event sinks and the pending sampling summary, then flush
+        # queued records and stop the listener threads
+        for sink in cls._event_sinks:
+            sink.flush()
+
+        if cls._sampling_filter is not None:
+            cls._sampling_filter.flush()
+
+        while cls._listeners:
+            cls._listeners.pop().stop()
+
     @classmethod
     def get_logger(cls):
         # Get or create the logger instance
@@ -17,6 +297,28 @@ class LoggerService:
             cls._logger = cls._create_default_logger()
         return cls._logger
 
+    @classmethod
+    def log_event(cls, event, level=logging.DEBUG, **fields):
+        # Record a structured event. Hot paths call this instead of building
+        # f-strings: when the level is disabled nothing is formatted at all
+        if cls._event_sinks:
+            timestamp = time.time()
+            for sink in cls._event_sinks:
+                sink.write_event(event, fields, timestamp)
+
+        logger = cls.get_logger()
+        sampling = cls._sampling_filter
+        if sampling is not None and sampling.is_sampled(
+            event.split(".", 1)[0]
+        ):
+            # Sampled categories are counted even when their level is
+            # disabled, so they still appear in the summaries
+            log_event = LogEvent(event, fields)
+            if sampling.admit(log_event, logger.isEnabledFor(level)):
+                logger.log(level, log_event, extra={"event_sampled": True})
+        elif logger.isEnabledFor(level):
+            logger.log(level, LogEvent(event, fields))
+
     @staticmethod
     def _create_default_logger():
         # Create a default logger with console output
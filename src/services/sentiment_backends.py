@@ -0,0 +1,216 @@
+import logging
+import math
+import os
+import random
+import re
+import time
+
+from src.patterns.interfaces.sentiment_backend import (
+    SentimentBackend,
+    SentimentBackendError,
+    SentimentBackendThrottled,
+)
+
+GEMINI_MODEL_NAME = "gemini-1.5-flash"
+
+
+class GeminiBackend(SentimentBackend):
+    # Backend that sends prompts to the Google Gemini API
+
+    def __init__(self, model_name=GEMINI_MODEL_NAME, api_key=None):
+        self.logger = logging.getLogger("Social Media Simulator")
+        self._model_name = model_name
+        self.genai = None
+        self.model = None
+
+        try:
+            import google.generativeai as genai
+
+            api_key = api_key or os.getenv("GOOGLE_API_KEY")
+            if api_key:
+                genai.configure(api_key=api_key)
+                self.genai = genai
+                self.logger.info("Google Gemini API configured successfully")
+
+                # Set up the model
+                try:
+                    self.model = genai.GenerativeModel(model_name)
+                    self.logger.info(f"Using model: {model_name}")
+                except Exception as e:
+                    self.logger.error(
+                        f"Error initializing recommended model: {str(e)}"
+                    )
+                    self.genai = None
+            else:
+                self.logger.error(
+                    "Google API key not found in environment variables"
+                )
+        except ImportError:
+            self.logger.error("Google Generative AI package not available")
+
+    @property
+    def name(self):
+        return self._model_name
+
+    @property
+    def available(self):
+        return self.genai is not None and self.model is not None
+
+    def generate(self, prompt):
+        if not self.available:
+            raise SentimentBackendError("Google Gemini is not configured")
+
+        response = self.model.generate_content(prompt)
+        return response.text
+
+
+class FakeGeminiBackend(SentimentBackend):
+    # Local stand-in for Gemini used for offline benchmarking and load tests
+    # Latency, failures and throttling are all drawn from a seeded RNG so a
+    # run can be reproduced exactly
+
+    LATENCY_DISTRIBUTIONS = ("constant", "uniform", "normal", "lognormal")
+
+    LEFT_KEYWORDS = (
+        "progressive",
+        "liberal",
+        "socialism",
+        "equality",
+        "democrat",
+        "universal healthcare",
+        "climate",
+        "workers' rights",
+    )
+    RIGHT_KEYWORDS = (
+        "conservative",
+        "traditional",
+        "freedom",
+        "patriot",
+        "republican",
+        "border security",
+        "libs",
+        "tax cuts",
+    )
+
+    def __init__(
+        self,
+        seed=None,
+        latency_mean=0.0,
+        latency_stddev=0.0,
+        latency_distribution="constant",
+        error_rate=0.0,
+        throttle_rate=0.0,
+        retry_after=1.0,
+        noise=0.1,
+        sleep=time.sleep,
+    ):
+        if latency_distribution not in self.LATENCY_DISTRIBUTIONS:
+            raise ValueError(
+                f"Unknown latency distribution: {latency_distribution}"
+            )
+        if not 0.0 <= error_rate <= 1.0 or not 0.0 <= throttle_rate <= 1.0:
+            raise ValueError("Error and throttle rates must be in [0, 1]")
+
+        self.seed = seed
+        self.latency_mean = latency_mean
+        self.latency_stddev = latency_stddev
+        self.latency_distribution = latency_distribution
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.noise = noise
+        self._sleep = sleep
+        self._rng = random.Random(seed)
+        self.request_count = 0
+
+    @classmethod
+    def from_env(cls):
+        # Build a fake backend from FAKE_SENTIMENT_* environment variables
+        seed = os.getenv("FAKE_SENTIMENT_SEED")
+        return cls(
+            seed=int(seed) if seed is not None else None,
+            latency_mean=float(os.getenv("FAKE_SENTIMENT_LATENCY_MS", "0"))
+            / 1000,
+            latency_stddev=float(
+                os.getenv("FAKE_SENTIMENT_LATENCY_STDDEV_MS", "0")
+            )
+            / 1000,
+            latency_distribution=os.getenv(
+                "FAKE_SENTIMENT_LATENCY_DISTRIBUTION", "constant"
+            ),
+            error_rate=float(os.getenv("FAKE_SENTIMENT_ERROR_RATE", "0")),
+            throttle_rate=float(
+                os.getenv("FAKE_SENTIMENT_THROTTLE_RATE", "0")
+            ),
+        )
+
+    @property
+    def name(self):
+        return "fake-gemini"
+
+    def generate(self, prompt):
+        self.request_count += 1
+
+        # Draw everything up front so the RNG sequence does not depend on
+        # which branch is taken
+        latency = self._draw_latency()
+        roll = self._rng.random()
+        jitter = self._rng.uniform(-self.noise, self.noise)
+
+        if latency > 0:
+            self._sleep(latency)
+
+        if roll < self.throttle_rate:
+            raise SentimentBackendThrottled(
+                "429 Resource has been exhausted (fake backend)",
+                retry_after=self.retry_after,
+            )
+        if roll < self.throttle_rate + self.error_rate:
+            raise SentimentBackendError("500 Internal error (fake backend)")
+
+        score = self._score(self._extract_text(prompt)) + jitter
+        return f"{max(-1.0, min(1.0, score)):.2f}"
+
+    def _draw_latency(self):
+        mean = self.latency_mean
+        stddev = self.latency_stddev
+
+        if self.latency_distribution == "constant":
+            return mean
+        if self.latency_distribution == "uniform":
+            return self._rng.uniform(max(0.0, mean - stddev), mean + stddev)
+        if self.latency_distribution == "normal":
+            return max(0.0, self._rng.gauss(mean, stddev))
+
+        # lognormal: parameterised by the mean/stddev of the latency itself
+        if mean <= 0:
+            return 0.0
+        sigma_sq = math.log1p((stddev / mean) ** 2)
+        mu = math.log(mean) - sigma_sq / 2
+        return self._rng.lognormvariate(mu, sigma_sq**0.5)
+
+    def _extract_text(self, prompt):
+        match = re.search(
+            r"Text to analyze:(.*?)(?:Response \(|$)", prompt, re.DOTALL
+        )
+        return match.group(1).strip() if match else prompt
+
+    def _score(self, text):
+        text_lower = text.lower()
+        left = sum(1 for keyword in self.LEFT_KEYWORDS if keyword in text_lower)
+        right = sum(
+            1 for keyword in self.RIGHT_KEYWORDS if keyword in text_lower
+        )
+        return 0.35 * (right - left)
+
+
+def create_backend_from_env():
+    # Pick the backend named by SENTIMENT_BACKEND (defaults to Gemini)
+    backend_name = os.getenv("SENTIMENT_BACKEND", "gemini").lower()
+    if backend_name == "fake":
+        return FakeGeminiBackend.from_env()
+    if backend_name != "gemini":
+        logging.getLogger("Social Media Simulator").warning(
+            f"Unknown SENTIMENT_BACKEND '{backend_name}', using Gemini"
+        )
+    return GeminiBackend()
@@ -1,67 +1,150 @@
 import logging
-import os
 import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
-from dotenv import load_dotenv
+from src.patterns.interfaces.sentiment_backend import (
+    SentimentBackendThrottled,
+)
+from src.services.sentiment_backends import create_backend_from_env
 
 
 class SentimentService:
     # Service for analyzing sentiment of content using Google Gemini
 
-    def __init__(self):
-        self.logger = logging.getLogger("Social Media Simulator")
+    # Number of analysed texts kept in the result cache
+    CACHE_SIZE = 512
 
-        # Load environment variables
-        load_dotenv()
+    # Worker threads used for background (speculative) analysis
+    MAX_WORKERS = 2
 
-        # Initialize Google Gemini API
-        try:
-            import google.generativeai as genai
-
-            api_key = os.getenv("GOOGLE_API_KEY")
-            if api_key:
-                genai.configure(api_key=api_key)
-                self.genai = genai
-                self.logger.info("Google Gemini API configured successfully")
-
-                # Set up the model
-                try:
-                    self.model = genai.GenerativeModel("gemini-1.5-flash")
-                    self.logger.info("Using model: gemini-1.5-flash")
-                except Exception as e:
-                    self.logger.error(
-                        f"Error initializing recommended model: {str(e)}"
+    # Singleton pattern, shared by every controller in the process
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = SentimentService()
+        return cls._instance
+
+    def __init__(self, backend=None):
+        self.logger = logging.getLogger("Social Media Simulator")
+
+        # The backend (and its client connection) is created on first use
+        # and then reused for every request
+        self._backend = backend
+        self._backend_lock = threading.Lock()
+        self.init_time = 0.0 if backend else None
+
+        # LRU cache of successful results keyed by normalised content
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+        # Executor for background analysis, started on first use
+        self._executor = None
+        self._executor_lock = threading.Lock()
+
+    @property
+    def backend(self):
+        if self._backend is None:
+            with self._backend_lock:
+                if self._backend is None:
+                    started = time.perf_counter()
+
+                    # Load environment variables (imported here to keep
+                    # dotenv off the startup path)
+                    from dotenv import load_dotenv
+
+                    load_dotenv()
+
+                    # Use the backend selected by SENTIMENT_BACKEND
+                    backend = create_backend_from_env()
+                    self.init_time = time.perf_counter() - started
+                    self.logger.info(
+                        f"Sentiment backend '{backend.name}' initialized in "
+                        f"{self.init_time * 1000:.1f} ms"
                     )
-                    self.genai = None
-            else:
-                self.logger.error(
-                    "Google API key not found in environment variables"
-                )
-                self.genai = None
-        except ImportError:
-            self.logger.error("Google Generative AI package not available")
-            self.genai = None
+                    self._backend = backend
+        return self._backend
+
+    @property
+    def is_initialized(self):
+        return self._backend is not None
+
+    @property
+    def executor(self):
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.MAX_WORKERS,
+                        thread_name_prefix="sentiment",
+                    )
+        return self._executor
+
+    def shutdown(self):
+        # Stop the worker threads, dropping analyses that have not started
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
 
     def analyze_sentiment(self, content):
         # Analyze political sentiment: -1.0 (left) to 1.0 (right)
+        cached = self.get_cached_sentiment(content)
+        if cached is not None:
+            self.logger.debug(f"Sentiment cache hit for: '{content}'")
+            return cached
+
         self.logger.info(f"Analyzing sentiment for: '{content}'")
 
-        result = self.analyze_with_gemini(content)
+        result = self._score_with_gemini(content)
+        if result is None:
+            # Failures are not cached so the next request retries
+            result = 0.0
+        else:
+            self._store_cached_sentiment(content, result)
         self.logger.info(f"Gemini sentiment analysis result: {result}")
 
         return result
 
+    def get_cached_sentiment(self, content):
+        # Return the cached score for content, or None if not analysed yet
+        key = content.strip()
+        with self._cache_lock:
+            if key not in self._cache:
+                return None
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+    def _store_cached_sentiment(self, content, value):
+        key = content.strip()
+        with self._cache_lock:
+            self._cache[key] = value
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
+
+    def clear_cache(self):
+        with self._cache_lock:
+            self._cache.clear()
+
     def analyze_with_gemini(self, content):
-        # Check if Gemini is available
-        if (
-            not hasattr(self, "genai")
-            or not self.genai
-            or not hasattr(self, "model")
-        ):
+        result = self._score_with_gemini(content)
+        return 0.0 if result is None else result
+
+    def _score_with_gemini(self, content):
+        # Ask the backend for a score, returning None if analysis failed
+        if not self.backend.available:
             self.logger.error(
                 "Google Gemini not available for sentiment analysis"
             )
-            return 0.0
+            return None
 
         try:
             # Create prompt for political sentiment analysis
@@ -82,8 +165,7 @@ class SentimentService:
             """
 
             # Get response from model
-            response = self.model.generate_content(prompt)
-            response_text = response.text
+            response_text = self.backend.generate(prompt)
 
             self.logger.info(f"Gemini raw response: {response_text}")
 
@@ -101,10 +183,15 @@ class SentimentService:
                 self.logger.error(
                     f"Could not extract sentiment value from response: {response_text}"
                 )
-                return 0.0
+                return None
 
+        except SentimentBackendThrottled as e:
+            self.logger.warning(
+                f"Gemini sentiment analysis throttled: {str(e)}"
+            )
+            return None
         except Exception as e:
             self.logger.error(
                 f"Error during Gemini sentiment analysis: {str(e)}"
             )
-            return 0.0
+            return None
@@ -0,0 +1,512 @@
+import gc
+import itertools
+import json
+import logging
+import os
+import random
+import sys
+import threading
+import time
+import zipfile
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from operator import attrgetter
+
+from src.models.company import Company
+from src.models.follower import Follower
+from src.models.post import (
+    SENTIMENT_CODES,
+    SENTIMENTS,
+    Comment,
+    Post,
+    Sentiment,
+)
+from src.models.user import User
+from src.patterns.decorator.base_user import BaseUser
+from src.patterns.decorator.sponsered_user import SponsoredUser
+from src.patterns.decorator.verified_user import VerifiedUser
+from src.patterns.interfaces.user_decorator import UserDecorator
+from src.services.logger_service import LoggerService
+
+SNAPSHOT_FORMAT = "social-media-simulator-snapshot"
+SNAPSHOT_VERSION = 1
+
+MANIFEST_NAME = "manifest.json"
+STATE_NAME = "state.json"
+
+# User decorators by the name stored in snapshots, innermost first
+DECORATORS = {
+    "base": BaseUser,
+    "verified": VerifiedUser,
+    "sponsored": SponsoredUser,
+}
+
+# Decorator-specific fields saved with each layer
+_DECORATOR_FIELDS = {
+    SponsoredUser: ("company_name",),
+}
+
+# Private User fields saved with the user, read through any decorators
+_USER_FIELDS = (
+    "_follower_count",
+    "_recent_follower_losses",
+    "_last_reputation_check",
+    "_profile_picture_path",
+)
+
+# Private Post fields saved with each post
+_POST_FIELDS = (
+    "likes",
+    "shares",
+    "followers_gained",
+    "followers_lost",
+    "is_spam",
+    "is_valid",
+)
+
+
+class Snapshot:
+    # Simulation state captured in memory, ready to be written.
+    #
+    # state holds the small, nested parts (user, posts, companies, RNG) as
+    # JSON-compatible data. columns holds followers and comments one column
+    # per field: array.array for numbers, lists for strings
+
+    def __init__(self, state, columns):
+        self.state = state
+        self.columns = columns
+
+    @property
+    def follower_count(self):
+        return len(self.columns["followers.id"])
+
+    @property
+    def comment_count(self):
+        return len(self.columns["comments.post"])
+
+
+def _user_layers(user):
+    # Decorators around the base user, outermost first, and the base user
+    layers = []
+    while isinstance(user, UserDecorator):
+        layers.append(user)
+        user = user._user
+    return layers, user
+
+
+def _decorator_name(layer):
+    for name, decorator in DECORATORS.items():
+        if type(layer) is decorator:
+            return name
+    raise ValueError(
+        f"Cannot snapshot user decorator {type(layer).__name__}"
+    )
+
+
+def _capture_user(user):
+    layers, base = _user_layers(user)
+    decorators = []
+    for layer in reversed(layers):
+        entry = {"type": _decorator_name(layer)}
+        for field in _DECORATOR_FIELDS.get(type(layer), ()):
+            entry[field] = getattr(layer, field)
+        # Sponsorship strikes are stored on whichever layer was checked
+        if "_misaligned_posts" in vars(layer):
+            entry["misaligned_posts"] = layer._misaligned_posts
+        decorators.append(entry)
+
+    fields = {name: getattr(user, name) for name in _USER_FIELDS}
+    fields["_misaligned_posts"] = vars(base).get("_misaligned_posts")
+    return {
+        "handle": base.handle,
+        "bio": base.bio,
+        "fields": fields,
+        "decorators": decorators,
+    }
+
+
+def _capture_posts(posts, columns):
+    post_states = []
+    comment_post = columns["comments.post"]
+    comment_sentiment = columns["comments.sentiment"]
+    comment_timestamp = columns["comments.timestamp"]
+    comment_content = columns["comments.content"]
+    comment_author = columns["comments.author"]
+
+    for index, post in enumerate(posts):
+        post_state = {
+            "post_id": post.post_id,
+            "content": post.content,
+            "image_path": post.image_path,
+            "timestamp": post.timestamp.timestamp(),
+            "sentiment": post.sentiment.name,
+        }
+        post_state.update((name, getattr(post, name)) for name in _POST_FIELDS)
+        post_states.append(post_state)
+
+        for comment in post.comments_page(0, post.comment_count):
+            comment_post.append(index)
+            comment_sentiment.append(SENTIMENT_CODES[id(comment.sentiment)])
+            comment_timestamp.append(comment.timestamp.timestamp())
+            comment_content.append(comment.content)
+            # Comments by followers store their handle; any other author
+            # is the user and stored as None
+            author = comment.author
+            comment_author.append(author if isinstance(author, str) else None)
+    return post_states
+
+
+def _capture_companies(company_service, user):
+    if company_service is None:
+        return None
+    layers, base = _user_layers(user)
+    own = {id(layer) for layer in layers} | {id(base)}
+    return [
+        {
+            "name": company.name,
+            "description": company.description,
+            "logo_path": company.logo_path,
+            "political_leaning": company.political_leaning.name,
+            # Only this user can be sponsored in the simulation
+            "sponsors_user": any(
+                id(sponsored) in own for sponsored in company.sponsored_users
+            ),
+        }
+        for company in company_service.companies
+    ]
+
+
+def capture_snapshot(user, company_service=None, journal_seq=0):
+    # Copy the simulation state into a Snapshot. Call on the thread that
+    # owns the models; writing the snapshot can then happen anywhere.
+    # journal_seq is the last journal record the state includes (see
+    # services/journal)
+    # Read the fields directly rather than through properties, as this
+    # runs once per follower
+    followers = user.followers
+    columns = {
+        "followers.id": array(
+            "q", map(attrgetter("_follower_id"), followers)
+        ),
+        "followers.sentiment": array(
+            "b",
+            map(
+                SENTIMENT_CODES.__getitem__,
+                map(id, map(attrgetter("_sentiment"), followers)),
+            ),
+        ),
+        "followers.political_lean": array(
+            "b", map(attrgetter("_political_lean"), followers)
+        ),
+        "followers.handle": list(map(attrgetter("_handle"), followers)),
+        "comments.post": array("i"),
+        "comments.sentiment": array("b"),
+        "comments.timestamp": array("d"),
+        "comments.content": [],
+        "comments.author": [],
+    }
+
+    rng_version, rng_state, rng_gauss = random.getstate()
+    state = {
+        "user": _capture_user(user),
+        "posts": _capture_posts(user.posts, columns),
+        "companies": _capture_companies(company_service, user),
+        "rng": [rng_version, list(rng_state), rng_gauss],
+        "journal_seq": journal_seq,
+    }
+    return Snapshot(state, columns)
+
+
+def _column_bytes(values):
+    # Arrays are stored little-endian whatever the host byte order
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def write_snapshot(snapshot, path, compresslevel=1):
+    # Write a captured Snapshot to path as a zip archive: a manifest, the
+    # JSON state and one compressed member per column. The file is
+    # replaced atomically so a crash never leaves a half-written snapshot
+    start = time.perf_counter()
+    manifest = {
+        "format": SNAPSHOT_FORMAT,
+        "version": SNAPSHOT_VERSION,
+        "created": datetime.now().isoformat(),
+        "journal_seq": snapshot.state.get("journal_seq", 0),
+        "counts": {
+            "followers": snapshot.follower_count,
+            "posts": len(snapshot.state["posts"]),
+            "comments": snapshot.comment_count,
+        },
+        "columns": {},
+    }
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_path = f"{path}.tmp"
+    with zipfile.ZipFile(
+        temp_path,
+        "w",
+        compression=zipfile.ZIP_DEFLATED,
+        compresslevel=compresslevel,
+    ) as archive:
+        archive.writestr(STATE_NAME, json.dumps(snapshot.state))
+        for name, values in snapshot.columns.items():
+            if isinstance(values, array):
+                member = f"columns/{name}.bin"
+                archive.writestr(member, _column_bytes(values))
+                manifest["columns"][name] = {
+                    "member": member,
+                    "type": values.typecode,
+                    "length": len(values),
+                }
+            else:
+                member = f"columns/{name}.json"
+                archive.writestr(member, json.dumps(values))
+                manifest["columns"][name] = {
+                    "member": member,
+                    "type": "str",
+                    "length": len(values),
+                }
+        archive.writestr(MANIFEST_NAME, json.dumps(manifest, indent=2))
+    os.replace(temp_path, path)
+
+    LoggerService.log_event(
+        "snapshot.saved",
+        logging.INFO,
+        path=path,
+        followers=snapshot.follower_count,
+        comments=snapshot.comment_count,
+        seconds=round(time.perf_counter() - start, 3),
+    )
+
+
+def save_snapshot(path, user, company_service=None, journal_seq=0):
+    # Capture and write the simulation state in one go
+    snapshot = capture_snapshot(user, company_service, journal_seq)
+    write_snapshot(snapshot, path)
+    return snapshot
+
+
+def read_manifest(path):
+    # Read and check a snapshot's manifest
+    with zipfile.ZipFile(path) as archive:
+        return _read_manifest(archive)
+
+
+def _read_manifest(archive):
+    try:
+        manifest = json.loads(archive.read(MANIFEST_NAME))
+    except KeyError as e:
+        raise ValueError("Not a simulation snapshot: no manifest") from e
+    if manifest.get("format") != SNAPSHOT_FORMAT:
+        raise ValueError("Not a simulation snapshot")
+    if manifest.get("version") != SNAPSHOT_VERSION:
+        raise ValueError(
+            f"Unsupported snapshot version {manifest.get('version')} "
+            f"(expected {SNAPSHOT_VERSION})"
+        )
+    return manifest
+
+
+def _read_column(archive, info):
+    data = archive.read(info["member"])
+    if info["type"] == "str":
+        values = json.loads(data)
+    else:
+        values = array(info["type"])
+        values.frombytes(data)
+        if sys.byteorder == "big":
+            values.byteswap()
+    if len(values) != info["length"]:
+        raise ValueError(f"Snapshot column {info['member']} is truncated")
+    return values
+
+
+def _advance_ids(cls, last_id):
+    # Make sure ids handed out after loading do not repeat saved ones
+    next_id = next(cls._ids)
+    cls._ids = itertools.count(max(next_id, last_id + 1))
+
+
+def _restore_user(state, followers):
+    base = User(state["handle"], state["bio"])
+    for name, value in state["fields"].items():
+        if value is not None:
+            setattr(base, name, value)
+    base._followers = followers
+    base._observers = list(followers)
+
+    user = base
+    for entry in state["decorators"]:
+        decorator = DECORATORS.get(entry["type"])
+        if decorator is None:
+            raise ValueError(f"Unknown user decorator {entry['type']!r}")
+        fields = _DECORATOR_FIELDS.get(decorator, ())
+        user = decorator(user, *(entry[field] for field in fields))
+        if entry.get("misaligned_posts") is not None:
+            user._misaligned_posts = entry["misaligned_posts"]
+    return user
+
+
+def _restore_posts(post_states, columns, user):
+    comments = [[] for _ in post_states]
+    for post_index, sentiment, timestamp, content, author in zip(
+        columns["comments.post"],
+        columns["comments.sentiment"],
+        columns["comments.timestamp"],
+        columns["comments.content"],
+        columns["comments.author"],
+    ):
+        comments[post_index].append(
+            Comment._restore(
+                content,
+                SENTIMENTS[sentiment],
+                user if author is None else author,
+                datetime.fromtimestamp(timestamp),
+            )
+        )
+
+    posts = []
+    for post_state, post_comments in zip(post_states, comments):
+        posts.append(
+            Post._restore(
+                post_state["post_id"],
+                post_state["content"],
+                user,
+                post_state["image_path"],
+                timestamp=datetime.fromtimestamp(post_state["timestamp"]),
+                sentiment=Sentiment[post_state["sentiment"]],
+                comments=post_comments,
+                **{name: post_state[name] for name in _POST_FIELDS},
+            )
+        )
+    return posts
+
+
+def _restore_companies(company_states, company_service, user):
+    companies = []
+    for company_state in company_states:
+        company = Company(
+            company_state["name"],
+            company_state["description"],
+            company_state["logo_path"],
+            Sentiment[company_state["political_leaning"]],
+        )
+        if company_state["sponsors_user"]:
+            company.sponsor_user(user)
+        companies.append(company)
+    company_service._companies = companies
+
+
+def load_snapshot(path, company_service=None):
+    # Load a snapshot and return the restored (decorated) user. Company
+    # sponsorships are restored into company_service if given, and the
+    # random module's state is restored so the simulation carries on
+    # exactly where it was saved
+    start = time.perf_counter()
+    with zipfile.ZipFile(path) as archive:
+        manifest = _read_manifest(archive)
+        state = json.loads(archive.read(STATE_NAME))
+        columns = {
+            name: _read_column(archive, info)
+            for name, info in manifest["columns"].items()
+        }
+
+    # Creating a million objects triggers many pointless collections
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        followers = Follower._restore_batch(
+            columns["followers.id"],
+            columns["followers.handle"],
+            [SENTIMENTS[code] for code in columns["followers.sentiment"]],
+            columns["followers.political_lean"],
+        )
+        user = _restore_user(state["user"], followers)
+        posts = _restore_posts(state["posts"], columns, user)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    _, base = _user_layers(user)
+    base._posts = posts
+    if followers:
+        _advance_ids(Follower, max(columns["followers.id"]))
+    if posts:
+        _advance_ids(Post, max(post.post_id for post in posts))
+
+    if company_service is not None and state.get("companies") is not None:
+        _restore_companies(state["companies"], company_service, user)
+
+    rng_version, rng_state, rng_gauss = state["rng"]
+    random.setstate((rng_version, tuple(rng_state), rng_gauss))
+
+    LoggerService.log_event(
+        "snapshot.loaded",
+        logging.INFO,
+        path=path,
+        followers=len(followers),
+        comments=manifest["counts"]["comments"],
+        seconds=round(time.perf_counter() - start, 3),
+    )
+    return user
+
+
+class Autosaver:
+    # Saves snapshots periodically without blocking the caller.
+    #
+    # save_async() captures the state on the calling thread (the models
+    # are not thread-safe) and compresses and writes it on a background
+    # thread. A capture made while a write is running replaces any one
+    # still waiting, so a slow disk never builds up a queue. on_saved, if
+    # given, is called with each snapshot after it is written, on the
+    # writer thread
+
+    def __init__(self, path, capture, on_saved=None):
+        self.path = path
+        self._capture = capture
+        self._on_saved = on_saved
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="snapshot-autosave"
+        )
+        self._lock = threading.Lock()
+        self._pending = None
+        self._writing = False
+        self.save_count = 0
+
+    def save_async(self):
+        # Capture now and write in the background
+        snapshot = self._capture()
+        with self._lock:
+            self._pending = snapshot
+            if not self._writing:
+                self._writing = True
+                self._executor.submit(self._write_pending)
+
+    def wait(self):
+        # Block until every captured snapshot has been written
+        self._executor.submit(lambda: None).result()
+
+    def shutdown(self):
+        # Write the last captured snapshot and stop the writer thread
+        self._executor.shutdown(wait=True)
+
+    def _write_pending(self):
+        while True:
+            with self._lock:
+                snapshot, self._pending = self._pending, None
+                if snapshot is None:
+                    self._writing = False
+                    return
+            try:
+                write_snapshot(snapshot, self.path)
+                self.save_count += 1
+                if self._on_saved is not None:
+                    self._on_saved(snapshot)
+            except Exception as e:
+                LoggerService.get_logger().error(f"Autosave failed: {e}")
@@ -0,0 +1,544 @@
+import itertools
+import os
+import sqlite3
+import threading
+import time
+from enum import Enum
+
+from src.models.follower import Follower
+from src.models.post import Post
+from src.patterns.interfaces.event_sink import EventSink
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS posts (
+    post_id INTEGER PRIMARY KEY,
+    author TEXT,
+    content TEXT,
+    sentiment TEXT,
+    has_image INTEGER NOT NULL DEFAULT 0,
+    likes INTEGER NOT NULL DEFAULT 0,
+    shares INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS posts_by_author ON posts (author, created_at);
+CREATE INDEX IF NOT EXISTS posts_by_time ON posts (created_at);
+CREATE INDEX IF NOT EXISTS posts_by_sentiment ON posts (sentiment, created_at);
+
+CREATE TABLE IF NOT EXISTS followers (
+    follower_id INTEGER PRIMARY KEY,
+    user TEXT,
+    handle TEXT NOT NULL,
+    sentiment TEXT,
+    political_lean INTEGER,
+    post_id INTEGER,
+    followed_at REAL NOT NULL,
+    unfollowed_at REAL
+);
+CREATE INDEX IF NOT EXISTS followers_by_handle ON followers (handle);
+CREATE INDEX IF NOT EXISTS followers_by_lean ON followers (political_lean);
+CREATE INDEX IF NOT EXISTS followers_by_sentiment
+    ON followers (unfollowed_at, sentiment);
+
+CREATE TABLE IF NOT EXISTS comments (
+    comment_id INTEGER PRIMARY KEY,
+    post_id INTEGER NOT NULL,
+    author TEXT,
+    content TEXT,
+    sentiment TEXT,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS comments_by_post ON comments (post_id, created_at);
+CREATE INDEX IF NOT EXISTS comments_by_author ON comments (author);
+
+CREATE TABLE IF NOT EXISTS interactions (
+    interaction_id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    follower TEXT,
+    post_id INTEGER,
+    author TEXT,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS interactions_by_post
+    ON interactions (post_id, kind);
+CREATE INDEX IF NOT EXISTS interactions_by_follower
+    ON interactions (follower);
+
+CREATE TABLE IF NOT EXISTS sponsorships (
+    sponsorship_id INTEGER PRIMARY KEY,
+    user TEXT,
+    company TEXT NOT NULL,
+    started_at REAL NOT NULL,
+    ended_at REAL
+);
+CREATE INDEX IF NOT EXISTS sponsorships_by_company
+    ON sponsorships (company, ended_at);
+"""
+
+_INSERT_POST = (
+    "INSERT INTO posts "
+    "(post_id, author, content, sentiment, has_image, created_at) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+_INSERT_FOLLOWER = (
+    "INSERT INTO followers "
+    "(follower_id, user, handle, sentiment, political_lean, post_id, "
+    "followed_at) VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+_REMOVE_FOLLOWER = (
+    "UPDATE followers SET unfollowed_at = ?, political_lean = ? "
+    "WHERE follower_id = ?"
+)
+_ADJUST_LEAN = (
+    "UPDATE followers SET political_lean = ? WHERE follower_id = ?"
+)
+_INSERT_COMMENT = (
+    "INSERT INTO comments (post_id, author, content, sentiment, created_at) "
+    "VALUES (?, ?, ?, ?, ?)"
+)
+_REMOVE_COMMENT = (
+    "DELETE FROM comments WHERE comment_id = ("
+    "SELECT MIN(comment_id) FROM comments WHERE post_id = ? "
+    "AND author IS ? AND content = ? AND created_at = ?)"
+)
+_INSERT_INTERACTION = (
+    "INSERT INTO interactions (kind, follower, post_id, author, created_at) "
+    "VALUES (?, ?, ?, ?, ?)"
+)
+_START_SPONSORSHIP = (
+    "INSERT INTO sponsorships (user, company, started_at) VALUES (?, ?, ?)"
+)
+_END_SPONSORSHIP = (
+    "UPDATE sponsorships SET ended_at = ? "
+    "WHERE company = ? AND ended_at IS NULL"
+)
+
+_SYNC_POST = (
+    "INSERT INTO posts (post_id, author, content, sentiment, has_image, "
+    "likes, shares, created_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT (post_id) DO UPDATE SET content = excluded.content, "
+    "sentiment = excluded.sentiment, likes = excluded.likes, "
+    "shares = excluded.shares"
+)
+_END_ALL_FOLLOWERS = (
+    "UPDATE followers SET unfollowed_at = ? WHERE unfollowed_at IS NULL"
+)
+_SYNC_FOLLOWER = (
+    "INSERT INTO followers "
+    "(follower_id, user, handle, sentiment, political_lean, followed_at) "
+    "VALUES (?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT (follower_id) DO UPDATE SET "
+    "political_lean = excluded.political_lean, unfollowed_at = NULL"
+)
+_CLEAR_COMMENTS = "DELETE FROM comments WHERE post_id = ?"
+_SET_ENGAGEMENT = "UPDATE posts SET likes = ?, shares = ? WHERE post_id = ?"
+
+
+def _next_id(cls):
+    # Id the model class hands out next, without using it up
+    next_id = next(cls._ids)
+    cls._ids = itertools.count(next_id)
+    return next_id
+
+
+def _comment_author(author):
+    # Follower handles are kept; other authors mean the user, as in the
+    # post.comment_added event
+    return author if isinstance(author, str) else None
+
+
+def _value(value):
+    # Enums (sentiments) are stored by name
+    return value.name if isinstance(value, Enum) else value
+
+
+class SQLiteRepository(EventSink):
+    # Optional SQLite store of posts, followers, comments, interactions and
+    # sponsorships, with indexes for the usual lookups.
+    #
+    # It is fed by the structured events the controllers, commands and
+    # models already record (see LoggerService.add_event_sink), so the
+    # controller APIs stay the only write path; sync brings it in line
+    # with a restored world when it is opened. The views answer comment
+    # pages and follower breakdowns from the repository registered with
+    # set_instance, when there is one. Writes are queued and applied in
+    # one transaction per batch_size events; queries flush the queue first
+    # so they always see every recorded event
+
+    DEFAULT_BATCH_SIZE = 500
+
+    # Repository the views query, or None to use the in-memory models
+    _instance = None
+
+    @classmethod
+    def get_instance(cls):
+        return cls._instance
+
+    @classmethod
+    def set_instance(cls, repository):
+        cls._instance = repository
+
+    def __init__(self, path, batch_size=DEFAULT_BATCH_SIZE):
+        self.path = path
+        self.batch_size = batch_size
+
+        directory = os.path.dirname(path) if path != ":memory:" else ""
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # Events can arrive from worker threads, so the connection is
+        # shared and guarded by the lock
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.row_factory = sqlite3.Row
+        if path != ":memory:":
+            self._connection.execute("PRAGMA journal_mode = WAL")
+            self._connection.execute("PRAGMA synchronous = NORMAL")
+        self._connection.executescript(SCHEMA)
+
+        self._lock = threading.Lock()
+        self._pending = []
+        self.event_count = 0
+        self.transaction_count = 0
+
+    @classmethod
+    def from_env(cls):
+        # Build a repository from SQLITE_PATH, or None if it is not set
+        path = os.getenv("SQLITE_PATH")
+        if not path:
+            return None
+        batch_size = os.getenv("SQLITE_BATCH_SIZE")
+        return cls(
+            path,
+            batch_size=(
+                int(batch_size) if batch_size else cls.DEFAULT_BATCH_SIZE
+            ),
+        )
+
+    def check_ids(self):
+        # Raise ValueError if the database already holds posts or
+        # followers with ids this process will hand out. Ids restart at 1
+        # in every run, so a database can only be reused by the world it
+        # recorded, resumed from a snapshot
+        for table, column, cls in (
+            ("posts", "post_id", Post),
+            ("followers", "follower_id", Follower),
+        ):
+            last_id = self._query(
+                f"SELECT MAX({column}) AS last_id FROM {table}"
+            )[0]["last_id"]
+            if last_id is not None and last_id >= _next_id(cls):
+                raise ValueError(
+                    f"{self.path} already has {table} up to id {last_id} "
+                    "from another run; resume that run from its snapshot "
+                    "or use a new database"
+                )
+
+    def sync(self, user):
+        # Make the posts, followers and comments match the in-memory world.
+        # Worlds restored from a snapshot or replayed from the journal are
+        # not logged as events, and a crash loses the last uncommitted
+        # batch, so this runs when the repository is opened. Followers the
+        # user no longer has are marked as unfollowed now
+        now = time.time()
+        posts = user.posts
+        with self._lock:
+            self._write_pending()
+            with self._connection:
+                self._connection.executemany(
+                    _SYNC_POST,
+                    [
+                        (
+                            post.post_id,
+                            user.handle,
+                            post.content,
+                            _value(post.sentiment),
+                            int(bool(post.image_path)),
+                            post.likes,
+                            post.shares,
+                            post.timestamp.timestamp(),
+                        )
+                        for post in posts
+                    ],
+                )
+                self._connection.execute(_END_ALL_FOLLOWERS, (now,))
+                self._connection.executemany(
+                    _SYNC_FOLLOWER,
+                    [
+                        (
+                            follower.follower_id,
+                            user.handle,
+                            follower.handle,
+                            _value(follower.sentiment),
+                            follower.political_lean,
+                            now,
+                        )
+                        for follower in user.followers
+                    ],
+                )
+                self._connection.executemany(
+                    _CLEAR_COMMENTS, [(post.post_id,) for post in posts]
+                )
+                self._connection.executemany(
+                    _INSERT_COMMENT,
+                    [
+                        (
+                            post.post_id,
+                            _comment_author(comment.author),
+                            comment.content,
+                            _value(comment.sentiment),
+                            comment.timestamp.timestamp(),
+                        )
+                        for post in posts
+                        for comment in post.comments
+                    ],
+                )
+            self.transaction_count += 1
+
+    def write_event(self, event, fields, timestamp):
+        statements = self._statements(event, fields, timestamp)
+        if not statements:
+            return
+
+        with self._lock:
+            self._pending.extend(statements)
+            self.event_count += 1
+            if len(self._pending) >= self.batch_size:
+                self._write_pending()
+
+    def flush(self):
+        with self._lock:
+            self._write_pending()
+
+    def close(self):
+        if SQLiteRepository._instance is self:
+            SQLiteRepository.set_instance(None)
+        with self._lock:
+            self._write_pending()
+            self._connection.close()
+
+    def _statements(self, event, fields, timestamp):
+        # SQL statements recording one event, or None to ignore it
+        get = fields.get
+        if event == "post.created":
+            return [
+                (
+                    _INSERT_POST,
+                    (
+                        get("post_id"),
+                        get("user"),
+                        get("content"),
+                        _value(get("sentiment")),
+                        int(bool(get("has_image"))),
+                        timestamp,
+                    ),
+                )
+            ]
+        if event == "post.engagement_changed":
+            # Absolute counters, so bulk changes and undos need no
+            # arithmetic here
+            return [
+                (
+                    _SET_ENGAGEMENT,
+                    (get("likes"), get("shares"), get("post_id")),
+                )
+            ]
+        if event == "follower.added":
+            return [
+                (
+                    _INSERT_FOLLOWER,
+                    (
+                        get("follower_id"),
+                        get("user"),
+                        get("handle"),
+                        _value(get("sentiment")),
+                        get("political_lean"),
+                        get("post_id"),
+                        timestamp,
+                    ),
+                )
+            ]
+        if event == "follower.removed":
+            return [
+                (
+                    _REMOVE_FOLLOWER,
+                    (
+                        timestamp,
+                        get("political_lean"),
+                        get("follower_id"),
+                    ),
+                )
+            ]
+        if event == "follower.lean_adjusted":
+            return [(_ADJUST_LEAN, (get("new_lean"), get("follower_id")))]
+        if event == "post.comment_added":
+            return [
+                (
+                    _INSERT_COMMENT,
+                    (
+                        get("post_id"),
+                        get("author"),
+                        get("content"),
+                        _value(get("sentiment")),
+                        get("timestamp").timestamp(),
+                    ),
+                )
+            ]
+        if event == "post.comment_removed":
+            return [
+                (
+                    _REMOVE_COMMENT,
+                    (
+                        get("post_id"),
+                        get("author"),
+                        get("content"),
+                        get("timestamp").timestamp(),
+                    ),
+                )
+            ]
+        if event == "sponsorship.started":
+            return [
+                (_START_SPONSORSHIP, (get("user"), get("company"), timestamp))
+            ]
+        if event == "sponsorship.ended":
+            return [(_END_SPONSORSHIP, (timestamp, get("company")))]
+        if not event.startswith("interaction."):
+            return None
+
+        return [
+            (
+                _INSERT_INTERACTION,
+                (
+                    event[len("interaction.") :],
+                    get("follower"),
+                    get("post_id"),
+                    get("author"),
+                    timestamp,
+                ),
+            )
+        ]
+
+    def _write_pending(self):
+        if not self._pending:
+            return
+
+        pending, self._pending = self._pending, []
+        with self._connection:
+            # Runs of the same statement go through executemany
+            start = 0
+            while start < len(pending):
+                sql = pending[start][0]
+                end = start + 1
+                while end < len(pending) and pending[end][0] == sql:
+                    end += 1
+                self._connection.executemany(
+                    sql, [params for _, params in pending[start:end]]
+                )
+                start = end
+        self.transaction_count += 1
+
+    def _query(self, sql, params=()):
+        with self._lock:
+            self._write_pending()
+            return [
+                dict(row) for row in self._connection.execute(sql, params)
+            ]
+
+    # Queries
+
+    def post(self, post_id):
+        rows = self._query("SELECT * FROM posts WHERE post_id = ?", (post_id,))
+        return rows[0] if rows else None
+
+    def posts_by_author(self, author, limit=None):
+        # Newest first
+        return self._query(
+            "SELECT * FROM posts WHERE author = ? "
+            "ORDER BY created_at DESC LIMIT ?",
+            (author, -1 if limit is None else limit),
+        )
+
+    def posts_between(self, start, end):
+        # Posts created in [start, end), as Unix timestamps, oldest first
+        return self._query(
+            "SELECT * FROM posts WHERE created_at >= ? AND created_at < ? "
+            "ORDER BY created_at",
+            (start, end),
+        )
+
+    def posts_by_sentiment(self, sentiment, limit=None):
+        return self._query(
+            "SELECT * FROM posts WHERE sentiment = ? "
+            "ORDER BY created_at DESC LIMIT ?",
+            (_value(sentiment), -1 if limit is None else limit),
+        )
+
+    def follower_by_handle(self, handle):
+        rows = self._query(
+            "SELECT * FROM followers WHERE handle = ? "
+            "ORDER BY followed_at DESC LIMIT 1",
+            (handle,),
+        )
+        return rows[0] if rows else None
+
+    def followers_by_lean(self, low, high, current=True):
+        # Followers with low <= political_lean <= high
+        return self._query(
+            "SELECT * FROM followers WHERE political_lean BETWEEN ? AND ? "
+            + ("AND unfollowed_at IS NULL " if current else "")
+            + "ORDER BY political_lean",
+            (low, high),
+        )
+
+    def follower_count(self, current=True):
+        return self._query(
+            "SELECT COUNT(*) AS count FROM followers"
+            + (" WHERE unfollowed_at IS NULL" if current else "")
+        )[0]["count"]
+
+    def follower_sentiment_counts(self):
+        # Current followers per sentiment name
+        return {
+            row["sentiment"]: row["count"]
+            for row in self._query(
+                "SELECT sentiment, COUNT(*) AS count FROM followers "
+                "WHERE unfollowed_at IS NULL GROUP BY sentiment"
+            )
+        }
+
+    def comments_for_post(self, post_id, start=0, limit=None):
+        # Oldest first, like Post.comments; start and limit give a page
+        return self._query(
+            "SELECT * FROM comments WHERE post_id = ? "
+            "ORDER BY created_at, comment_id LIMIT ? OFFSET ?",
+            (post_id, -1 if limit is None else limit, start),
+        )
+
+    def comment_count(self, post_id):
+        return self._query(
+            "SELECT COUNT(*) AS count FROM comments WHERE post_id = ?",
+            (post_id,),
+        )[0]["count"]
+
+    def comments_by_author(self, author):
+        return self._query(
+            "SELECT * FROM comments WHERE author = ? ORDER BY created_at",
+            (author,),
+        )
+
+    def interactions_for_post(self, post_id, kind=None):
+        if kind is None:
+            return self._query(
+                "SELECT * FROM interactions WHERE post_id = ? "
+                "ORDER BY interaction_id",
+                (post_id,),
+            )
+        return self._query(
+            "SELECT * FROM interactions WHERE post_id = ? AND kind = ? "
+            "ORDER BY interaction_id",
+            (post_id, kind),
+        )
+
+    def active_sponsorships(self):
+        return self._query(
+            "SELECT * FROM sponsorships WHERE ended_at IS NULL "
+            "ORDER BY started_at"
+        )
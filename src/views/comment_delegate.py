@@ -0,0 +1,125 @@
+from PyQt6.QtCore import QRect, QSize, Qt
+from PyQt6.QtGui import QColor, QFont, QFontMetrics, QPen
+from PyQt6.QtWidgets import QStyledItemDelegate
+
+from src.views.comment_list_model import CommentListModel
+from src.views.style_manager import THEME_PALETTES, StyleManager
+from src.views.text_layout_cache import TextLayoutCache
+
+
+class CommentDelegate(QStyledItemDelegate):
+    """Paints comments without creating widgets per comment"""
+
+    MARGIN = 4
+    PADDING = 8
+    SPACING = 4
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.theme_manager = StyleManager.get_instance()
+        self.text_layouts = TextLayoutCache.get_instance()
+
+    def sizeHint(self, option, index):
+        comment = index.data(CommentListModel.CommentRole)
+        if comment is None:
+            return super().sizeHint(option, index)
+
+        width = self._row_width(option)
+        layout = self._layout(QRect(0, 0, width, 0), comment, option.font)
+        return QSize(width, layout["height"])
+
+    def paint(self, painter, option, index):
+        comment = index.data(CommentListModel.CommentRole)
+        if comment is None:
+            super().paint(painter, option, index)
+            return
+
+        layout = self._layout(option.rect, comment, option.font)
+        palette = THEME_PALETTES.get(
+            self.theme_manager.current_theme, THEME_PALETTES["light"]
+        )
+        text_color = option.palette.color(option.palette.ColorRole.Text)
+
+        painter.save()
+        painter.setRenderHint(painter.RenderHint.Antialiasing)
+        painter.setClipRect(option.rect)
+
+        # Card
+        painter.setPen(QPen(QColor(palette["comment_border"]), 1))
+        painter.setBrush(QColor(palette["comment_background"]))
+        painter.drawRoundedRect(layout["card"], 4, 4)
+
+        # Author and timestamp
+        painter.setFont(self._bold_font(option.font))
+        painter.setPen(text_color)
+        painter.drawText(
+            layout["header"],
+            Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+            f"@{self._author_text(comment)}",
+        )
+        painter.setFont(self._small_font(option.font))
+        painter.setPen(QColor("gray"))
+        painter.drawText(
+            layout["header"],
+            Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
+            comment.timestamp.strftime("%Y-%m-%d %H:%M"),
+        )
+
+        # Content
+        painter.setPen(text_color)
+        self.text_layouts.draw(
+            painter, layout["content"], comment.content, option.font
+        )
+        painter.restore()
+
+    def _row_width(self, option):
+        widget = option.widget
+        if widget is not None and hasattr(widget, "viewport"):
+            return widget.viewport().width()
+        return option.rect.width()
+
+    def _layout(self, rect, comment, font):
+        # Rectangles for each part of a comment row
+        card = QRect(
+            rect.x() + self.MARGIN,
+            rect.y() + self.MARGIN,
+            rect.width() - 2 * self.MARGIN,
+            0,
+        )
+        inner_x = card.x() + self.PADDING
+        inner_width = max(1, card.width() - 2 * self.PADDING)
+        y = card.y() + self.PADDING
+
+        layout = {}
+        header_height = QFontMetrics(self._bold_font(font)).height()
+        layout["header"] = QRect(inner_x, y, inner_width, header_height)
+        y += header_height + self.SPACING
+
+        content_height = self.text_layouts.height(
+            comment.content, inner_width, font
+        )
+        layout["content"] = QRect(inner_x, y, inner_width, content_height)
+        y += content_height + self.PADDING
+
+        card.setHeight(y - card.y())
+        layout["card"] = card
+        layout["height"] = y + self.MARGIN - rect.y()
+        return layout
+
+    @staticmethod
+    def _author_text(comment):
+        if isinstance(comment.author, str):
+            return comment.author
+        return comment.author.handle
+
+    @staticmethod
+    def _bold_font(font):
+        bold_font = QFont(font)
+        bold_font.setBold(True)
+        return bold_font
+
+    @staticmethod
+    def _small_font(font):
+        small_font = QFont(font)
+        small_font.setPointSizeF(max(1.0, font.pointSizeF() - 2))
+        return small_font
@@ -0,0 +1,120 @@
+from datetime import datetime
+
+from PyQt6.QtCore import QAbstractListModel, QModelIndex, Qt
+
+from src.models.post import Comment, Sentiment
+from src.services.sqlite_repository import SQLiteRepository
+
+
+class CommentListModel(QAbstractListModel):
+    """List model over a post's comments, loaded a page at a time.
+
+    Pages come from the SQLite repository when one is recording, so only
+    the rows on screen are built, and from the post otherwise.
+    """
+
+    # Role returning the Comment object for a row
+    CommentRole = Qt.ItemDataRole.UserRole + 1
+
+    # Comments fetched per page as the view scrolls
+    PAGE_SIZE = 50
+
+    def __init__(self, post, parent=None, repository=None):
+        super().__init__(parent)
+        self.post = post
+        self.repository = repository or SQLiteRepository.get_instance()
+
+        # Comments loaded so far, oldest first, and the post's comment
+        # count when they were last synchronised
+        self._comments = []
+        self._known_count = self._comment_count()
+        self.post.comments_changed.connect(self._on_comments_changed)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._comments)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return False
+        return len(self._comments) < self._comment_count()
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        start = len(self._comments)
+        page = self._comments_page(start, self.PAGE_SIZE)
+        if not page:
+            return
+
+        self.beginInsertRows(QModelIndex(), start, start + len(page) - 1)
+        self._comments.extend(page)
+        self.endInsertRows()
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._comments):
+            return None
+
+        comment = self._comments[index.row()]
+        if role == self.CommentRole:
+            return comment
+        if role in (
+            Qt.ItemDataRole.DisplayRole,
+            Qt.ItemDataRole.ToolTipRole,
+        ):
+            return comment.content
+        return None
+
+    def _comment_count(self):
+        if self.repository is not None:
+            return self.repository.comment_count(self.post.post_id)
+        return self.post.comment_count
+
+    def _comments_page(self, start, count):
+        if self.repository is None:
+            return self.post.comments_page(start, count)
+        return [
+            Comment._restore(
+                row["content"],
+                Sentiment[row["sentiment"]],
+                # Comments by the user are stored without an author
+                row["author"] or self.post.author,
+                datetime.fromtimestamp(row["created_at"]),
+            )
+            for row in self.repository.comments_for_post(
+                self.post.post_id, start, count
+            )
+        ]
+
+    @staticmethod
+    def _same_comment(first, second):
+        # Repository pages build new Comment objects on every fetch
+        return first is second or (
+            first.content,
+            first.author,
+            first.timestamp,
+        ) == (second.content, second.author, second.timestamp)
+
+    def _on_comments_changed(self, _):
+        loaded = len(self._comments)
+        count = self._comment_count()
+        if loaded and (
+            count < loaded
+            or not self._same_comment(
+                self._comments_page(loaded - 1, 1)[0], self._comments[-1]
+            )
+        ):
+            # A loaded comment was removed, so reload the same rows
+            self.beginResetModel()
+            self._comments = self._comments_page(0, loaded)
+            self._known_count = count
+            self.endResetModel()
+            return
+
+        # New comments are fetched like any other page as the view
+        # scrolls, but show them straight away if the end was visible
+        fully_loaded = loaded == self._known_count
+        self._known_count = count
+        if fully_loaded:
+            self.fetchMore()
@@ -0,0 +1,82 @@
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import (
+    QAbstractItemView,
+    QDialog,
+    QHBoxLayout,
+    QLabel,
+    QListView,
+    QPushButton,
+    QVBoxLayout,
+)
+
+from src.views.comment_delegate import CommentDelegate
+from src.views.comment_list_model import CommentListModel
+from src.views.style_manager import StyleManager
+
+
+class CommentsDialog(QDialog):
+    """Dialog showing the comments on a post in a scrollable list.
+
+    Comments are loaded a page at a time as the list is scrolled and only
+    the visible ones are painted, so opening the dialog does not depend
+    on how many comments the post has.
+    """
+
+    def __init__(self, post, parent=None):
+        super().__init__(parent)
+        self.post = post
+        self.theme_manager = StyleManager.get_instance()
+        # Free the model and its post connection once closed
+        self.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        self.init_ui()
+
+    def init_ui(self):
+        self.setWindowTitle(f"Comments ({self.post.comment_count:,})")
+        self.setMinimumWidth(400)
+        self.setMinimumHeight(500)  # Set a reasonable height
+
+        layout = QVBoxLayout(self)
+
+        # No comments message
+        self.no_comments_label = QLabel("No comments yet")
+        self.no_comments_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(self.no_comments_label)
+
+        # Comment list, fetching further pages as it scrolls
+        self.comment_model = CommentListModel(self.post, self)
+        self.comment_view = QListView()
+        self.comment_view.setModel(self.comment_model)
+        self.comment_view.setItemDelegate(CommentDelegate(self.comment_view))
+        self.comment_view.setResizeMode(QListView.ResizeMode.Adjust)
+        self.comment_view.setSelectionMode(
+            QAbstractItemView.SelectionMode.NoSelection
+        )
+        self.comment_view.setVerticalScrollMode(
+            QAbstractItemView.ScrollMode.ScrollPerPixel
+        )
+        self.comment_view.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        layout.addWidget(self.comment_view)
+
+        self.comment_model.rowsInserted.connect(self.update_empty_state)
+        self.comment_model.modelReset.connect(self.update_empty_state)
+        if self.comment_model.canFetchMore():
+            self.comment_model.fetchMore()
+        self.update_empty_state()
+
+        # Button layout
+        button_layout = QHBoxLayout()
+
+        # Close button
+        close_button = QPushButton("Close")
+        close_button.clicked.connect(self.accept)
+        button_layout.addWidget(close_button)
+
+        # Add button layout to main layout
+        layout.addLayout(button_layout)
+
+    def update_empty_state(self, *_):
+        """Show the list, or a message if there are no comments"""
+        has_comments = self.comment_model.rowCount() > 0
+        self.no_comments_label.setVisible(not has_comments)
+        self.comment_view.setVisible(has_comments)
+        self.setWindowTitle(f"Comments ({self.post.comment_count:,})")
@@ -1,5 +1,11 @@
-from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot
-from PyQt6.QtGui import QPixmap
+from PyQt6.QtCore import (
+    QObject,
+    QRunnable,
+    QThreadPool,
+    QTimer,
+    pyqtSignal,
+    pyqtSlot,
+)
 from PyQt6.QtWidgets import (
     QFileDialog,
     QHBoxLayout,
@@ -13,12 +19,46 @@ from PyQt6.QtWidgets import (
 
 from src.models.post import Sentiment
 from src.patterns.decorator.sponsered_user import SponsoredUser
+from src.views.image_loader import ImageLoader
+
+
+class _SentimentPreviewSignals(QObject):
+    # Carries (request id, Sentiment or None) back to the UI thread
+    finished = pyqtSignal(int, object)
+
+
+class SentimentPreviewTask(QRunnable):
+    # Runs the sentiment analysis for a draft post on a worker thread
+
+    def __init__(self, request_id, content, post_controller):
+        super().__init__()
+        self.request_id = request_id
+        self.content = content
+        self.post_controller = post_controller
+        self.signals = _SentimentPreviewSignals()
+
+    def run(self):
+        try:
+            sentiment = self.post_controller.analyze_sentiment(self.content)
+        except Exception:
+            sentiment = None
+        self.signals.finished.emit(self.request_id, sentiment)
 
 
 class CreatePostWidget(QWidget):
     # Signal emitted when a post is created
     post_created = pyqtSignal()
 
+    # Delay after the last keystroke before the draft is analysed
+    PREVIEW_DEBOUNCE_MS = 600
+
+    # Drafts shorter than this are rejected by PostCreationInterceptor
+    PREVIEW_MIN_LENGTH = 5
+
+    # Bounds of the selected image thumbnail
+    IMAGE_PREVIEW_MAX_WIDTH = 400
+    IMAGE_PREVIEW_HEIGHT = 50
+
     def __init__(self, user_controller=None, post_controller=None, user=None):
         """Initialize the create post widget."""
         super().__init__()
@@ -26,6 +66,17 @@ class CreatePostWidget(QWidget):
         self.user = user
         self.post_controller = post_controller
         self.image_path = None
+        self.image_loader = ImageLoader.get_instance()
+        self.image_loader.image_ready.connect(self.on_image_ready)
+
+        # Live sentiment preview state
+        self._preview_request_id = 0
+        self._pending_preview_task = None
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(self.PREVIEW_DEBOUNCE_MS)
+        self._preview_timer.timeout.connect(self.request_sentiment_preview)
+
         self.init_ui()
 
     def set_user_controller(self, controller):
@@ -45,6 +96,12 @@ class CreatePostWidget(QWidget):
         self.content_edit = QTextEdit()
         self.content_edit.setPlaceholderText("Share your thoughts...")
         self.content_edit.setMinimumHeight(100)
+        self.content_edit.textChanged.connect(self._preview_timer.start)
+
+        # Predicted lean and follower impact of the current draft
+        self.preview_label = QLabel()
+        self.preview_label.setStyleSheet("color: gray; font-size: 11px;")
+        self.preview_label.hide()
 
         # Image upload
         image_layout = QHBoxLayout()
@@ -78,12 +135,83 @@ class CreatePostWidget(QWidget):
         # Add all widgets to layout
         layout.addWidget(content_label)
         layout.addWidget(self.content_edit)
+        layout.addWidget(self.preview_label)
         layout.addLayout(image_layout)
         layout.addWidget(self.image_preview)
         layout.addWidget(self.post_button)
 
         self.setLayout(layout)
 
+    @pyqtSlot()
+    def request_sentiment_preview(self):
+        """Analyse the draft in the background once typing has paused."""
+        content = self.content_edit.toPlainText().strip()
+
+        # Supersede any request that has not produced a result yet
+        self._preview_request_id += 1
+        self._cancel_pending_preview()
+
+        if len(content) < self.PREVIEW_MIN_LENGTH or not self.post_controller:
+            self.preview_label.hide()
+            return
+
+        # Already analysed text is answered straight from the cache
+        cached = self.post_controller.get_cached_sentiment(content)
+        if cached is not None:
+            self.show_sentiment_preview(self._preview_request_id, cached)
+            return
+
+        self.preview_label.setText("Analyzing sentiment...")
+        self.preview_label.show()
+
+        task = SentimentPreviewTask(
+            self._preview_request_id, content, self.post_controller
+        )
+        task.signals.finished.connect(self.show_sentiment_preview)
+        self._pending_preview_task = task
+        QThreadPool.globalInstance().start(task)
+
+    def _cancel_pending_preview(self):
+        # Drop a queued analysis that has not started running yet; one that
+        # is already running finishes and its stale result is ignored
+        task, self._pending_preview_task = self._pending_preview_task, None
+        if task is None:
+            return
+        try:
+            QThreadPool.globalInstance().tryTake(task)
+        except RuntimeError:
+            # The pool deletes tasks once they have run (autoDelete), which
+            # can happen before their result reaches this thread
+            pass
+
+    @pyqtSlot(int, object)
+    def show_sentiment_preview(self, request_id, sentiment):
+        """Show the predicted lean and follower impact of the draft."""
+        if request_id != self._preview_request_id:
+            return  # Result for text that has since changed
+
+        self._pending_preview_task = None
+        if sentiment is None:
+            self.preview_label.hide()
+            return
+
+        lean_text = {
+            Sentiment.LEFT: "Left-leaning",
+            Sentiment.RIGHT: "Right-leaning",
+        }.get(sentiment, "Neutral")
+        preview_text = f"Predicted lean: {lean_text}"
+
+        if self.user_controller:
+            gained, lost = self.user_controller.estimate_post_impact(
+                sentiment
+            )
+            preview_text += (
+                f"  |  Expected followers: +{gained:.1f} / -{lost:.1f}"
+            )
+
+        self.preview_label.setText(preview_text)
+        self.preview_label.show()
+
     def select_image(self):
         """Open file dialog to select an image"""
         file_path, _ = QFileDialog.getOpenFileName(
@@ -101,14 +229,29 @@ class CreatePostWidget(QWidget):
     def update_image_preview(self):
         """Update the image preview label with the selected image"""
         if self.image_path:
-            pixmap = QPixmap(self.image_path)
-            scaled_pixmap = pixmap.scaledToHeight(
-                50, Qt.TransformationMode.SmoothTransformation
+            pixmap = self.image_loader.request(
+                self.image_path,
+                self.IMAGE_PREVIEW_MAX_WIDTH,
+                self.IMAGE_PREVIEW_HEIGHT,
             )
-            self.image_preview.setPixmap(scaled_pixmap)
+            if pixmap is not None:
+                self.image_preview.setPixmap(pixmap)
+            else:
+                # Decoded in the background, see on_image_ready
+                self.image_preview.setText("Loading preview...")
         else:
             self.image_preview.setText("No image selected")
 
+    @pyqtSlot(str, int, int)
+    def on_image_ready(self, path, max_width, max_height):
+        """Show the preview once the selected image is decoded."""
+        if (path, max_width, max_height) == (
+            self.image_path,
+            self.IMAGE_PREVIEW_MAX_WIDTH,
+            self.IMAGE_PREVIEW_HEIGHT,
+        ):
+            self.update_image_preview()
+
     def clear_image(self):
         """Clear the selected image"""
         self.image_path = None
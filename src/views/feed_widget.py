@@ -1,12 +1,18 @@
+from PyQt6.QtCore import Qt, pyqtSlot
 from PyQt6.QtWidgets import (
+    QAbstractItemView,
     QHBoxLayout,
     QLabel,
-    QScrollArea,
+    QListView,
     QVBoxLayout,
     QWidget,
 )
 
-from src.views.post_widget import PostWidget
+from src.views.comments_dialog import CommentsDialog
+from src.views.image_loader import ImageLoader
+from src.views.post_delegate import PostDelegate
+from src.views.post_list_model import PostListModel
+from src.views.style_manager import StyleManager
 
 
 class FeedWidget(QWidget):
@@ -15,15 +21,18 @@ class FeedWidget(QWidget):
         super().__init__(parent)
         self.user = user
         self.post_controller = None
-        self.post_widgets = []
+        self.theme_manager = StyleManager.get_instance()
         self.init_ui()
 
+        # Repaint the visible rows when the theme changes
+        self.theme_manager.theme_changed.connect(self.on_theme_changed)
+
+        # Repaint when a post image finishes decoding in the background
+        ImageLoader.get_instance().image_ready.connect(self.on_image_ready)
+
     def set_post_controller(self, controller):
-        """Set the post controller and pass it to child widgets."""
+        """Set the post controller."""
         self.post_controller = controller
-        # Update existing post widgets
-        for post_widget in self.post_widgets:
-            post_widget.set_post_controller(controller)
 
     def init_ui(self):
         layout = QVBoxLayout()
@@ -36,45 +45,51 @@ class FeedWidget(QWidget):
 
         layout.addLayout(controls_layout)
 
-        # Feed scroll area
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll_content = QWidget()
-        self.feed_layout = QVBoxLayout(scroll_content)
-
-        self.update_feed()
-
-        scroll.setWidget(scroll_content)
-        layout.addWidget(scroll)
+        # Feed list: only the visible rows are painted, by the delegate
+        self.post_model = PostListModel(self.user, self)
+        self.post_delegate = PostDelegate(self)
+        self.post_delegate.comments_requested.connect(self.show_comments)
+
+        self.feed_view = QListView()
+        self.feed_view.setModel(self.post_model)
+        self.feed_view.setItemDelegate(self.post_delegate)
+        self.feed_view.setResizeMode(QListView.ResizeMode.Adjust)
+        self.feed_view.setLayoutMode(QListView.LayoutMode.Batched)
+        self.feed_view.setBatchSize(50)
+        self.feed_view.setSelectionMode(
+            QAbstractItemView.SelectionMode.NoSelection
+        )
+        self.feed_view.setVerticalScrollMode(
+            QAbstractItemView.ScrollMode.ScrollPerPixel
+        )
+        self.feed_view.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        layout.addWidget(self.feed_view)
 
         self.setLayout(layout)
 
     def update_feed(self):
         """Update the feed with the latest posts."""
-        # Clear existing posts
-        self.post_widgets = []
-        while self.feed_layout.count():
-            item = self.feed_layout.takeAt(0)
-            widget = item.widget()
-            if widget:
-                widget.deleteLater()
-
-        if not self.post_controller:
-            return
-
-        # Get user posts
-        if self.user:
-            posts = reversed(self.user.posts)
-        else:
-            posts = []
-
-        # Add posts to the feed
-        for post in posts:
-            post_widget = PostWidget(post)
-            if self.post_controller:
-                post_widget.set_post_controller(self.post_controller)
-            self.post_widgets.append(post_widget)
-            self.feed_layout.addWidget(post_widget)
-
-        # Add stretch to push posts to the top
-        self.feed_layout.addStretch()
+        self.post_model.set_user(self.user)
+
+    def add_post(self, post):
+        """Show a newly created post without reloading the feed."""
+        self.post_model.add_post(post)
+
+    @pyqtSlot(object)
+    def show_comments(self, post):
+        """Show the comments dialog for a post."""
+        CommentsDialog(post, self).exec()
+
+    @pyqtSlot(str, int, int)
+    def on_image_ready(self, path, max_width, max_height):
+        """Replace image placeholders once the image is decoded."""
+        if (max_width, max_height) == (
+            PostDelegate.IMAGE_MAX_WIDTH,
+            PostDelegate.IMAGE_MAX_HEIGHT,
+        ):
+            self.feed_view.viewport().update()
+
+    @pyqtSlot(str)
+    def on_theme_changed(self, theme):
+        """Handle theme changes"""
+        self.feed_view.viewport().update()
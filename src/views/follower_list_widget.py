@@ -1,22 +1,31 @@
 from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import (
+    QAbstractItemView,
     QDialog,
     QFrame,
     QHBoxLayout,
+    QHeaderView,
     QLabel,
+    QLineEdit,
     QProgressBar,
     QPushButton,
-    QScrollArea,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
 
 from src.models.post import Sentiment
+from src.services.sqlite_repository import SQLiteRepository
+from src.views.follower_table_model import FollowerTableModel
+from src.views.refresh_coalescer import RefreshCoalescer
 from src.views.style_manager import StyleManager
 
 
 class FollowerListDialog(QDialog):
 
+    # Fixed row height so the table never measures rows
+    ROW_HEIGHT = 26
+
     def __init__(self, followers, parent=None):
         super().__init__(parent)
         self.followers = followers
@@ -30,30 +39,44 @@ class FollowerListDialog(QDialog):
 
         layout = QVBoxLayout(self)
 
-        # Create a scrollable area for followers
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-
-        # Container widget for all followers
-        container = QWidget()
-        followers_layout = QVBoxLayout(container)
-
-        # Add followers to the container
-        if self.followers:
-            for follower in self.followers:
-                follower_widget = self.create_follower_widget(follower)
-                followers_layout.addWidget(follower_widget)
-        else:
-            # No followers message
-            no_followers = QLabel("No followers yet")
-            no_followers.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            followers_layout.addWidget(no_followers)
-
-        # Add some spacing at the bottom
-        followers_layout.addStretch()
+        # Handle search, answered from the model's prefix index
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText("Search handles...")
+        self.search_edit.setClearButtonEnabled(True)
+        self.search_edit.textChanged.connect(self.filter_followers)
+        layout.addWidget(self.search_edit)
+
+        # Table of followers: only the visible rows are painted
+        self.follower_model = FollowerTableModel(self.followers, self)
+        self.follower_table = QTableView()
+        self.follower_table.setModel(self.follower_model)
+        self.follower_table.setSortingEnabled(True)
+        self.follower_table.sortByColumn(
+            FollowerTableModel.HANDLE_COLUMN, Qt.SortOrder.AscendingOrder
+        )
+        self.follower_table.setSelectionBehavior(
+            QAbstractItemView.SelectionBehavior.SelectRows
+        )
+        self.follower_table.setEditTriggers(
+            QAbstractItemView.EditTrigger.NoEditTriggers
+        )
+        self.follower_table.setAlternatingRowColors(True)
+        self.follower_table.verticalHeader().hide()
+        self.follower_table.verticalHeader().setSectionResizeMode(
+            QHeaderView.ResizeMode.Fixed
+        )
+        self.follower_table.verticalHeader().setDefaultSectionSize(
+            self.ROW_HEIGHT
+        )
+        self.follower_table.horizontalHeader().setSectionResizeMode(
+            FollowerTableModel.HANDLE_COLUMN, QHeaderView.ResizeMode.Stretch
+        )
+        layout.addWidget(self.follower_table)
 
-        scroll_area.setWidget(container)
-        layout.addWidget(scroll_area)
+        # Number of followers matching the search
+        self.count_label = QLabel()
+        layout.addWidget(self.count_label)
+        self.update_count()
 
         # Close button
         button_layout = QHBoxLayout()
@@ -65,65 +88,22 @@ class FollowerListDialog(QDialog):
 
         layout.addLayout(button_layout)
 
-    def create_follower_widget(self, follower):
-        """Create a widget for displaying a follower"""
-        frame = QFrame()
-        frame.setFrameShape(QFrame.Shape.StyledPanel)
-
-        # Apply theme-appropriate styling
-        if self.theme_manager.current_theme == "light":
-            frame.setStyleSheet(
-                """
-                QFrame {
-                    border: 1px solid #e0e0e0;
-                    border-radius: 4px;
-                    background-color: #f9f9f9;
-                    padding: 10px;
-                    margin: 4px;
-                }
-            """
-            )
-        else:  # dark theme
-            frame.setStyleSheet(
-                """
-                QFrame {
-                    border: 1px solid #444;
-                    border-radius: 4px;
-                    background-color: #2d2d2d;
-                    padding: 10px;
-                    margin: 4px;
-                }
-            """
-            )
-
-        layout = QHBoxLayout(frame)
-
-        # Follower handle
-        handle_label = QLabel(f"@{follower.handle}")
-        handle_label.setStyleSheet("font-weight: bold;")
-        layout.addWidget(handle_label)
-
-        # Sentiment indicator
-        sentiment_text = ""
-        sentiment_color = ""
-
-        if follower.sentiment == Sentiment.LEFT:
-            sentiment_text = "Left-leaning"
-            sentiment_color = "#3498db"  # Blue
-        elif follower.sentiment == Sentiment.RIGHT:
-            sentiment_text = "Right-leaning"
-            sentiment_color = "#e74c3c"  # Red
+    def filter_followers(self, text):
+        """Show only followers whose handle starts with the search text"""
+        self.follower_model.set_prefix(text)
+        self.update_count()
+
+    def update_count(self):
+        """Update the label showing how many followers are listed"""
+        shown = self.follower_model.rowCount()
+        if not self.followers:
+            self.count_label.setText("No followers yet")
+        elif shown == len(self.followers):
+            self.count_label.setText(f"{shown:,} followers")
         else:
-            sentiment_text = "Neutral"
-            sentiment_color = "#95a5a6"  # Gray
-
-        sentiment_label = QLabel(sentiment_text)
-        sentiment_label.setStyleSheet(f"color: {sentiment_color};")
-        layout.addWidget(
-            sentiment_label, alignment=Qt.AlignmentFlag.AlignRight
-        )
-
-        return frame
+            self.count_label.setText(
+                f"{shown:,} of {len(self.followers):,} followers"
+            )
 
 
 class FollowerListWidget(QWidget):
@@ -136,8 +116,8 @@ class FollowerListWidget(QWidget):
         self.init_ui()
 
         # Connect to signals
-        self.user.follower_added.connect(self.update_followers)
-        self.user.follower_removed.connect(self.update_followers)
+        self.user.follower_added.connect(self.schedule_update)
+        self.user.follower_removed.connect(self.schedule_update)
 
     def init_ui(self):
         """Initialize the UI."""
@@ -182,7 +162,7 @@ class FollowerListWidget(QWidget):
         self.update_followers()
 
     def show_followers_dialog(self):
-        """Show dialog with scrollable list of followers"""
+        """Show dialog with a searchable table of followers"""
         dialog = FollowerListDialog(self.user.followers, self)
         dialog.exec()
 
@@ -222,20 +202,32 @@ class FollowerListWidget(QWidget):
 
         return frame
 
+    def schedule_update(self, *_):
+        """Update the statistics on the next frame"""
+        RefreshCoalescer.get_instance().mark_dirty(self.update_followers)
+
+    def sentiment_counts(self):
+        """Count current followers by sentiment name.
+
+        The SQLite repository answers with one grouped query when it is
+        recording; otherwise the user's followers are counted here.
+        """
+        repository = SQLiteRepository.get_instance()
+        if repository is not None:
+            return repository.follower_sentiment_counts()
+        counts = {}
+        for follower in self.user.followers:
+            name = follower.sentiment.name
+            counts[name] = counts.get(name, 0) + 1
+        return counts
+
     def update_followers(self):
         """Update the follower statistics."""
-        # Get all followers directly from the user
-        followers = self.user.followers
-        total_followers = len(followers)
-
-        # Count followers by sentiment
-        left_count = sum(1 for f in followers if f.sentiment == Sentiment.LEFT)
-        right_count = sum(
-            1 for f in followers if f.sentiment == Sentiment.RIGHT
-        )
-        neutral_count = sum(
-            1 for f in followers if f.sentiment == Sentiment.NEUTRAL
-        )
+        counts = self.sentiment_counts()
+        left_count = counts.get(Sentiment.LEFT.name, 0)
+        right_count = counts.get(Sentiment.RIGHT.name, 0)
+        neutral_count = counts.get(Sentiment.NEUTRAL.name, 0)
+        total_followers = left_count + right_count + neutral_count
 
         # Calculate percentages
         left_percent = (
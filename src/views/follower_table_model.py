@@ -0,0 +1,144 @@
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PyQt6.QtGui import QColor
+
+from src.models.follower_index import FollowerHandleIndex
+from src.models.post import Sentiment
+
+# Label and colour shown for each sentiment
+SENTIMENT_DISPLAY = {
+    Sentiment.LEFT: ("Left-leaning", "#3498db"),
+    Sentiment.RIGHT: ("Right-leaning", "#e74c3c"),
+    Sentiment.NEUTRAL: ("Neutral", "#95a5a6"),
+}
+
+# Left to right order used when sorting by sentiment
+SENTIMENT_ORDER = {
+    Sentiment.LEFT: 0,
+    Sentiment.NEUTRAL: 1,
+    Sentiment.RIGHT: 2,
+}
+
+
+class FollowerTableModel(QAbstractTableModel):
+    """Sortable table of followers, filtered by handle prefix"""
+
+    HANDLE_COLUMN = 0
+    LEAN_COLUMN = 1
+    SENTIMENT_COLUMN = 2
+    HEADERS = ("Handle", "Lean", "Sentiment")
+
+    # Role returning the Follower object for a row
+    FollowerRole = Qt.ItemDataRole.UserRole + 1
+
+    def __init__(self, followers=(), parent=None):
+        super().__init__(parent)
+        self._prefix = ""
+        self._sort_column = self.HANDLE_COLUMN
+        self._sort_order = Qt.SortOrder.AscendingOrder
+
+        # Rows hold positions in the handle index. In handle order they are
+        # a range, so no per-row list is built for the common case
+        self._index = FollowerHandleIndex()
+        self._rows = range(0)
+        self.set_followers(followers)
+
+    def set_followers(self, followers):
+        """Show a new set of followers."""
+        self.beginResetModel()
+        self._index = FollowerHandleIndex(followers)
+        self._rows = self._build_rows()
+        self.endResetModel()
+
+    def set_prefix(self, prefix):
+        """Only show followers whose handle starts with prefix."""
+        if prefix == self._prefix:
+            return
+        self.beginResetModel()
+        self._prefix = prefix
+        self._rows = self._build_rows()
+        self.endResetModel()
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        if not 0 <= column < len(self.HEADERS):
+            return
+        self.layoutAboutToBeChanged.emit()
+        self._sort_column = column
+        self._sort_order = order
+        self._rows = self._build_rows()
+        self.layoutChanged.emit()
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.HEADERS)
+
+    def headerData(
+        self, section, orientation, role=Qt.ItemDataRole.DisplayRole
+    ):
+        if (
+            orientation == Qt.Orientation.Horizontal
+            and role == Qt.ItemDataRole.DisplayRole
+            and 0 <= section < len(self.HEADERS)
+        ):
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._rows):
+            return None
+
+        follower = self.follower_at(index.row())
+        column = index.column()
+        if role == self.FollowerRole:
+            return follower
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == self.HANDLE_COLUMN:
+                return f"@{follower.handle}"
+            if column == self.LEAN_COLUMN:
+                return follower.political_lean
+            if column == self.SENTIMENT_COLUMN:
+                return self._sentiment_display(follower)[0]
+        if (
+            role == Qt.ItemDataRole.ForegroundRole
+            and column == self.SENTIMENT_COLUMN
+        ):
+            return QColor(self._sentiment_display(follower)[1])
+        return None
+
+    def follower_at(self, row):
+        """Return the follower shown in a row."""
+        return self._index.follower_at(self._rows[row])
+
+    def _sentiment_display(self, follower):
+        return SENTIMENT_DISPLAY.get(
+            follower.sentiment, SENTIMENT_DISPLAY[Sentiment.NEUTRAL]
+        )
+
+    def _build_rows(self):
+        start, stop = self._index.prefix_range(self._prefix)
+        descending = self._sort_order == Qt.SortOrder.DescendingOrder
+
+        if self._sort_column == self.HANDLE_COLUMN:
+            if descending:
+                return range(stop - 1, start - 1, -1)
+            return range(start, stop)
+
+        if self._sort_column == self.LEAN_COLUMN:
+
+            def key(position):
+                return self._index.follower_at(position).political_lean
+
+        else:
+
+            def key(position):
+                return SENTIMENT_ORDER.get(
+                    self._index.follower_at(position).sentiment, 1
+                )
+
+        # sorted() is stable, so ties stay in handle order
+        return sorted(range(start, stop), key=key, reverse=descending)
@@ -0,0 +1,198 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+from PyQt6.QtCore import QObject, QRunnable, QSize, Qt, QThreadPool, pyqtSignal
+from PyQt6.QtGui import QImage, QImageReader, QPixmap
+
+
+def get_thumbnail_directory():
+    """Get the directory used for the on-disk thumbnail cache"""
+    views_dir = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(views_dir, "user_data", "thumbnails")
+
+
+def scaled_image_size(size, max_width, max_height):
+    """Size of an image of the given size scaled down to fit the bounds"""
+    if not size.isValid():
+        return QSize()
+    if size.width() <= max_width and size.height() <= max_height:
+        return size
+    return size.scaled(
+        max_width, max_height, Qt.AspectRatioMode.KeepAspectRatio
+    )
+
+
+def thumbnail_key(path):
+    """Key of a file in the thumbnail cache, from its path, mtime and size.
+
+    Only the file's metadata is read, so a cached thumbnail is found without
+    reading the original image; a replaced file gets a new key.
+    """
+    stat = os.stat(path)
+    identity = f"{os.path.abspath(path)}|{stat.st_mtime_ns}|{stat.st_size}"
+    return hashlib.sha1(identity.encode("utf-8")).hexdigest()
+
+
+class _ThumbnailSignals(QObject):
+    # Carries (path, max width, max height, QImage) back to the UI thread
+    finished = pyqtSignal(str, int, int, object)
+
+
+class ThumbnailTask(QRunnable):
+    # Decodes and downscales an image on a worker thread, using the
+    # on-disk thumbnail cache when the same file was seen before
+
+    def __init__(self, path, max_width, max_height, thumbnail_dir):
+        super().__init__()
+        self.path = path
+        self.max_width = max_width
+        self.max_height = max_height
+        self.thumbnail_dir = thumbnail_dir
+        self.signals = _ThumbnailSignals()
+
+    def run(self):
+        try:
+            image = self.load()
+        except OSError:
+            image = QImage()
+        self.signals.finished.emit(
+            self.path, self.max_width, self.max_height, image
+        )
+
+    def load(self):
+        thumbnail_path = os.path.join(
+            self.thumbnail_dir,
+            f"{thumbnail_key(self.path)}_{self.max_width}x{self.max_height}"
+            ".png",
+        )
+        if os.path.exists(thumbnail_path):
+            image = QImage(thumbnail_path)
+            if not image.isNull():
+                return image
+
+        # Let the decoder scale while decoding instead of building the
+        # full resolution image first
+        reader = QImageReader(self.path)
+        reader.setAutoTransform(True)
+        target = scaled_image_size(
+            reader.size(), self.max_width, self.max_height
+        )
+        if target.isValid():
+            reader.setScaledSize(target)
+        image = reader.read()
+
+        if not image.isNull():
+            os.makedirs(self.thumbnail_dir, exist_ok=True)
+            # Write to a temporary name first so a concurrent reader never
+            # sees a partial file
+            temp_path = f"{thumbnail_path}.{threading.get_ident()}.tmp"
+            if image.save(temp_path, "PNG"):
+                os.replace(temp_path, thumbnail_path)
+        return image
+
+
+class ImageLoader(QObject):
+    """Loads downscaled post images in the background.
+
+    request() returns the pixmap if it is ready and otherwise starts a
+    worker and returns None; image_ready is emitted once it is available.
+    """
+
+    # Emitted with (path, max width, max height) when an image is ready
+    image_ready = pyqtSignal(str, int, int)
+
+    # Default memory cap for decoded pixmaps
+    DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+    # Scaled sizes remembered for images that are not decoded yet
+    MAX_SIZES = 4096
+
+    # Worker threads used for decoding
+    MAX_THREADS = 2
+
+    # Singleton instance
+    _instance = None
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            cls._instance = ImageLoader()
+        return cls._instance
+
+    def __init__(self, thumbnail_dir=None, max_bytes=DEFAULT_MAX_BYTES):
+        super().__init__()
+        self.thumbnail_dir = thumbnail_dir or get_thumbnail_directory()
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self._pixmaps = OrderedDict()
+        self._sizes = OrderedDict()
+        self._pending = {}
+
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(self.MAX_THREADS)
+
+    def request(self, path, max_width, max_height):
+        """Return the scaled pixmap for path, or None while it loads."""
+        key = (path, max_width, max_height)
+        pixmap = self._pixmaps.get(key)
+        if pixmap is not None:
+            self._pixmaps.move_to_end(key)
+            return pixmap
+
+        if key not in self._pending:
+            task = ThumbnailTask(
+                path, max_width, max_height, self.thumbnail_dir
+            )
+            task.signals.finished.connect(self._on_finished)
+            self._pending[key] = task
+            self.thread_pool.start(task)
+        return None
+
+    def scaled_size(self, path, max_width, max_height):
+        """Final size of the scaled image, read from the file header only."""
+        key = (path, max_width, max_height)
+        pixmap = self._pixmaps.get(key)
+        if pixmap is not None:
+            return pixmap.size()
+
+        size = self._sizes.get(key)
+        if size is None:
+            reader = QImageReader(path)
+            reader.setAutoTransform(True)
+            size = scaled_image_size(reader.size(), max_width, max_height)
+            self._remember_size(key, size)
+        else:
+            self._sizes.move_to_end(key)
+        return size
+
+    def _remember_size(self, key, size):
+        # Least recently used sizes are dropped first, like the pixmaps
+        self._sizes[key] = size
+        self._sizes.move_to_end(key)
+        while len(self._sizes) > self.MAX_SIZES:
+            self._sizes.popitem(last=False)
+
+    def wait_for_done(self, msecs=-1):
+        """Block until all queued images are decoded (used by tests)."""
+        return self.thread_pool.waitForDone(msecs)
+
+    def _on_finished(self, path, max_width, max_height, image):
+        key = (path, max_width, max_height)
+        self._pending.pop(key, None)
+
+        # QPixmap may only be created on the UI thread
+        pixmap = QPixmap.fromImage(image)
+        self._pixmaps[key] = pixmap
+        self._remember_size(key, pixmap.size())
+        self.current_bytes += self._pixmap_bytes(pixmap)
+        while self.current_bytes > self.max_bytes and len(self._pixmaps) > 1:
+            _, evicted = self._pixmaps.popitem(last=False)
+            self.current_bytes -= self._pixmap_bytes(evicted)
+
+        self.image_ready.emit(path, max_width, max_height)
+
+    @staticmethod
+    def _pixmap_bytes(pixmap):
+        return pixmap.width() * pixmap.height() * max(1, pixmap.depth()) // 8
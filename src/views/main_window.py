@@ -1,10 +1,15 @@
-from PyQt6.QtCore import pyqtSlot
+import logging
+import time
+
+from PyQt6.QtCore import QTimer, pyqtSlot
 from PyQt6.QtWidgets import QMainWindow, QTabWidget, QVBoxLayout, QWidget
 
+from src.services.logger_service import LoggerService
 from src.views.create_post_widget import CreatePostWidget
 from src.views.feed_widget import FeedWidget
 from src.views.follower_list_widget import FollowerListWidget
 from src.views.news_widget import NewsWidget
+from src.views.refresh_coalescer import RefreshCoalescer
 from src.views.style_manager import StyleManager
 from src.views.theme_switcher_widget import ThemeSwitcherWidget
 from src.views.user_profile_widget import UserProfileWidget
@@ -13,29 +18,43 @@ from src.views.user_profile_widget import UserProfileWidget
 class SocialMediaMainWindow(QMainWindow):
     """Main window for the social media application"""
 
+    # Tabs in display order; each is built the first time it is shown
+    TABS = ("Profile", "Feed", "Followers", "News")
+
     def __init__(self, user=None):
         super().__init__()
+        self._started = time.perf_counter()
         self.user = user
         self.user_controller = None
         self.post_controller = None
 
+        # Milliseconds spent on each startup step, see report_startup
+        self.startup_timings = {}
+        self._first_paint_reported = False
+
         # Initialize theme manager
         self.theme_manager = StyleManager.get_instance()
 
         self.init_ui()
+        self.startup_timings["init_ui"] = self._elapsed_ms(self._started)
 
     def set_user_controller(self, controller):
-        """Set the user controller and pass it to child widgets."""
+        """Set the user controller and pass it to the built tabs."""
         self.user_controller = controller
-        self.profile_widget.set_user_controller(controller)
-        self.create_post_widget.set_user_controller(controller)
-        self.news_widget.set_user_controller(controller)
+        if hasattr(self, "profile_widget"):
+            self.profile_widget.set_user_controller(controller)
+        if hasattr(self, "create_post_widget"):
+            self.create_post_widget.set_user_controller(controller)
+        if hasattr(self, "news_widget"):
+            self.news_widget.set_user_controller(controller)
 
     def set_post_controller(self, controller):
-        """Set the post controller and pass it to child widgets."""
+        """Set the post controller and pass it to the built tabs."""
         self.post_controller = controller
-        self.feed_widget.set_post_controller(controller)
-        self.create_post_widget.set_post_controller(controller)
+        if hasattr(self, "feed_widget"):
+            self.feed_widget.set_post_controller(controller)
+        if hasattr(self, "create_post_widget"):
+            self.create_post_widget.set_post_controller(controller)
 
     def update_user_profile(self):
         """Update the UI to reflect changes in the user object."""
@@ -77,44 +96,22 @@ class SocialMediaMainWindow(QMainWindow):
         self.theme_switcher = ThemeSwitcherWidget()
         main_layout.addWidget(self.theme_switcher)
 
-        # Create tab widget
-        tabs = QTabWidget()
-
-        # Profile tab
-        profile_tab = QWidget()
-        profile_layout = QVBoxLayout()
-        self.profile_widget = UserProfileWidget(self.user)
-        profile_layout.addWidget(self.profile_widget)
-        profile_tab.setLayout(profile_layout)
-
-        # Feed tab
-        feed_tab = QWidget()
-        feed_layout = QVBoxLayout()
-        self.create_post_widget = CreatePostWidget(self.user)
-        self.feed_widget = FeedWidget(self.user)
-        feed_layout.addWidget(self.create_post_widget)
-        feed_layout.addWidget(self.feed_widget)
-        feed_tab.setLayout(feed_layout)
-
-        # Followers tab
-        followers_tab = QWidget()
-        followers_layout = QVBoxLayout()
-        self.followers_widget = FollowerListWidget(self.user)
-        followers_layout.addWidget(self.followers_widget)
-        followers_tab.setLayout(followers_layout)
-
-        # News tab
-        news_tab = QWidget()
-        news_layout = QVBoxLayout()
-        self.news_widget = NewsWidget(self.user)
-        news_layout.addWidget(self.news_widget)
-        news_tab.setLayout(news_layout)
-
-        # Add tabs to tab widget
-        tabs.addTab(profile_tab, "Profile")
-        tabs.addTab(feed_tab, "Feed")
-        tabs.addTab(followers_tab, "Followers")
-        tabs.addTab(news_tab, "News")
+        # Create tab widget with empty pages; a page's widgets are built
+        # the first time its tab is shown
+        self.tabs = QTabWidget()
+        self._tab_builders = {
+            "Profile": self._build_profile_tab,
+            "Feed": self._build_feed_tab,
+            "Followers": self._build_followers_tab,
+            "News": self._build_news_tab,
+        }
+        self._built_tabs = set()
+        for name in self.TABS:
+            page = QWidget()
+            page.setLayout(QVBoxLayout())
+            self.tabs.addTab(page, name)
+        self.tabs.currentChanged.connect(self.ensure_tab_built)
+        self.ensure_tab_built(self.tabs.currentIndex())
 
         # Connect signals
         if self.user:
@@ -123,7 +120,7 @@ class SocialMediaMainWindow(QMainWindow):
             self.user.follower_removed.connect(self.on_follower_removed)
 
         # Add tab widget to main layout
-        main_layout.addWidget(tabs)
+        main_layout.addWidget(self.tabs)
 
         # Set central widget
         central_widget.setLayout(main_layout)
@@ -132,16 +129,106 @@ class SocialMediaMainWindow(QMainWindow):
         # Apply initial theme
         self.theme_manager.set_theme("light")
 
+    @pyqtSlot(int)
+    def ensure_tab_built(self, index):
+        """Build the widgets of a tab if this is its first activation"""
+        if not 0 <= index < len(self.TABS):
+            return
+        name = self.TABS[index]
+        if name in self._built_tabs:
+            return
+
+        started = time.perf_counter()
+        self._built_tabs.add(name)
+        self._tab_builders[name](self.tabs.widget(index).layout())
+        elapsed_ms = self._elapsed_ms(started)
+        self.startup_timings[f"tab.{name}"] = elapsed_ms
+        LoggerService.log_event(
+            "ui.tab_built", level=logging.INFO, tab=name, ms=elapsed_ms
+        )
+
+    def is_tab_built(self, name):
+        """Whether a tab's widgets have been created"""
+        return name in self._built_tabs
+
+    def _build_profile_tab(self, layout):
+        self.profile_widget = UserProfileWidget(self.user)
+        if self.user_controller:
+            self.profile_widget.set_user_controller(self.user_controller)
+            # Catch up with changes made while the tab was not built
+            if self.user_controller.user is not self.user:
+                self.profile_widget.update_user(self.user_controller.user)
+        layout.addWidget(self.profile_widget)
+
+    def _build_feed_tab(self, layout):
+        self.create_post_widget = CreatePostWidget(self.user)
+        self.feed_widget = FeedWidget(self.user)
+        if self.user_controller:
+            self.create_post_widget.set_user_controller(self.user_controller)
+        if self.post_controller:
+            self.create_post_widget.set_post_controller(self.post_controller)
+            self.feed_widget.set_post_controller(self.post_controller)
+        layout.addWidget(self.create_post_widget)
+        layout.addWidget(self.feed_widget)
+
+    def _build_followers_tab(self, layout):
+        self.followers_widget = FollowerListWidget(self.user)
+        layout.addWidget(self.followers_widget)
+
+    def _build_news_tab(self, layout):
+        self.news_widget = NewsWidget(self.user)
+        if self.user_controller:
+            self.news_widget.set_user_controller(self.user_controller)
+            if self.user_controller.user is not self.user:
+                self.news_widget.update_user(self.user_controller.user)
+        layout.addWidget(self.news_widget)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self._first_paint_reported:
+            # Runs once the event loop has processed the first paint
+            QTimer.singleShot(0, self.report_startup)
+
+    def report_startup(self):
+        """Log how long it took from construction to the first paint"""
+        if self._first_paint_reported:
+            return
+        self._first_paint_reported = True
+        self.startup_timings["first_paint"] = self._elapsed_ms(self._started)
+        LoggerService.log_event(
+            "ui.startup",
+            level=logging.INFO,
+            tabs_built=",".join(
+                name for name in self.TABS if name in self._built_tabs
+            ),
+            **{
+                step.replace(".", "_"): ms
+                for step, ms in self.startup_timings.items()
+            },
+        )
+
+    @staticmethod
+    def _elapsed_ms(started):
+        return round((time.perf_counter() - started) * 1000, 1)
+
     @pyqtSlot(object)
     def on_post_created(self, post):
-        self.feed_widget.update_feed()
+        # An unbuilt feed loads every post when it is first shown
+        if hasattr(self, "feed_widget"):
+            self.feed_widget.add_post(post)
 
     @pyqtSlot(object)
     def on_follower_added(self, follower):
-        self.followers_widget.update_followers()
-        self.profile_widget.update_follower_count()
+        self.schedule_follower_views_update()
 
     @pyqtSlot(object)
     def on_follower_removed(self, follower):
-        self.followers_widget.update_followers()
-        self.profile_widget.update_follower_count()
+        self.schedule_follower_views_update()
+
+    def schedule_follower_views_update(self):
+        """Refresh the follower views once per frame, not per follower"""
+        coalescer = RefreshCoalescer.get_instance()
+        if hasattr(self, "followers_widget"):
+            coalescer.mark_dirty(self.followers_widget.update_followers)
+        if hasattr(self, "profile_widget"):
+            coalescer.mark_dirty(self.profile_widget.update_follower_count)
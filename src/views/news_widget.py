@@ -25,6 +25,9 @@ class NewsWidget(QWidget):
         self.user_controller = None
         self.theme_manager = StyleManager.get_instance()
         self.company_service = CompanyService.get_instance()
+
+        # Drop shadows of the company cards, only shown in the light theme
+        self._company_shadows = []
         self.init_ui()
 
         # Connect to theme changes
@@ -63,6 +66,7 @@ class NewsWidget(QWidget):
         self.sponsorship_frame = QFrame()
         self.sponsorship_frame.setFrameShape(QFrame.Shape.StyledPanel)
         self.sponsorship_frame.setFrameShadow(QFrame.Shadow.Raised)
+        StyleManager.set_role(self.sponsorship_frame, "sponsorship-status")
 
         sponsorship_layout = QVBoxLayout(self.sponsorship_frame)
 
@@ -99,12 +103,10 @@ class NewsWidget(QWidget):
         # Update sponsorship status
         self.update_sponsorship_status()
 
-        # Apply theme styling
-        self.update_theme_styling()
-
     def refresh_companies_list(self):
         """Refresh the list of companies"""
         # Clear existing companies
+        self._company_shadows.clear()
         while self.companies_layout.count():
             item = self.companies_layout.takeAt(0)
             widget = item.widget()
@@ -124,9 +126,9 @@ class NewsWidget(QWidget):
         frame = QFrame()
         frame.setFrameShape(QFrame.Shape.StyledPanel)
 
-        # Base styling with clean design
-        # We'll adapt colors based on theme in update_theme_styling
-        self.update_company_frame_style(frame, company)
+        # Colours come from the theme stylesheet
+        StyleManager.set_role(frame, "company-card")
+        self.add_company_shadow(frame)
 
         layout = QVBoxLayout(frame)
         layout.setContentsMargins(16, 16, 16, 16)
@@ -138,32 +140,17 @@ class NewsWidget(QWidget):
 
         # Company name (removed colored dot indicator)
         name_label = QLabel(company.name)
-        name_label.setStyleSheet("font-weight: bold; font-size: 15px;")
-        name_label.setProperty("company_name", True)  # Mark for theme styling
+        StyleManager.set_role(name_label, "company-name")
         header_layout.addWidget(name_label)
 
         # Political alignment tag
         alignment_label = QLabel(company.political_alignment_string)
-        alignment_label.setStyleSheet(
-            "font-style: italic; padding: 4px 8px; border-radius: 10px;"
+        StyleManager.set_role(
+            alignment_label,
+            "alignment-tag",
+            leaning=company.political_leaning.name,
         )
 
-        if company.political_leaning.name == "LEFT":
-            alignment_label.setStyleSheet(
-                alignment_label.styleSheet()
-                + "background-color: #d4e6f1; color: #2874a6;"
-            )
-        elif company.political_leaning.name == "RIGHT":
-            alignment_label.setStyleSheet(
-                alignment_label.styleSheet()
-                + "background-color: #f5b7b1; color: #a93226;"
-            )
-        else:
-            alignment_label.setStyleSheet(
-                alignment_label.styleSheet()
-                + "background-color: #eaeded; color: #5d6d7e;"
-            )
-
         header_layout.addWidget(
             alignment_label, alignment=Qt.AlignmentFlag.AlignRight
         )
@@ -173,154 +160,44 @@ class NewsWidget(QWidget):
         separator = QFrame()
         separator.setFrameShape(QFrame.Shape.HLine)
         separator.setFrameShadow(QFrame.Shadow.Sunken)
-        separator.setProperty("separator", True)  # Mark for theme styling
+        StyleManager.set_role(separator, "separator")
         layout.addWidget(separator)
 
         # Company description
         desc_label = QLabel(company.description)
         desc_label.setWordWrap(True)
-        desc_label.setProperty("description", True)  # Mark for theme styling
+        StyleManager.set_role(desc_label, "company-description")
         layout.addWidget(desc_label)
 
         # Apply button
         apply_button = QPushButton("Apply for Sponsorship")
         apply_button.setCursor(Qt.CursorShape.PointingHandCursor)
 
-        # Style the button according to the company's political leaning
-        if company.political_leaning.name == "LEFT":
-            apply_button.setStyleSheet(
-                """
-                QPushButton {
-                    background-color: #3498db;
-                    color: white;
-                    border: none;
-                    padding: 8px;
-                    font-weight: bold;
-                    border-radius: 8px;
-                }
-                QPushButton:hover {
-                    background-color: #2980b9;
-                }
-                QPushButton:pressed {
-                    background-color: #1a5276;
-                }
-            """
-            )
-        elif company.political_leaning.name == "RIGHT":
-            apply_button.setStyleSheet(
-                """
-                QPushButton {
-                    background-color: #e74c3c;
-                    color: white;
-                    border: none;
-                    padding: 8px;
-                    font-weight: bold;
-                    border-radius: 8px;
-                }
-                QPushButton:hover {
-                    background-color: #c0392b;
-                }
-                QPushButton:pressed {
-                    background-color: #922b21;
-                }
-            """
-            )
-        else:
-            apply_button.setStyleSheet(
-                """
-                QPushButton {
-                    background-color: #95a5a6;
-                    color: white;
-                    border: none;
-                    padding: 8px;
-                    font-weight: bold;
-                    border-radius: 8px;
-                }
-                QPushButton:hover {
-                    background-color: #7f8c8d;
-                }
-                QPushButton:pressed {
-                    background-color: #616a6b;
-                }
-            """
-            )
+        # Coloured according to the company's political leaning
+        StyleManager.set_role(
+            apply_button, "apply", leaning=company.political_leaning.name
+        )
 
         apply_button.clicked.connect(
             lambda: self.apply_for_sponsorship(company)
         )
         layout.addWidget(apply_button)
 
-        # Store company reference for theme updates
+        # Store company reference on the card
         frame.setProperty("company", company.name)
 
         return frame
 
-    def update_company_frame_style(self, frame, company=None):
-        """Update the styling of company frames based on theme"""
-        current_theme = self.theme_manager.current_theme
-
-        if current_theme == "dark":
-            frame.setStyleSheet(
-                """
-                QFrame {
-                    border: 1px solid #444444;
-                    border-radius: 12px;
-                    background-color: #333333;
-                    margin: 8px 4px;
-                    padding: 0px;
-                }
-            """
-            )
-
-            # We need to use the fallback since shadow looks odd on dark theme
-            frame.setStyleSheet(
-                """
-                QFrame {
-                    border: 1px solid #444444;
-                    border-radius: 12px;
-                    background-color: #333333;
-                    margin: 8px 4px;
-                    padding: 0px;
-                    border-bottom: 3px solid #444444;
-                }
-            """
-            )
-        else:
-            frame.setStyleSheet(
-                """
-                QFrame {
-                    border: 1px solid #dddddd;
-                    border-radius: 12px;
-                    background-color: white;
-                    margin: 8px 4px;
-                    padding: 0px;
-                }
-            """
-            )
-
-            # Add shadow effect using Qt's native shadow capabilities
-            try:
-                shadow = QGraphicsDropShadowEffect()
-                shadow.setBlurRadius(10)
-                shadow.setColor(QColor(0, 0, 0, 30))  # Semi-transparent black
-                shadow.setOffset(0, 3)
-                frame.setGraphicsEffect(shadow)
-            except Exception as e:
-                # Fall back to a simpler style if shadow effects aren't
-                # supported
-                print(f"Shadow effect not applied: {e}")
-                frame.setStyleSheet(
-                    """
-                    QFrame {
-                        border: 1px solid #dddddd;
-                        border-radius: 12px;
-                        background-color: white;
-                        margin: 8px 4px;
-                        padding: 0px;
-                        border-bottom: 3px solid #dddddd;
-                    }
-                """
-                )
+    def add_company_shadow(self, frame):
+        """Give a company card a drop shadow, shown in the light theme"""
+        shadow = QGraphicsDropShadowEffect(frame)
+        shadow.setBlurRadius(10)
+        shadow.setColor(QColor(0, 0, 0, 30))  # Semi-transparent black
+        shadow.setOffset(0, 3)
+        # The shadow looks odd on the dark theme
+        shadow.setEnabled(self.theme_manager.current_theme == "light")
+        frame.setGraphicsEffect(shadow)
+        self._company_shadows.append(shadow)
 
     def update_sponsorship_status(self):
         """Update the sponsorship status display"""
@@ -492,89 +369,10 @@ class NewsWidget(QWidget):
                 parent.repaint()
                 parent = parent.parent()
 
-    def update_theme_styling(self):
-        """Update styling based on current theme"""
-        current_theme = self.theme_manager.current_theme
-
-        if current_theme == "dark":
-            self.sponsorship_frame.setStyleSheet(
-                """
-                QFrame {
-                    background-color: #353535;
-                    border: 1px solid #444444;
-                    border-radius: 8px;
-                }
-            """
-            )
-
-            # Update company frames for dark theme
-            for i in range(self.companies_layout.count()):
-                item = self.companies_layout.itemAt(i)
-                if item and item.widget():
-                    widget = item.widget()
-                    if isinstance(widget, QFrame) and widget.property(
-                        "company"
-                    ):
-                        self.update_company_frame_style(widget)
-
-            # Update labels in company frames
-            for child in self.findChildren(QLabel):
-                if child.property("company_name"):
-                    child.setStyleSheet(
-                        "font-weight: bold; font-size: 15px; color: #ffffff;"
-                    )
-                elif child.property("description"):
-                    child.setStyleSheet(
-                        "color: #bbbbbb; margin-top: 4px; margin-bottom: 8px; line-height: 140%;"
-                    )
-
-            # Update separators
-            for child in self.findChildren(QFrame):
-                if child.property("separator"):
-                    child.setStyleSheet(
-                        "background-color: #555555; min-height: 1px; max-height: 1px; margin: 4px 0px;"
-                    )
-
-        else:
-            self.sponsorship_frame.setStyleSheet(
-                """
-                QFrame {
-                    background-color: #f8f9fa;
-                    border: 1px solid #e0e0e0;
-                    border-radius: 8px;
-                }
-            """
-            )
-
-            # Update company frames for light theme
-            for i in range(self.companies_layout.count()):
-                item = self.companies_layout.itemAt(i)
-                if item and item.widget():
-                    widget = item.widget()
-                    if isinstance(widget, QFrame) and widget.property(
-                        "company"
-                    ):
-                        self.update_company_frame_style(widget)
-
-            # Update labels in company frames
-            for child in self.findChildren(QLabel):
-                if child.property("company_name"):
-                    child.setStyleSheet(
-                        "font-weight: bold; font-size: 15px; color: #000000;"
-                    )
-                elif child.property("description"):
-                    child.setStyleSheet(
-                        "color: #555555; margin-top: 4px; margin-bottom: 8px; line-height: 140%;"
-                    )
-
-            # Update separators
-            for child in self.findChildren(QFrame):
-                if child.property("separator"):
-                    child.setStyleSheet(
-                        "background-color: #eeeeee; min-height: 1px; max-height: 1px; margin: 4px 0px;"
-                    )
-
     @pyqtSlot(str)
     def on_theme_changed(self, theme):
         """Handle theme changes"""
-        self.update_theme_styling()
+        # Colours are switched by the application stylesheet; only the
+        # card shadows need updating here
+        for shadow in self._company_shadows:
+            shadow.setEnabled(theme == "light")
@@ -0,0 +1,175 @@
+import os
+import threading
+from collections import OrderedDict
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QBrush, QColor, QPainter, QPainterPath, QPen, QPixmap
+
+
+# Get the path to the base profile picture
+def get_base_profile_picture_path():
+    """Get the path to the base profile picture"""
+    views_dir = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(
+        views_dir, "user_data", "profile_pictures", "base_profile_picture.png"
+    )
+
+
+# Function to create circular profile pictures
+def create_circular_pixmap(
+    pixmap, size=100, border_size=3, border_color="#888888"
+):
+    """Create a circular cropped version of a pixmap with border"""
+    # Handle null pixmap
+    if pixmap.isNull():
+        # Create a solid colored placeholder instead
+        result = QPixmap(size, size)
+        result.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(result)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        # Draw a filled circle
+        painter.setPen(QPen(QColor(border_color), border_size))
+        painter.setBrush(QBrush(QColor("#cccccc")))
+        painter.drawEllipse(
+            border_size // 2,
+            border_size // 2,
+            size - border_size,
+            size - border_size,
+        )
+
+        painter.end()
+        return result
+
+    # Scale the pixmap maintaining aspect ratio
+    scaled_pixmap = pixmap.scaled(
+        size,
+        size,
+        Qt.AspectRatioMode.KeepAspectRatio,
+        Qt.TransformationMode.SmoothTransformation,
+    )
+
+    # Create a new transparent pixmap
+    rounded = QPixmap(size, size)
+    rounded.fill(Qt.GlobalColor.transparent)
+
+    # Create a painter for drawing on the pixmap
+    painter = QPainter(rounded)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+    # Draw the scaled pixmap in a circular shape
+    path = QPainterPath()
+    path.addEllipse(
+        border_size,
+        border_size,
+        size - 2 * border_size,
+        size - 2 * border_size,
+    )
+    painter.setClipPath(path)
+
+    # Center the image if it's not square
+    x_offset = (size - scaled_pixmap.width()) // 2
+    y_offset = (size - scaled_pixmap.height()) // 2
+    painter.drawPixmap(x_offset, y_offset, scaled_pixmap)
+
+    # Reset clip path and draw border
+    painter.setClipping(False)
+    painter.setPen(QPen(QColor(border_color), border_size))
+    painter.setBrush(Qt.BrushStyle.NoBrush)
+    painter.drawEllipse(
+        border_size // 2,
+        border_size // 2,
+        size - border_size,
+        size - border_size,
+    )
+
+    painter.end()
+    return rounded
+
+
+class PixmapCache:
+    """Process-wide LRU cache of decoded, pre-rendered circular avatars.
+
+    Entries are keyed by (path, mtime, size, border) so a replaced picture
+    file is picked up, and evicted least recently used first once the
+    cached pixmaps exceed max_bytes.
+    """
+
+    # Default memory cap for cached pixmaps
+    DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+    # Singleton instance
+    _instance = None
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            cls._instance = PixmapCache()
+        return cls._instance
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def circular_avatar(
+        self, path, size=100, border_size=3, border_color="#888888"
+    ):
+        """Return the circular avatar for a picture, rendering it once."""
+        path = path or get_base_profile_picture_path()
+        key = (path, self._mtime(path), size, border_size, border_color)
+
+        with self._lock:
+            avatar = self._entries.get(key)
+            if avatar is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return avatar
+            self.misses += 1
+
+        pixmap = QPixmap(path)
+        if pixmap.isNull():  # If loading fails, use base picture
+            pixmap = QPixmap(get_base_profile_picture_path())
+        avatar = create_circular_pixmap(
+            pixmap,
+            size=size,
+            border_size=border_size,
+            border_color=border_color,
+        )
+
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = avatar
+                self.current_bytes += self._pixmap_bytes(avatar)
+                self._evict()
+        return avatar
+
+    def clear(self):
+        """Drop every cached pixmap."""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def _evict(self):
+        # Keep at least the newest entry even if it alone exceeds the cap
+        while self.current_bytes > self.max_bytes and len(self._entries) > 1:
+            _, pixmap = self._entries.popitem(last=False)
+            self.current_bytes -= self._pixmap_bytes(pixmap)
+
+    @staticmethod
+    def _mtime(path):
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+    @staticmethod
+    def _pixmap_bytes(pixmap):
+        return pixmap.width() * pixmap.height() * max(1, pixmap.depth()) // 8
@@ -0,0 +1,284 @@
+from PyQt6.QtCore import QEvent, QRect, QSize, Qt, pyqtSignal
+from PyQt6.QtGui import QColor, QFont, QFontMetrics, QPen
+from PyQt6.QtWidgets import (
+    QApplication,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionButton,
+)
+
+from src.models.post import Sentiment
+from src.views.image_loader import ImageLoader
+from src.views.pixmap_cache import PixmapCache
+from src.views.post_list_model import PostListModel
+from src.views.style_manager import THEME_PALETTES, StyleManager
+from src.views.text_layout_cache import TextLayoutCache
+
+SENTIMENT_LABELS = {
+    Sentiment.LEFT: ("Left-leaning", "blue"),
+    Sentiment.RIGHT: ("Right-leaning", "red"),
+    Sentiment.NEUTRAL: ("Neutral", "gray"),
+}
+
+
+class PostDelegate(QStyledItemDelegate):
+    """Paints posts in the feed list without creating widgets per post"""
+
+    # Emitted with the post whose "View Comments" button was clicked
+    comments_requested = pyqtSignal(object)
+
+    MARGIN = 5
+    PADDING = 10
+    SPACING = 10
+    AVATAR_SIZE = 40
+    CONTENT_MAX_HEIGHT = 100
+    MORE_TEXT = "Show more"
+    LESS_TEXT = "Show less"
+    IMAGE_MAX_WIDTH = 400
+    IMAGE_MAX_HEIGHT = 300
+    BUTTON_HEIGHT = 28
+    PLACEHOLDER_COLOR = "#d0d0d0"
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.theme_manager = StyleManager.get_instance()
+        self.image_loader = ImageLoader.get_instance()
+        self.text_layouts = TextLayoutCache.get_instance()
+
+        # Ids of posts whose clipped body has been expanded
+        self.expanded = set()
+
+    def sizeHint(self, option, index):
+        post = index.data(PostListModel.PostRole)
+        if post is None:
+            return super().sizeHint(option, index)
+
+        width = self._row_width(option)
+        layout = self._layout(QRect(0, 0, width, 0), post, option.font)
+        return QSize(width, layout["height"])
+
+    def paint(self, painter, option, index):
+        post = index.data(PostListModel.PostRole)
+        if post is None:
+            super().paint(painter, option, index)
+            return
+
+        layout = self._layout(option.rect, post, option.font)
+        palette = THEME_PALETTES.get(
+            self.theme_manager.current_theme, THEME_PALETTES["light"]
+        )
+        border_color = palette["card_border"]
+        background = palette["card_background"]
+        text_color = option.palette.color(option.palette.ColorRole.Text)
+
+        painter.save()
+        painter.setRenderHint(painter.RenderHint.Antialiasing)
+        painter.setClipRect(option.rect)
+
+        # Card
+        painter.setPen(QPen(QColor(border_color), 1))
+        painter.setBrush(QColor(background))
+        painter.drawRoundedRect(layout["card"], 8, 8)
+
+        # Avatar
+        painter.drawPixmap(layout["avatar"], self._avatar(post.author))
+
+        # Author handle and timestamp
+        bold_font = QFont(option.font)
+        bold_font.setBold(True)
+        painter.setFont(bold_font)
+        painter.setPen(text_color)
+        painter.drawText(
+            layout["author"],
+            Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+            f"@{post.author.handle}" if post.author else "Anonymous",
+        )
+
+        small_font = QFont(option.font)
+        small_font.setPointSizeF(max(1.0, option.font.pointSizeF() - 2))
+        painter.setFont(small_font)
+        painter.setPen(QColor("gray"))
+        painter.drawText(
+            layout["timestamp"],
+            Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+            post.timestamp.strftime("%Y-%m-%d %H:%M"),
+        )
+
+        # Content, cut off at CONTENT_MAX_HEIGHT unless expanded
+        painter.setPen(text_color)
+        self.text_layouts.draw(
+            painter, layout["content"], post.content, option.font
+        )
+        painter.setFont(option.font)
+        if "more" in layout:
+            painter.setPen(option.palette.color(option.palette.ColorRole.Link))
+            painter.drawText(
+                layout["more"],
+                Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+                self._more_text(post),
+            )
+            painter.setPen(text_color)
+
+        # Image
+        if "image" in layout:
+            pixmap = self._image(post.image_path)
+            if pixmap is not None:
+                painter.drawPixmap(layout["image"], pixmap)
+            else:
+                # Still decoding in the background
+                painter.setPen(Qt.PenStyle.NoPen)
+                painter.setBrush(QColor(self.PLACEHOLDER_COLOR))
+                painter.drawRect(layout["image"])
+                painter.setPen(QColor("gray"))
+                painter.drawText(
+                    layout["image"],
+                    Qt.AlignmentFlag.AlignCenter,
+                    "Loading image...",
+                )
+                painter.setPen(text_color)
+
+        # Stats and sentiment
+        painter.drawText(
+            layout["stats"],
+            Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+            f"❤️ {post.likes}    🔄 {post.shares}    "
+            f"💬 {post.comment_count}",
+        )
+        sentiment_text, sentiment_color = SENTIMENT_LABELS.get(
+            post.sentiment, SENTIMENT_LABELS[Sentiment.NEUTRAL]
+        )
+        painter.setPen(QColor(sentiment_color))
+        painter.drawText(
+            layout["stats"],
+            Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
+            sentiment_text,
+        )
+        painter.restore()
+
+        # View comments button
+        button = QStyleOptionButton()
+        button.rect = layout["button"]
+        button.text = "View Comments"
+        button.state = QStyle.StateFlag.State_Enabled
+        style = (
+            option.widget.style() if option.widget else QApplication.style()
+        )
+        style.drawControl(
+            QStyle.ControlElement.CE_PushButton, button, painter, option.widget
+        )
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.Type.MouseButtonRelease:
+            post = index.data(PostListModel.PostRole)
+            if post is not None:
+                layout = self._layout(option.rect, post, option.font)
+                position = event.position().toPoint()
+                if layout["button"].contains(position):
+                    self.comments_requested.emit(post)
+                    return True
+                if "more" in layout and layout["more"].contains(position):
+                    self.expanded ^= {post.post_id}
+                    self.sizeHintChanged.emit(index)
+                    return True
+        return super().editorEvent(event, model, option, index)
+
+    def _row_width(self, option):
+        widget = option.widget
+        if widget is not None and hasattr(widget, "viewport"):
+            return widget.viewport().width()
+        return option.rect.width()
+
+    def _layout(self, rect, post, font):
+        # Rectangles for each part of a post row; also gives the row height
+        metrics = QFontMetrics(font)
+        card = QRect(
+            rect.x() + self.MARGIN,
+            rect.y() + self.MARGIN,
+            rect.width() - 2 * self.MARGIN,
+            0,
+        )
+        inner_x = card.x() + self.PADDING
+        inner_width = max(1, card.width() - 2 * self.PADDING)
+        y = card.y() + self.PADDING
+
+        layout = {}
+        layout["avatar"] = QRect(
+            inner_x, y, self.AVATAR_SIZE, self.AVATAR_SIZE
+        )
+        text_x = inner_x + self.AVATAR_SIZE + self.SPACING
+        text_width = max(1, inner_width - self.AVATAR_SIZE - self.SPACING)
+        half = self.AVATAR_SIZE // 2
+        layout["author"] = QRect(text_x, y, text_width, half)
+        layout["timestamp"] = QRect(text_x, y + half, text_width, half)
+        y += self.AVATAR_SIZE + self.SPACING
+
+        # Bodies taller than CONTENT_MAX_HEIGHT are cut off there, with a
+        # link below them to show the rest
+        text_height = self.text_layouts.height(
+            post.content, inner_width, font
+        )
+        content_height = text_height
+        if text_height > self.CONTENT_MAX_HEIGHT:
+            if post.post_id not in self.expanded:
+                content_height = self.CONTENT_MAX_HEIGHT
+            layout["more"] = QRect(
+                inner_x,
+                y + content_height,
+                metrics.horizontalAdvance(self._more_text(post)),
+                metrics.height(),
+            )
+        layout["content"] = QRect(inner_x, y, inner_width, content_height)
+        y += content_height + self.SPACING
+        if "more" in layout:
+            y += metrics.height()
+
+        # The size comes from the image header, so rows keep their height
+        # when the decoded image arrives
+        image_size = (
+            self.image_loader.scaled_size(
+                post.image_path, self.IMAGE_MAX_WIDTH, self.IMAGE_MAX_HEIGHT
+            )
+            if post.image_path
+            else QSize()
+        )
+        if not image_size.isEmpty():
+            layout["image"] = QRect(
+                inner_x + max(0, (inner_width - image_size.width()) // 2),
+                y,
+                image_size.width(),
+                image_size.height(),
+            )
+            y += image_size.height() + self.SPACING
+
+        stats_height = metrics.height() + 4
+        layout["stats"] = QRect(inner_x, y, inner_width, stats_height)
+        y += stats_height + self.PADDING
+
+        card.setHeight(y - card.y())
+        layout["card"] = card
+
+        layout["button"] = QRect(
+            card.x(), y + self.MARGIN, card.width(), self.BUTTON_HEIGHT
+        )
+        y += self.MARGIN + self.BUTTON_HEIGHT + self.MARGIN
+
+        layout["height"] = y - rect.y()
+        return layout
+
+    def _more_text(self, post):
+        if post.post_id in self.expanded:
+            return self.LESS_TEXT
+        return self.MORE_TEXT
+
+    def _avatar(self, author):
+        return PixmapCache.get_instance().circular_avatar(
+            getattr(author, "profile_picture_path", None),
+            size=self.AVATAR_SIZE,
+            border_size=2,
+        )
+
+    def _image(self, path):
+        # Scaled pixmap, or None while the loader is still decoding it
+        return self.image_loader.request(
+            path, self.IMAGE_MAX_WIDTH, self.IMAGE_MAX_HEIGHT
+        )
@@ -0,0 +1,120 @@
+from PyQt6.QtCore import QAbstractListModel, QModelIndex, Qt
+
+from src.views.refresh_coalescer import RefreshCoalescer
+
+
+class PostListModel(QAbstractListModel):
+    """List model over a user's posts, newest first"""
+
+    # Role returning the Post object for a row
+    PostRole = Qt.ItemDataRole.UserRole + 1
+
+    def __init__(self, user=None, parent=None):
+        super().__init__(parent)
+        self.user = user
+
+        # Posts are stored oldest first so a new post is an append; row 0
+        # is the last entry. _indexes maps post_id to its list position
+        self._posts = []
+        self._indexes = {}
+        self._connections = {}
+        self.reset_posts()
+
+    def set_user(self, user):
+        """Show the posts of another user."""
+        self.user = user
+        self.reset_posts()
+
+    def reset_posts(self):
+        """Reload every post from the user."""
+        self.beginResetModel()
+        for post in self._posts:
+            self._disconnect_post(post)
+
+        self._posts = self.user.posts if self.user else []
+        self._indexes = {
+            post.post_id: position for position, post in enumerate(self._posts)
+        }
+        for post in self._posts:
+            self._connect_post(post)
+        self.endResetModel()
+
+    def add_post(self, post):
+        """Insert a newly created post at the top of the list."""
+        if post.post_id in self._indexes:
+            return
+
+        self.beginInsertRows(QModelIndex(), 0, 0)
+        self._indexes[post.post_id] = len(self._posts)
+        self._posts.append(post)
+        self._connect_post(post)
+        self.endInsertRows()
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._posts)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._posts):
+            return None
+
+        post = self.post_at(index.row())
+        if role == self.PostRole:
+            return post
+        if role in (
+            Qt.ItemDataRole.DisplayRole,
+            Qt.ItemDataRole.ToolTipRole,
+        ):
+            return post.content
+        return None
+
+    def post_at(self, row):
+        """Return the post shown in a row."""
+        return self._posts[len(self._posts) - 1 - row]
+
+    def row_of(self, post):
+        """Return the row showing a post, or -1 if it is not in the list."""
+        position = self._indexes.get(post.post_id)
+        if position is None:
+            return -1
+        return len(self._posts) - 1 - position
+
+    def _connect_post(self, post):
+        # Repaint a row when the counters of its post change
+        def refresh(*_):
+            self._post_changed(post)
+
+        signals = (
+            post.likes_changed,
+            post.shares_changed,
+            post.comments_changed,
+            post.sentiment_changed,
+        )
+        for signal in signals:
+            signal.connect(refresh)
+        self._connections[id(post)] = (signals, refresh)
+
+    def _disconnect_post(self, post):
+        signals, refresh = self._connections.pop(id(post), ((), None))
+        for signal in signals:
+            try:
+                signal.disconnect(refresh)
+            except TypeError:
+                pass  # Already disconnected
+
+    def _post_changed(self, post):
+        # Counter signals come in bursts, so rows are refreshed at most
+        # once per frame
+        RefreshCoalescer.get_instance().mark_dirty(
+            lambda: self._refresh_post(post),
+            key=(self, post.post_id),
+            owner=self,
+        )
+
+    def _refresh_post(self, post):
+        row = self.row_of(post)
+        if row < 0:
+            return
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
@@ -1,28 +1,121 @@
-from PyQt6.QtCore import Qt, pyqtSlot
-from PyQt6.QtGui import QPixmap
+from PyQt6.QtCore import QRect, QSize, Qt, pyqtSlot
+from PyQt6.QtGui import QPainter, QPalette
 from PyQt6.QtWidgets import (
-    QDialog,
     QFrame,
     QHBoxLayout,
     QLabel,
     QPushButton,
-    QScrollArea,
-    QTextEdit,
+    QSizePolicy,
     QVBoxLayout,
     QWidget,
 )
 
 from src.models.post import Sentiment
+from src.views.comments_dialog import CommentsDialog
+from src.views.image_loader import ImageLoader
+from src.views.pixmap_cache import PixmapCache
+from src.views.refresh_coalescer import RefreshCoalescer
 from src.views.style_manager import StyleManager
-from src.views.user_profile_widget import (
-    create_circular_pixmap,
-    get_base_profile_picture_path,
-)
+from src.views.text_layout_cache import TextLayoutCache
+
+
+class PostBodyLabel(QWidget):
+    """Read-only post text painted from a shared, cached text layout.
+
+    Replaces a QTextEdit per post: the text is wrapped once per width by
+    TextLayoutCache. Bodies taller than max_height are cut off there with
+    a "Show more" link below them that expands the label to the full text.
+    """
+
+    MORE_TEXT = "Show more"
+    LESS_TEXT = "Show less"
+
+    def __init__(self, text, max_height=100, parent=None):
+        super().__init__(parent)
+        self.text = text
+        self.max_height = max_height
+        self.expanded = False
+        self.text_layouts = TextLayoutCache.get_instance()
+
+        size_policy = QSizePolicy(
+            QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred
+        )
+        size_policy.setHeightForWidth(True)
+        self.setSizePolicy(size_policy)
+
+    def hasHeightForWidth(self):
+        return True
+
+    def is_clipped(self, width):
+        """Whether the full text is taller than max_height at width."""
+        return self._text_height(width) > self.max_height
+
+    def set_expanded(self, expanded):
+        """Show the full text, or cut it off at max_height again."""
+        self.expanded = expanded
+        self.updateGeometry()
+        self.update()
+
+    def heightForWidth(self, width):
+        text_height = self._text_height(width)
+        if text_height <= self.max_height:
+            return text_height
+        visible = text_height if self.expanded else self.max_height
+        return visible + self.fontMetrics().height()
+
+    def sizeHint(self):
+        width = max(self.width(), 200)
+        return QSize(width, self.heightForWidth(width))
+
+    def minimumSizeHint(self):
+        return QSize(0, self.fontMetrics().height())
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        text_rect = self.rect()
+        if self.is_clipped(text_rect.width()):
+            link_rect = self._link_rect()
+            text_rect.setBottom(link_rect.top() - 1)
+            painter.setPen(self.palette().color(QPalette.ColorRole.Link))
+            painter.drawText(
+                link_rect,
+                Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+                self._link_text(),
+            )
+        painter.setPen(self.palette().color(self.foregroundRole()))
+        self.text_layouts.draw(painter, text_rect, self.text, self.font())
+        painter.end()
+
+    def mouseReleaseEvent(self, event):
+        if self.is_clipped(self.width()) and self._link_rect().contains(
+            event.position().toPoint()
+        ):
+            self.set_expanded(not self.expanded)
+            return
+        super().mouseReleaseEvent(event)
+
+    def _text_height(self, width):
+        return self.text_layouts.height(self.text, width, self.font())
+
+    def _link_text(self):
+        return self.LESS_TEXT if self.expanded else self.MORE_TEXT
+
+    def _link_rect(self):
+        metrics = self.fontMetrics()
+        return QRect(
+            0,
+            self.height() - metrics.height(),
+            metrics.horizontalAdvance(self._link_text()),
+            metrics.height(),
+        )
 
 
 class PostWidget(QWidget):
     """Widget to display a single post"""
 
+    IMAGE_MAX_WIDTH = 400
+    IMAGE_MAX_HEIGHT = 300
+
     def __init__(self, post=None, parent=None):
         super().__init__(parent)
         self.post = post
@@ -30,9 +123,6 @@ class PostWidget(QWidget):
         self.theme_manager = StyleManager.get_instance()
         self.init_ui()
 
-        # Connect to theme changes
-        self.theme_manager.theme_changed.connect(self.on_theme_changed)
-
     def set_post_controller(self, controller):
         """Set the post controller."""
         self.post_controller = controller
@@ -45,6 +135,8 @@ class PostWidget(QWidget):
         self.post_frame = QFrame()
         self.post_frame.setFrameShape(QFrame.Shape.StyledPanel)
         self.post_frame.setFrameShadow(QFrame.Shadow.Raised)
+        # Colours come from the theme stylesheet
+        StyleManager.set_role(self.post_frame, "post-card")
         post_layout = QVBoxLayout()
         post_layout.setSpacing(10)  # Add more spacing between elements
         # Add padding inside the frame
@@ -60,30 +152,19 @@ class PostWidget(QWidget):
         self.author_avatar.setFixedSize(40, 40)
         self.author_avatar.setMinimumSize(40, 40)  # Ensure minimum size
 
-        # Path to base profile picture
-        base_profile_path = get_base_profile_picture_path()
-
-        # Load the profile picture
-        profile_pixmap = QPixmap()
+        # Shared, pre-rendered circular avatar
+        picture_path = None
         if (
             self.post
             and self.post.author
             and hasattr(self.post.author, "profile_picture_path")
-            and self.post.author.profile_picture_path
         ):
-            profile_pixmap.load(self.post.author.profile_picture_path)
-            if profile_pixmap.isNull():  # If loading fails, use base picture
-                profile_pixmap.load(base_profile_path)
-        else:
-            # Use base profile picture
-            profile_pixmap.load(base_profile_path)
-
-        # Create and set circular avatar
-        if not profile_pixmap.isNull():
-            circular_pixmap = create_circular_pixmap(
-                profile_pixmap, size=40, border_size=2
+            picture_path = self.post.author.profile_picture_path
+        self.author_avatar.setPixmap(
+            PixmapCache.get_instance().circular_avatar(
+                picture_path, size=40, border_size=2
             )
-            self.author_avatar.setPixmap(circular_pixmap)
+        )
 
         header_layout.addWidget(self.author_avatar)
 
@@ -107,22 +188,15 @@ class PostWidget(QWidget):
         header_layout.addLayout(author_info_layout, 1)  # Stretch factor 1
 
         # Post content
-        content_label = QTextEdit()
-        content_label.setReadOnly(True)
-        if self.post:
-            content_label.setText(self.post.content)
-        else:
-            content_label.setText("No content")
-        content_label.setMaximumHeight(100)
+        content_label = PostBodyLabel(
+            self.post.content if self.post else "No content", max_height=100
+        )
 
         # Post image if available
         if self.post and self.post.image_path:
-            self.image_label = QLabel()
-            pixmap = QPixmap(self.post.image_path)
-            scaled_pixmap = pixmap.scaled(
-                400, 300, Qt.AspectRatioMode.KeepAspectRatio
-            )
-            self.image_label.setPixmap(scaled_pixmap)
+            self.image_label = QLabel("Loading image...")
+            self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            self.load_image()
             post_layout.addWidget(
                 self.image_label, alignment=Qt.AlignmentFlag.AlignCenter
             )
@@ -150,7 +224,7 @@ class PostWidget(QWidget):
         comments_layout = QHBoxLayout()
         self.comments_icon = QLabel("💬")
         comments_layout.addWidget(self.comments_icon)
-        self.comments_label = QLabel(str(len(self.post.comments)))
+        self.comments_label = QLabel(str(self.post.comment_count))
         comments_layout.addWidget(self.comments_label)
         stats_layout.addLayout(comments_layout)
 
@@ -175,10 +249,10 @@ class PostWidget(QWidget):
         self.view_comments_button.clicked.connect(self.show_comments)
         layout.addWidget(self.view_comments_button)
 
-        # Set up signals
-        self.post.likes_changed.connect(self.update_likes)
-        self.post.shares_changed.connect(self.update_shares)
-        self.post.comments_changed.connect(self.update_comments)
+        # Set up signals; the counters are redrawn at most once per frame
+        self.post.likes_changed.connect(self.schedule_counts_update)
+        self.post.shares_changed.connect(self.schedule_counts_update)
+        self.post.comments_changed.connect(self.schedule_counts_update)
 
         # Connect sentiment_changed signal if it exists
         if hasattr(self.post, "sentiment_changed"):
@@ -186,41 +260,6 @@ class PostWidget(QWidget):
                 lambda _: self.update_sentiment_label()
             )
 
-        # Apply theme-based styling
-        self.update_theme_styling()
-
-    def update_theme_styling(self):
-        """Update styling based on current theme"""
-        current_theme = self.theme_manager.current_theme
-
-        if current_theme == "light":
-            self.post_frame.setStyleSheet(
-                """
-                QFrame {
-                    border: 1px solid #ccc;
-                    border-radius: 8px;
-                    background-color: white;
-                    padding: 10px;
-                }
-            """
-            )
-        else:  # dark theme
-            self.post_frame.setStyleSheet(
-                """
-                QFrame {
-                    border: 1px solid #444;
-                    border-radius: 8px;
-                    background-color: #353535;
-                    padding: 10px;
-                }
-            """
-            )
-
-    @pyqtSlot(str)
-    def on_theme_changed(self, theme):
-        """Handle theme changes"""
-        self.update_theme_styling()
-
     @pyqtSlot()
     def like_post(self):
         if self.post and self.post_controller:
@@ -262,117 +301,50 @@ class PostWidget(QWidget):
             self.sentiment_label.setText("Neutral")
             self.sentiment_label.setStyleSheet("color: gray;")
 
-    def show_comments(self):
-        """Show the comments dialog with scrollable content."""
-        dialog = QDialog(self)
-        dialog.setWindowTitle("Comments")
-        dialog.setMinimumWidth(400)
-        dialog.setMinimumHeight(500)  # Set a reasonable height
-
-        layout = QVBoxLayout(dialog)
-
-        # Create a scrollable area for comments
-
-        # Container widget for all comments
-        comments_container = QWidget()
-        comments_layout = QVBoxLayout(comments_container)
-
-        # Add comments to the container
-        if self.post.comments:
-            for comment in self.post.comments:
-                comment_widget = self.create_comment_widget(comment)
-                comments_layout.addWidget(comment_widget)
-        else:
-            # No comments message
-            no_comments = QLabel("No comments yet")
-            no_comments.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            comments_layout.addWidget(no_comments)
-
-        # Add some spacing at the bottom
-        comments_layout.addStretch()
-
-        # Create scroll area and set properties
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setWidget(comments_container)
-
-        layout.addWidget(scroll_area)
-
-        # Button layout
-        button_layout = QHBoxLayout()
-
-        # Close button
-        close_button = QPushButton("Close")
-        close_button.clicked.connect(dialog.accept)
-        button_layout.addWidget(close_button)
-
-        # Add button layout to main layout
-        layout.addLayout(button_layout)
-
-        dialog.setLayout(layout)
-        dialog.exec()
-
-    def create_comment_widget(self, comment):
-        """Create a widget for a single comment"""
-        comment_widget = QFrame()
-
-        # Apply theme-appropriate styling
-        if self.theme_manager.current_theme == "light":
-            comment_widget.setStyleSheet(
-                """
-                QFrame {
-                    border: 1px solid #eee;
-                    border-radius: 4px;
-                    background-color: #f9f9f9;
-                    padding: 8px;
-                    margin: 4px;
-                }
-            """
-            )
-        else:  # dark theme
-            comment_widget.setStyleSheet(
-                """
-                QFrame {
-                    border: 1px solid #444;
-                    border-radius: 4px;
-                    background-color: #2d2d2d;
-                    padding: 8px;
-                    margin: 4px;
-                }
-            """
-            )
-
-        comment_layout = QVBoxLayout(comment_widget)
-
-        # Author and timestamp header
-        header_layout = QHBoxLayout()
-
-        # Author label with verified badge if applicable
-        author_text = (
-            comment.author
-            if isinstance(comment.author, str)
-            else comment.author.handle
+    def load_image(self):
+        """Show the post image once it is decoded in the background."""
+        loader = ImageLoader.get_instance()
+        pixmap = loader.request(
+            self.post.image_path, self.IMAGE_MAX_WIDTH, self.IMAGE_MAX_HEIGHT
         )
-        author_label = QLabel(f"@{author_text}")
-        author_label.setStyleSheet("font-weight: bold;")
-        header_layout.addWidget(author_label)
-
-        # Timestamp on the right
-        timestamp_label = QLabel(comment.timestamp.strftime("%Y-%m-%d %H:%M"))
-        timestamp_label.setStyleSheet("color: gray; font-size: 10px;")
-        header_layout.addWidget(
-            timestamp_label, alignment=Qt.AlignmentFlag.AlignRight
+        if pixmap is not None:
+            self.image_label.setPixmap(pixmap)
+            return
+
+        # Reserve the final size so the post does not grow when the image
+        # arrives
+        size = loader.scaled_size(
+            self.post.image_path, self.IMAGE_MAX_WIDTH, self.IMAGE_MAX_HEIGHT
         )
+        if not size.isEmpty():
+            self.image_label.setFixedSize(size)
+        loader.image_ready.connect(self.on_image_ready)
+
+    @pyqtSlot(str, int, int)
+    def on_image_ready(self, path, max_width, max_height):
+        """Replace the placeholder with the decoded image."""
+        if (path, max_width, max_height) != (
+            self.post.image_path,
+            self.IMAGE_MAX_WIDTH,
+            self.IMAGE_MAX_HEIGHT,
+        ):
+            return
+        ImageLoader.get_instance().image_ready.disconnect(self.on_image_ready)
+        self.load_image()
 
-        # Comment content
-        content_label = QLabel(comment.content)
-        content_label.setWordWrap(True)
+    def show_comments(self):
+        """Show the comments dialog with scrollable content."""
+        CommentsDialog(self.post, self).exec()
 
-        # Add widgets to layout
-        comment_layout.addLayout(header_layout)
-        comment_layout.addWidget(content_label)
+    def schedule_counts_update(self, *_):
+        """Refresh the counters on the next frame."""
+        RefreshCoalescer.get_instance().mark_dirty(self.update_counts)
 
-        return comment_widget
+    def update_counts(self):
+        """Update the likes, shares and comments labels."""
+        self.update_likes(self.post.likes)
+        self.update_shares(self.post.shares)
+        self.update_comments(None)
 
     def update_likes(self, count):
         """Update the likes count label."""
@@ -385,4 +357,4 @@ class PostWidget(QWidget):
     def update_comments(self, _):
         """Update the comments count label."""
         # Always get the current comments from the post
-        self.comments_label.setText(str(len(self.post.comments)))
+        self.comments_label.setText(str(self.post.comment_count))
@@ -0,0 +1,67 @@
+from PyQt6 import sip
+from PyQt6.QtCore import QObject, QTimer
+
+
+class RefreshCoalescer(QObject):
+    """Batches view refreshes so each runs at most once per frame.
+
+    Views call mark_dirty() from their signal handlers instead of
+    refreshing directly. Repeated marks before the next frame collapse
+    into one call, so UI work follows the frame rate rather than the
+    number of model events.
+    """
+
+    # About 60 refreshes per second
+    FRAME_INTERVAL_MS = 16
+
+    # Singleton instance
+    _instance = None
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            cls._instance = RefreshCoalescer()
+        return cls._instance
+
+    def __init__(self, interval_ms=FRAME_INTERVAL_MS, parent=None):
+        super().__init__(parent)
+        # Pending refreshes by key, run in the order first marked
+        self._dirty = {}
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self.flush)
+
+    @property
+    def pending_count(self):
+        """Number of refreshes waiting for the next frame"""
+        return len(self._dirty)
+
+    def mark_dirty(self, callback, key=None, owner=None):
+        """Run callback on the next frame, once however often it is marked.
+
+        The callback itself is the key unless another key is given, so
+        marking the same bound method twice only refreshes once. The
+        refresh is skipped if owner (by default the object a bound method
+        belongs to) has been deleted by then.
+        """
+        if owner is None:
+            owner = getattr(callback, "__self__", None)
+        self._dirty[callback if key is None else key] = (callback, owner)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def discard(self, key):
+        """Drop a pending refresh, e.g. for a view being closed."""
+        self._dirty.pop(key, None)
+
+    def flush(self):
+        """Run every pending refresh now."""
+        self._timer.stop()
+        pending, self._dirty = self._dirty, {}
+        for callback, owner in pending.values():
+            # Skip views that were deleted after they were marked dirty
+            if isinstance(owner, QObject) and sip.isdeleted(owner):
+                continue
+            callback()
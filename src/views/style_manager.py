@@ -1,8 +1,358 @@
 import os
+from string import Template
 
-from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtCore import QObject, Qt, pyqtSignal
 from PyQt6.QtWidgets import QApplication
 
+LIGHT_BASE_STYLESHEET = """
+QMainWindow, QWidget {
+    background-color: #f9f9f9;
+    color: #333333;
+}
+
+QTabWidget::pane {
+    border: 1px solid #e0e0e0;
+    background-color: #ffffff;
+}
+
+QTabBar::tab {
+    background-color: #f0f0f0;
+    border: 1px solid #e0e0e0;
+    padding: 8px 12px;
+    margin-right: 2px;
+    border-top-left-radius: 4px;
+    border-top-right-radius: 4px;
+}
+
+QTabBar::tab:selected {
+    background-color: #ffffff;
+    border-bottom-color: #ffffff;
+    font-weight: bold;
+}
+
+QPushButton {
+    background-color: #4a86e8;
+    color: white;
+    border: none;
+    padding: 6px 16px;
+    border-radius: 4px;
+    font-weight: bold;
+}
+
+QPushButton:hover {
+    background-color: #3a76d8;
+}
+
+QPushButton:pressed {
+    background-color: #2a66c8;
+}
+
+QLineEdit, QTextEdit {
+    background-color: white;
+    border: 1px solid #e0e0e0;
+    border-radius: 4px;
+    padding: 5px;
+}
+
+QProgressBar {
+    border: 1px solid #e0e0e0;
+    border-radius: 4px;
+    text-align: center;
+    height: 12px;
+}
+
+QProgressBar::chunk {
+    background-color: #4a86e8;
+    border-radius: 3px;
+}
+
+QFrame {
+    border: 1px solid #e0e0e0;
+    border-radius: 4px;
+}
+
+QLabel {
+    color: #333333;
+}
+
+QScrollArea {
+    border: 1px solid #e0e0e0;
+    border-radius: 4px;
+    background-color: #ffffff;
+}
+
+QScrollBar:vertical {
+    border: none;
+    background: #f0f0f0;
+    width: 10px;
+    border-radius: 5px;
+}
+
+QScrollBar::handle:vertical {
+    background: #c0c0c0;
+    min-height: 20px;
+    border-radius: 5px;
+}
+
+QScrollBar::handle:vertical:hover {
+    background: #a0a0a0;
+}
+"""
+
+DARK_BASE_STYLESHEET = """
+QMainWindow, QWidget {
+    background-color: #2d2d2d;
+    color: #e0e0e0;
+}
+
+QTabWidget::pane {
+    border: 1px solid #444444;
+    background-color: #353535;
+}
+
+QTabBar::tab {
+    background-color: #444444;
+    border: 1px solid #555555;
+    padding: 5px 10px;
+    margin-right: 2px;
+}
+
+QTabBar::tab:selected {
+    background-color: #353535;
+    border-bottom-color: #353535;
+}
+
+QPushButton {
+    background-color: #0d8aee;
+    color: white;
+    border: none;
+    padding: 5px 15px;
+    border-radius: 3px;
+}
+
+QPushButton:hover {
+    background-color: #2196F3;
+}
+
+QPushButton:pressed {
+    background-color: #0c7cd5;
+}
+
+QLineEdit, QTextEdit {
+    background-color: #424242;
+    border: 1px solid #555555;
+    border-radius: 3px;
+    padding: 3px;
+    color: #e0e0e0;
+}
+
+QProgressBar {
+    border: 1px solid #555555;
+    border-radius: 3px;
+    text-align: center;
+}
+
+QProgressBar::chunk {
+    background-color: #0d8aee;
+}
+"""
+
+# Rules for widgets tagged with setProperty("role", ...). Colours that
+# differ between themes come from THEME_PALETTES
+ROLE_STYLESHEET = Template(
+    """
+QFrame[role="post-card"] {
+    border: 1px solid $card_border;
+    border-radius: 8px;
+    background-color: $card_background;
+    padding: 10px;
+}
+
+QFrame[role="comment"] {
+    border: 1px solid $comment_border;
+    border-radius: 4px;
+    background-color: $comment_background;
+    padding: 8px;
+    margin: 4px;
+}
+
+QFrame[role="sponsorship-status"] {
+    background-color: $panel_background;
+    border: 1px solid $panel_border;
+    border-radius: 8px;
+}
+
+QFrame[role="company-card"] {
+    border: 1px solid $company_border;
+    border-bottom: $company_border_bottom;
+    border-radius: 12px;
+    background-color: $company_background;
+    margin: 8px 4px;
+    padding: 0px;
+}
+
+QFrame[role="post-card"] QLabel,
+QFrame[role="comment"] QLabel,
+QFrame[role="company-card"] QLabel {
+    background-color: transparent;
+    border: none;
+}
+
+QLabel[role="company-name"] {
+    font-weight: bold;
+    font-size: 15px;
+    color: $company_name;
+}
+
+QLabel[role="company-description"] {
+    color: $company_description;
+    margin-top: 4px;
+    margin-bottom: 8px;
+}
+
+QFrame[role="separator"] {
+    background-color: $separator;
+    min-height: 1px;
+    max-height: 1px;
+    margin: 4px 0px;
+}
+
+QLabel[role="alignment-tag"] {
+    font-style: italic;
+    padding: 4px 8px;
+    border-radius: 10px;
+}
+
+QLabel[role="alignment-tag"][leaning="LEFT"] {
+    background-color: #d4e6f1;
+    color: #2874a6;
+}
+
+QLabel[role="alignment-tag"][leaning="RIGHT"] {
+    background-color: #f5b7b1;
+    color: #a93226;
+}
+
+QLabel[role="alignment-tag"][leaning="NEUTRAL"] {
+    background-color: #eaeded;
+    color: #5d6d7e;
+}
+
+QPushButton[role="apply"] {
+    color: white;
+    border: none;
+    padding: 8px;
+    font-weight: bold;
+    border-radius: 8px;
+}
+
+QPushButton[role="apply"][leaning="LEFT"] {
+    background-color: #3498db;
+}
+
+QPushButton[role="apply"][leaning="LEFT"]:hover {
+    background-color: #2980b9;
+}
+
+QPushButton[role="apply"][leaning="LEFT"]:pressed {
+    background-color: #1a5276;
+}
+
+QPushButton[role="apply"][leaning="RIGHT"] {
+    background-color: #e74c3c;
+}
+
+QPushButton[role="apply"][leaning="RIGHT"]:hover {
+    background-color: #c0392b;
+}
+
+QPushButton[role="apply"][leaning="RIGHT"]:pressed {
+    background-color: #922b21;
+}
+
+QPushButton[role="apply"][leaning="NEUTRAL"] {
+    background-color: #95a5a6;
+}
+
+QPushButton[role="apply"][leaning="NEUTRAL"]:hover {
+    background-color: #7f8c8d;
+}
+
+QPushButton[role="apply"][leaning="NEUTRAL"]:pressed {
+    background-color: #616a6b;
+}
+
+QLabel[role="bio"] {
+    padding: 10px;
+    background-color: $bio_background;
+    border-radius: 5px;
+    color: $text;
+}
+
+QDialog[role="profile-dialog"] {
+    background-color: $dialog_background;
+    color: $text;
+}
+
+QDialog[role="profile-dialog"] QLabel {
+    color: $text;
+    font-size: 14px;
+}
+
+QDialog[role="profile-dialog"] QLineEdit,
+QDialog[role="profile-dialog"] QTextEdit {
+    background-color: $input_background;
+    color: $text;
+    border: 1px solid $input_border;
+    border-radius: 4px;
+    padding: 5px;
+}
+"""
+)
+
+THEME_PALETTES = {
+    "light": {
+        "base": LIGHT_BASE_STYLESHEET,
+        "text": "#333333",
+        "card_border": "#cccccc",
+        "card_background": "white",
+        "comment_border": "#eeeeee",
+        "comment_background": "#f9f9f9",
+        "panel_border": "#e0e0e0",
+        "panel_background": "#f8f9fa",
+        "company_border": "#dddddd",
+        "company_border_bottom": "1px solid #dddddd",
+        "company_background": "white",
+        "company_name": "#000000",
+        "company_description": "#555555",
+        "separator": "#eeeeee",
+        "bio_background": "rgba(0, 0, 0, 0.05)",
+        "dialog_background": "#ffffff",
+        "input_background": "#ffffff",
+        "input_border": "#e0dbd2",
+    },
+    "dark": {
+        "base": DARK_BASE_STYLESHEET,
+        "text": "#e0e0e0",
+        "card_border": "#444444",
+        "card_background": "#353535",
+        "comment_border": "#444444",
+        "comment_background": "#2d2d2d",
+        "panel_border": "#444444",
+        "panel_background": "#353535",
+        "company_border": "#444444",
+        "company_border_bottom": "3px solid #444444",
+        "company_background": "#333333",
+        "company_name": "#ffffff",
+        "company_description": "#bbbbbb",
+        "separator": "#555555",
+        "bio_background": "rgba(255, 255, 255, 0.1)",
+        "dialog_background": "#2d2d2d",
+        "input_background": "#3d3d3d",
+        "input_border": "#555555",
+    },
+}
+
 
 class StyleManager(QObject):
 
@@ -23,6 +373,9 @@ class StyleManager(QObject):
         super().__init__()
         self._current_theme = "light"  # Default theme
 
+        # Compiled application stylesheet per theme
+        self._stylesheets = {}
+
         # Create necessary directories
         self._ensure_style_directories()
 
@@ -48,175 +401,39 @@ class StyleManager(QObject):
 
     def set_theme(self, theme):
         """Set the application theme"""
-        if theme not in ["light", "dark"]:
+        if theme not in THEME_PALETTES:
             raise ValueError("Theme must be 'light' or 'dark'")
 
         self._current_theme = theme
 
-        # Apply the appropriate stylesheet
-        if theme == "light":
-            self._apply_light_theme()
-        else:
-            self._apply_dark_theme()
+        # One application stylesheet covers every widget, so switching
+        # re-polishes the widget tree once
+        app = QApplication.instance()
+        stylesheet = self.stylesheet(theme)
+        if app.styleSheet() != stylesheet:
+            app.setStyleSheet(stylesheet)
 
         # Emit signal that theme has changed
         self.theme_changed.emit(theme)
 
-    def _apply_light_theme(self):
-        """Apply light theme stylesheet"""
-        light_stylesheet = """
-        QMainWindow, QWidget {
-            background-color: #f9f9f9;
-            color: #333333;
-        }
-
-        QTabWidget::pane {
-            border: 1px solid #e0e0e0;
-            background-color: #ffffff;
-        }
-
-        QTabBar::tab {
-            background-color: #f0f0f0;
-            border: 1px solid #e0e0e0;
-            padding: 8px 12px;
-            margin-right: 2px;
-            border-top-left-radius: 4px;
-            border-top-right-radius: 4px;
-        }
-
-        QTabBar::tab:selected {
-            background-color: #ffffff;
-            border-bottom-color: #ffffff;
-            font-weight: bold;
-        }
-
-        QPushButton {
-            background-color: #4a86e8;
-            color: white;
-            border: none;
-            padding: 6px 16px;
-            border-radius: 4px;
-            font-weight: bold;
-        }
-
-        QPushButton:hover {
-            background-color: #3a76d8;
-        }
-
-        QPushButton:pressed {
-            background-color: #2a66c8;
-        }
-
-        QLineEdit, QTextEdit {
-            background-color: white;
-            border: 1px solid #e0e0e0;
-            border-radius: 4px;
-            padding: 5px;
-        }
-
-        QProgressBar {
-            border: 1px solid #e0e0e0;
-            border-radius: 4px;
-            text-align: center;
-            height: 12px;
-        }
-
-        QProgressBar::chunk {
-            background-color: #4a86e8;
-            border-radius: 3px;
-        }
-
-        QFrame {
-            border: 1px solid #e0e0e0;
-            border-radius: 4px;
-        }
-
-        QLabel {
-            color: #333333;
-        }
-
-        QScrollArea {
-            border: 1px solid #e0e0e0;
-            border-radius: 4px;
-            background-color: #ffffff;
-        }
-
-        QScrollBar:vertical {
-            border: none;
-            background: #f0f0f0;
-            width: 10px;
-            border-radius: 5px;
-        }
-
-        QScrollBar::handle:vertical {
-            background: #c0c0c0;
-            min-height: 20px;
-            border-radius: 5px;
-        }
-
-        QScrollBar::handle:vertical:hover {
-            background: #a0a0a0;
-        }
-        """
-        QApplication.instance().setStyleSheet(light_stylesheet)
-
-    def _apply_dark_theme(self):
-        """Apply dark theme stylesheet"""
-        dark_stylesheet = """
-        QMainWindow, QWidget {
-            background-color: #2d2d2d;
-            color: #e0e0e0;
-        }
-
-        QTabWidget::pane {
-            border: 1px solid #444444;
-            background-color: #353535;
-        }
-
-        QTabBar::tab {
-            background-color: #444444;
-            border: 1px solid #555555;
-            padding: 5px 10px;
-            margin-right: 2px;
-        }
-
-        QTabBar::tab:selected {
-            background-color: #353535;
-            border-bottom-color: #353535;
-        }
-
-        QPushButton {
-            background-color: #0d8aee;
-            color: white;
-            border: none;
-            padding: 5px 15px;
-            border-radius: 3px;
-        }
-
-        QPushButton:hover {
-            background-color: #2196F3;
-        }
-
-        QPushButton:pressed {
-            background-color: #0c7cd5;
-        }
-
-        QLineEdit, QTextEdit {
-            background-color: #424242;
-            border: 1px solid #555555;
-            border-radius: 3px;
-            padding: 3px;
-            color: #e0e0e0;
-        }
-
-        QProgressBar {
-            border: 1px solid #555555;
-            border-radius: 3px;
-            text-align: center;
-        }
-
-        QProgressBar::chunk {
-            background-color: #0d8aee;
-        }
-        """
-        QApplication.instance().setStyleSheet(dark_stylesheet)
+    def stylesheet(self, theme):
+        """Get the compiled application stylesheet for a theme"""
+        stylesheet = self._stylesheets.get(theme)
+        if stylesheet is None:
+            palette = THEME_PALETTES[theme]
+            stylesheet = palette["base"] + ROLE_STYLESHEET.substitute(palette)
+            self._stylesheets[theme] = stylesheet
+        return stylesheet
+
+    @staticmethod
+    def set_role(widget, role, **properties):
+        """Tag a widget for the role rules of the theme stylesheets"""
+        widget.setProperty("role", role)
+        for name, value in properties.items():
+            widget.setProperty(name, value)
+
+        # Widgets that are already styled must be re-polished to pick up
+        # the new properties
+        if widget.testAttribute(Qt.WidgetAttribute.WA_WState_Polished):
+            widget.style().unpolish(widget)
+            widget.style().polish(widget)
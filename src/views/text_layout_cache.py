@@ -0,0 +1,107 @@
+from collections import OrderedDict
+
+from PyQt6.QtCore import QPointF, Qt
+from PyQt6.QtGui import (
+    QFontMetricsF,
+    QStaticText,
+    QTextOption,
+    QTransform,
+)
+
+
+class TextLayoutCache:
+    """Process-wide LRU cache of word-wrapped text laid out once.
+
+    Post bodies are shown with QStaticText prepared for a given width and
+    font, one per line of text, instead of a QTextEdit per post, so each
+    body costs one cached layout rather than a document, layout engine
+    and scroll bars. Entries are keyed by (text, width, font) and evicted
+    least recently used first once there are more than max_entries.
+    """
+
+    # Enough for several screens of feed rows at a couple of widths
+    DEFAULT_MAX_ENTRIES = 2000
+
+    # Singleton instance
+    _instance = None
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            cls._instance = TextLayoutCache()
+        return cls._instance
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def paragraphs(self, text, width, font):
+        """Return text laid out to wrap at width in font.
+
+        QStaticText turns line breaks in plain text into spaces, so each
+        line is laid out on its own. The result is a tuple of
+        (static text, height) pairs from top to bottom.
+        """
+        width = max(1, int(width))
+        key = (text, width, font.key())
+        paragraphs = self._entries.get(key)
+        if paragraphs is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return paragraphs
+        self.misses += 1
+
+        # Blank lines keep the height of a line of text
+        line_height = QFontMetricsF(font).height()
+        paragraphs = []
+        for line in text.splitlines() or [text]:
+            static_text = QStaticText(line)
+            static_text.setTextFormat(Qt.TextFormat.PlainText)
+            static_text.setTextOption(
+                QTextOption(
+                    Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop
+                )
+            )
+            static_text.setTextWidth(width)
+            static_text.setPerformanceHint(
+                QStaticText.PerformanceHint.AggressiveCaching
+            )
+            static_text.prepare(QTransform(), font)
+            paragraphs.append(
+                (static_text, max(static_text.size().height(), line_height))
+            )
+        paragraphs = tuple(paragraphs)
+
+        self._entries[key] = paragraphs
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return paragraphs
+
+    def height(self, text, width, font):
+        """Height of text wrapped at width, in pixels."""
+        return int(
+            sum(height for _, height in self.paragraphs(text, width, font))
+            + 0.5
+        )
+
+    def draw(self, painter, rect, text, font):
+        """Draw text wrapped to rect's width, cut off at its bottom."""
+        painter.save()
+        painter.setFont(font)
+        painter.setClipRect(rect, Qt.ClipOperation.IntersectClip)
+        y = rect.top()
+        for static_text, height in self.paragraphs(text, rect.width(), font):
+            if y >= rect.bottom() + 1:
+                break
+            painter.drawStaticText(QPointF(rect.left(), y), static_text)
+            y += height
+        painter.restore()
+
+    def clear(self):
+        """Drop every cached layout."""
+        self._entries.clear()
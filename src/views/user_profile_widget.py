@@ -2,16 +2,7 @@ import os
 from datetime import datetime
 
 from PyQt6.QtCore import Qt, pyqtSlot
-from PyQt6.QtGui import (
-    QBrush,
-    QColor,
-    QFont,
-    QIcon,
-    QPainter,
-    QPainterPath,
-    QPen,
-    QPixmap,
-)
+from PyQt6.QtGui import QFont, QIcon, QPixmap
 from PyQt6.QtWidgets import (
     QDialog,
     QDialogButtonBox,
@@ -28,6 +19,12 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+from src.views.pixmap_cache import (
+    PixmapCache,
+    create_circular_pixmap,
+    get_base_profile_picture_path,
+)
+from src.views.refresh_coalescer import RefreshCoalescer
 from src.views.style_manager import StyleManager
 
 
@@ -48,92 +45,10 @@ def ensure_profile_directories():
     return profile_pictures_dir
 
 
-# Get the path to the base profile picture
-def get_base_profile_picture_path():
-    """Get the path to the base profile picture"""
-    views_dir = os.path.dirname(os.path.abspath(__file__))
-    return os.path.join(
-        views_dir, "user_data", "profile_pictures", "base_profile_picture.png"
-    )
-
-
 # Ensure directories exist when module is imported
 PROFILE_PICTURES_DIR = ensure_profile_directories()
 
 
-# Function to create circular profile pictures
-def create_circular_pixmap(
-    pixmap, size=100, border_size=3, border_color="#888888"
-):
-    """Create a circular cropped version of a pixmap with border"""
-    # Handle null pixmap
-    if pixmap.isNull():
-        # Create a solid colored placeholder instead
-        result = QPixmap(size, size)
-        result.fill(Qt.GlobalColor.transparent)
-
-        painter = QPainter(result)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-
-        # Draw a filled circle
-        painter.setPen(QPen(QColor(border_color), border_size))
-        painter.setBrush(QBrush(QColor("#cccccc")))
-        painter.drawEllipse(
-            border_size // 2,
-            border_size // 2,
-            size - border_size,
-            size - border_size,
-        )
-
-        painter.end()
-        return result
-
-    # Scale the pixmap maintaining aspect ratio
-    scaled_pixmap = pixmap.scaled(
-        size,
-        size,
-        Qt.AspectRatioMode.KeepAspectRatio,
-        Qt.TransformationMode.SmoothTransformation,
-    )
-
-    # Create a new transparent pixmap
-    rounded = QPixmap(size, size)
-    rounded.fill(Qt.GlobalColor.transparent)
-
-    # Create a painter for drawing on the pixmap
-    painter = QPainter(rounded)
-    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-
-    # Draw the scaled pixmap in a circular shape
-    path = QPainterPath()
-    path.addEllipse(
-        border_size,
-        border_size,
-        size - 2 * border_size,
-        size - 2 * border_size,
-    )
-    painter.setClipPath(path)
-
-    # Center the image if it's not square
-    x_offset = (size - scaled_pixmap.width()) // 2
-    y_offset = (size - scaled_pixmap.height()) // 2
-    painter.drawPixmap(x_offset, y_offset, scaled_pixmap)
-
-    # Reset clip path and draw border
-    painter.setClipping(False)
-    painter.setPen(QPen(QColor(border_color), border_size))
-    painter.setBrush(Qt.BrushStyle.NoBrush)
-    painter.drawEllipse(
-        border_size // 2,
-        border_size // 2,
-        size - border_size,
-        size - border_size,
-    )
-
-    painter.end()
-    return rounded
-
-
 class ProfileEditDialog(QDialog):
     """Dialog for editing profile information"""
 
@@ -146,11 +61,8 @@ class ProfileEditDialog(QDialog):
         )
         self.init_ui()
 
-        # Apply appropriate theme styling
-        self.update_theme_styling()
-
-        # Connect to theme changes
-        self.theme_manager.theme_changed.connect(self.on_theme_changed)
+        # Colours come from the theme stylesheet
+        StyleManager.set_role(self, "profile-dialog")
 
     def init_ui(self):
         self.setWindowTitle("Edit Profile")
@@ -176,15 +88,15 @@ class ProfileEditDialog(QDialog):
             hasattr(self.user, "profile_picture_path")
             and self.user.profile_picture_path
         ):
-            pixmap = QPixmap(self.user.profile_picture_path)
             self.temp_profile_picture_path = self.user.profile_picture_path
         else:
             # Use base profile picture
-            pixmap = QPixmap(base_profile_path)
             self.temp_profile_picture_path = base_profile_path
 
-        # Apply circular cropping
-        circular_pixmap = create_circular_pixmap(pixmap, size=100)
+        # Apply circular cropping (shared with the profile and feed views)
+        circular_pixmap = PixmapCache.get_instance().circular_avatar(
+            self.temp_profile_picture_path, size=100
+        )
 
         # Set the circular image
         self.picture_preview.setPixmap(circular_pixmap)
@@ -271,8 +183,9 @@ class ProfileEditDialog(QDialog):
             self.temp_profile_picture_path = file_path
 
             # Update preview with circular cropping
-            pixmap = QPixmap(file_path)
-            circular_pixmap = create_circular_pixmap(pixmap, size=100)
+            circular_pixmap = PixmapCache.get_instance().circular_avatar(
+                file_path, size=100
+            )
 
             # Set the circular image
             self.picture_preview.setPixmap(circular_pixmap)
@@ -286,8 +199,9 @@ class ProfileEditDialog(QDialog):
         self.temp_profile_picture_path = base_profile_path
 
         # Create circular preview
-        pixmap = QPixmap(base_profile_path)
-        circular_pixmap = create_circular_pixmap(pixmap, size=100)
+        circular_pixmap = PixmapCache.get_instance().circular_avatar(
+            base_profile_path, size=100
+        )
 
         # Set the circular image
         self.picture_preview.setPixmap(circular_pixmap)
@@ -347,56 +261,6 @@ class ProfileEditDialog(QDialog):
             # Return base profile picture on error
             return base_profile_path
 
-    def update_theme_styling(self):
-        """Update styling based on current theme"""
-        current_theme = self.theme_manager.current_theme
-
-        if current_theme == "dark":
-            self.setStyleSheet(
-                """
-                QDialog {
-                    background-color: #2d2d2d;
-                    color: #e0e0e0;
-                }
-                QLabel {
-                    color: #e0e0e0;
-                    font-size: 14px;
-                }
-                QLineEdit, QTextEdit {
-                    background-color: #3d3d3d;
-                    color: #e0e0e0;
-                    border: 1px solid #555555;
-                    border-radius: 4px;
-                    padding: 5px;
-                }
-            """
-            )
-        else:
-            self.setStyleSheet(
-                """
-                QDialog {
-                    background-color: #ffffff;
-                    color: #333333;
-                }
-                QLabel {
-                    color: #333333;
-                    font-size: 14px;
-                }
-                QLineEdit, QTextEdit {
-                    background-color: #ffffff;
-                    color: #333333;
-                    border: 1px solid #e0dbd2;
-                    border-radius: 4px;
-                    padding: 5px;
-                }
-            """
-            )
-
-    @pyqtSlot(str)
-    def on_theme_changed(self, theme):
-        """Handle theme changes"""
-        self.update_theme_styling()
-
 
 class UserProfileWidget(QWidget):
     """Widget to display and edit user profile information"""
@@ -408,9 +272,6 @@ class UserProfileWidget(QWidget):
         self.theme_manager = StyleManager.get_instance()
         self.init_ui()
 
-        # Connect to theme changes
-        self.theme_manager.theme_changed.connect(self.on_theme_changed)
-
         # Connect to user signals if available
         if self.user:
             self.user.follower_added.connect(self.on_follower_added)
@@ -472,13 +333,15 @@ class UserProfileWidget(QWidget):
             hasattr(self.user, "profile_picture_path")
             and self.user.profile_picture_path
         ):
-            pixmap = QPixmap(self.user.profile_picture_path)
+            picture_path = self.user.profile_picture_path
         else:
             # Use base profile picture
-            pixmap = QPixmap(base_profile_path)
+            picture_path = base_profile_path
 
         # Apply circular cropping
-        circular_pixmap = create_circular_pixmap(pixmap, size=100)
+        circular_pixmap = PixmapCache.get_instance().circular_avatar(
+            picture_path, size=100
+        )
 
         # Set the circular image
         self.avatar_label.setPixmap(circular_pixmap)
@@ -559,9 +422,7 @@ class UserProfileWidget(QWidget):
 
         self.bio_text = QLabel(self.user.bio if self.user else "")
         self.bio_text.setWordWrap(True)
-        self.bio_text.setStyleSheet(
-            "padding: 10px; background-color: rgba(0, 0, 0, 0.05); border-radius: 5px;"
-        )
+        StyleManager.set_role(self.bio_text, "bio")
         bio_layout.addWidget(self.bio_text)
         user_details_layout.addLayout(bio_layout)
 
@@ -639,9 +500,6 @@ class UserProfileWidget(QWidget):
         # Update the post count on initialization
         self.update_post_count()
 
-        # Apply theme-specific styling
-        self.update_theme_styling()
-
     @pyqtSlot()
     def open_edit_dialog(self):
         """Open dialog to edit profile details"""
@@ -714,46 +572,18 @@ class UserProfileWidget(QWidget):
             )
             self.posts_count_label.setText(f"{post_count} Posts")
 
-    def update_theme_styling(self):
-        """Update styling based on current theme"""
-        current_theme = self.theme_manager.current_theme
-
-        if current_theme == "dark":
-            self.bio_text.setStyleSheet(
-                """
-                padding: 10px;
-                background-color: rgba(255, 255, 255, 0.1);
-                border-radius: 5px;
-                color: #e0e0e0;
-            """
-            )
-        else:
-            self.bio_text.setStyleSheet(
-                """
-                padding: 10px;
-                background-color: rgba(0, 0, 0, 0.05);
-                border-radius: 5px;
-                color: #333333;
-            """
-            )
-
-    @pyqtSlot(str)
-    def on_theme_changed(self, theme):
-        """Handle theme changes"""
-        self.update_theme_styling()
-
-    # Add signal handlers
+    # Add signal handlers; counts are refreshed at most once per frame
     @pyqtSlot(object)
     def on_follower_added(self, follower):
         """Handle follower added signal"""
-        self.update_follower_count()
+        RefreshCoalescer.get_instance().mark_dirty(self.update_follower_count)
 
     @pyqtSlot(object)
     def on_follower_removed(self, follower):
         """Handle follower removed signal"""
-        self.update_follower_count()
+        RefreshCoalescer.get_instance().mark_dirty(self.update_follower_count)
 
     @pyqtSlot(object)
     def on_post_created(self, post):
         """Handle post created signal"""
-        self.update_post_count()
+        RefreshCoalescer.get_instance().mark_dirty(self.update_post_count)
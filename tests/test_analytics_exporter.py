@@ -0,0 +1,115 @@
+import csv
+import importlib.util
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+from src.models.follower import Follower
+from src.models.post import Post, Sentiment
+from src.models.user import User
+from src.patterns.command.post_commands import LikeCommand
+from src.services.analytics_exporter import AnalyticsExporter
+from src.services.logger_service import LoggerService
+
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+
+class TestAnalyticsExporter(unittest.TestCase):
+    def setUp(self):
+        """Export into a temporary directory."""
+        LoggerService._logger = MagicMock()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.user = User("test_user", "Test bio")
+
+    def tearDown(self):
+        LoggerService._event_sinks = []
+        self.temp_dir.cleanup()
+
+    def make_posts(self, count):
+        posts = []
+        for i in range(count):
+            post = Post(f"Post {i}", self.user)
+            post.sentiment = Sentiment.LEFT
+            post._increment_likes(i)
+            posts.append(post)
+        return posts
+
+    def read_csv(self, exporter, table):
+        with open(exporter.path(table), newline="", encoding="utf-8") as f:
+            return list(csv.DictReader(f))
+
+    def test_csv_posts_written_in_chunks(self):
+        """Full chunks are written before close; the rest on flush."""
+        exporter = AnalyticsExporter(
+            self.temp_dir.name, export_format="csv", row_group_size=10
+        )
+        exporter.write_posts(self.make_posts(25))
+        self.assertEqual(len(self.read_csv(exporter, "posts")), 20)
+
+        exporter.close()
+        rows = self.read_csv(exporter, "posts")
+        self.assertEqual(len(rows), 25)
+        self.assertEqual(rows[7]["likes"], "7")
+        self.assertEqual(rows[7]["author"], "test_user")
+        self.assertEqual(rows[7]["sentiment"], "LEFT")
+
+    def test_interaction_events_are_exported(self):
+        """Interaction events reach the interactions table."""
+        exporter = AnalyticsExporter(self.temp_dir.name, export_format="csv")
+        LoggerService.add_event_sink(exporter)
+
+        post = self.make_posts(1)[0]
+        LikeCommand(post, "fan").execute()
+        LoggerService.log_event("post.initialized", post_id=1)
+
+        exporter.close()
+        rows = self.read_csv(exporter, "interactions")
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["kind"], "like")
+        self.assertEqual(rows[0]["follower"], "fan")
+        self.assertEqual(rows[0]["post_id"], str(post.post_id))
+
+    def test_lean_distribution(self):
+        """Followers are counted per lean at each sample."""
+        exporter = AnalyticsExporter(self.temp_dir.name, export_format="csv")
+        followers = [Follower(Sentiment.LEFT, f"f{i}") for i in range(3)]
+        for follower in followers:
+            follower.political_lean = 20
+
+        exporter.write_lean_distribution(followers, timestamp=1.0)
+        followers[0].political_lean = 25
+        exporter.write_lean_distribution(followers, timestamp=2.0)
+        exporter.close()
+
+        rows = [
+            (float(row["timestamp"]), row["political_lean"], row["followers"])
+            for row in self.read_csv(exporter, "lean_distribution")
+        ]
+        self.assertEqual(
+            rows, [(1.0, "20", "3"), (2.0, "20", "2"), (2.0, "25", "1")]
+        )
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            AnalyticsExporter(self.temp_dir.name, export_format="xlsx")
+
+    @unittest.skipUnless(HAS_PYARROW, "pyarrow not installed")
+    def test_parquet_row_groups(self):
+        """Parquet files get one row group per row_group_size rows."""
+        import pyarrow.parquet
+
+        exporter = AnalyticsExporter(
+            self.temp_dir.name, export_format="parquet", row_group_size=10
+        )
+        exporter.write_posts(self.make_posts(25))
+        exporter.close()
+
+        parquet_file = pyarrow.parquet.ParquetFile(exporter.path("posts"))
+        self.assertEqual(parquet_file.metadata.num_rows, 25)
+        self.assertEqual(parquet_file.metadata.num_row_groups, 3)
+        table = parquet_file.read()
+        self.assertEqual(table.column("likes").to_pylist()[24], 24)
+
+
+if __name__ == "__main__":
+    unittest.main()
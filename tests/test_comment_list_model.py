@@ -0,0 +1,134 @@
+import os
+import unittest
+from unittest.mock import MagicMock
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication  # noqa: E402
+
+from src.models.post import Comment, Post, Sentiment  # noqa: E402
+from src.services.logger_service import LoggerService  # noqa: E402
+from src.services.sqlite_repository import SQLiteRepository  # noqa: E402
+from src.views.comment_list_model import CommentListModel  # noqa: E402
+from src.views.comments_dialog import CommentsDialog  # noqa: E402
+
+
+class TestCommentListModel(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        """Create a post with more comments than fit on one page."""
+        LoggerService._logger = MagicMock()
+        self.post = Post("A viral post")
+        for i in range(CommentListModel.PAGE_SIZE * 2 + 10):
+            self.post._add_comment(self.make_comment(i))
+        self.model = CommentListModel(self.post)
+
+    def make_comment(self, i):
+        return Comment(f"Comment {i}", Sentiment.NEUTRAL, "commenter")
+
+    def fetch_all(self):
+        while self.model.canFetchMore():
+            self.model.fetchMore()
+
+    def test_comments_are_fetched_a_page_at_a_time(self):
+        """Rows are only loaded when the view asks for more."""
+        page = CommentListModel.PAGE_SIZE
+        self.assertEqual(self.model.rowCount(), 0)
+
+        self.model.fetchMore()
+        self.assertEqual(self.model.rowCount(), page)
+        self.assertEqual(
+            self.model.data(self.model.index(page - 1)),
+            f"Comment {page - 1}",
+        )
+
+        self.fetch_all()
+        self.assertEqual(self.model.rowCount(), self.post.comment_count)
+        self.assertFalse(self.model.canFetchMore())
+
+    def test_new_comment_appears_when_fully_loaded(self):
+        """A comment added while the end is visible is shown at once."""
+        self.fetch_all()
+        comment = self.make_comment("new")
+        self.post._add_comment(comment)
+
+        self.assertEqual(self.model.rowCount(), self.post.comment_count)
+        self.assertIs(
+            self.model.data(
+                self.model.index(self.model.rowCount() - 1),
+                CommentListModel.CommentRole,
+            ),
+            comment,
+        )
+
+    def test_new_comment_waits_for_scrolling_when_partly_loaded(self):
+        """Comments past the loaded pages are fetched later."""
+        self.model.fetchMore()
+        self.post._add_comment(self.make_comment("new"))
+
+        self.assertEqual(self.model.rowCount(), CommentListModel.PAGE_SIZE)
+        self.assertTrue(self.model.canFetchMore())
+
+    def test_removing_a_loaded_comment_reloads_rows(self):
+        """Removing a loaded comment keeps the rows in sync."""
+        self.model.fetchMore()
+        removed = self.post.comments[0]
+        self.post._remove_comment(removed)
+
+        self.assertEqual(self.model.rowCount(), CommentListModel.PAGE_SIZE)
+        self.assertEqual(self.model.data(self.model.index(0)), "Comment 1")
+
+    def test_dialog_loads_only_the_first_page(self):
+        """Opening the dialog does not load every comment."""
+        dialog = CommentsDialog(self.post)
+
+        self.assertEqual(
+            dialog.comment_model.rowCount(), CommentListModel.PAGE_SIZE
+        )
+        self.assertTrue(dialog.no_comments_label.isHidden())
+        dialog.deleteLater()
+
+
+class TestRepositoryCommentListModel(TestCommentListModel):
+    """The same behaviour with pages read from the SQLite repository."""
+
+    def setUp(self):
+        self.repository = SQLiteRepository(":memory:")
+        LoggerService.add_event_sink(self.repository)
+        SQLiteRepository.set_instance(self.repository)
+        super().setUp()
+
+    def tearDown(self):
+        LoggerService._event_sinks = []
+        self.repository.close()
+
+    def test_pages_come_from_the_repository(self):
+        """The model reads rows from the database, not the post."""
+        self.assertIs(self.model.repository, self.repository)
+        self.model.fetchMore()
+
+        comment = self.model.data(
+            self.model.index(0), CommentListModel.CommentRole
+        )
+        self.assertIsNot(comment, self.post.comments[0])
+        self.assertEqual(comment.content, "Comment 0")
+        self.assertEqual(comment.author, "commenter")
+        self.assertEqual(comment.sentiment, Sentiment.NEUTRAL)
+
+    def test_new_comment_appears_when_fully_loaded(self):
+        """A comment added while the end is visible is shown at once."""
+        self.fetch_all()
+        self.post._add_comment(self.make_comment("new"))
+
+        self.assertEqual(self.model.rowCount(), self.post.comment_count)
+        self.assertEqual(
+            self.model.data(self.model.index(self.model.rowCount() - 1)),
+            "Comment new",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+import os
+import unittest
+from unittest.mock import MagicMock
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QThreadPool  # noqa: E402
+from PyQt6.QtWidgets import QApplication  # noqa: E402
+
+from src.models.post import Sentiment  # noqa: E402
+from src.services.logger_service import LoggerService  # noqa: E402
+from src.views.create_post_widget import CreatePostWidget  # noqa: E402
+
+
+class TestCreatePostWidget(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        LoggerService._logger = MagicMock()
+        self.post_controller = MagicMock()
+        self.post_controller.get_cached_sentiment.return_value = None
+        self.post_controller.analyze_sentiment.return_value = Sentiment.LEFT
+        self.widget = CreatePostWidget(post_controller=self.post_controller)
+
+    def tearDown(self):
+        QThreadPool.globalInstance().waitForDone()
+        self.widget.deleteLater()
+
+    def test_typing_after_a_finished_preview(self):
+        """A preview task deleted by the pool is not taken back."""
+        self.widget.content_edit.setPlainText("A draft about taxes")
+        self.widget.request_sentiment_preview()
+        QThreadPool.globalInstance().waitForDone()
+
+        # The result has not been delivered yet, so the task is still
+        # pending here although the pool has deleted it
+        self.widget.content_edit.setPlainText("A draft about schools")
+        self.widget.request_sentiment_preview()
+        QThreadPool.globalInstance().waitForDone()
+        self.app.processEvents()
+
+        self.assertIsNone(self.widget._pending_preview_task)
+        self.assertIn("Predicted lean", self.widget.preview_label.text())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+import importlib.util
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+from src.controllers.user_controller import UserController
+from src.models.follower import Follower
+from src.models.post import Sentiment
+from src.models.user import User
+from src.services.event_stream import (
+    EventStreamWriter,
+    infer_stream_options,
+    read_events,
+)
+from src.services.logger_service import LoggerService
+
+HAS_MSGPACK = importlib.util.find_spec("msgpack") is not None
+HAS_ZSTANDARD = importlib.util.find_spec("zstandard") is not None
+
+
+class TestEventStream(unittest.TestCase):
+    def setUp(self):
+        """Write streams into a temporary directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        LoggerService._logger = MagicMock()
+
+    def tearDown(self):
+        LoggerService._event_sinks = []
+        self.temp_dir.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.temp_dir.name, name)
+
+    def write_and_read(self, name, count=100, **kwargs):
+        writer = EventStreamWriter(self.path(name), **kwargs)
+        for i in range(count):
+            writer.write_event(
+                "interaction.like",
+                {"post_id": i, "sentiment": Sentiment.LEFT},
+                1000.0 + i,
+            )
+        writer.close()
+        return list(read_events(self.path(name)))
+
+    def test_infer_stream_options(self):
+        """Format and compression follow the file extension."""
+        self.assertEqual(infer_stream_options("run.jsonl"), ("jsonl", None))
+        self.assertEqual(
+            infer_stream_options("run.jsonl.gz"), ("jsonl", "gzip")
+        )
+        self.assertEqual(
+            infer_stream_options("run.msgpack.zst"), ("msgpack", "zstd")
+        )
+
+    def test_jsonl_round_trip(self):
+        """Records should be read back in order with encoded enums."""
+        records = self.write_and_read("run.jsonl")
+
+        self.assertEqual(len(records), 100)
+        self.assertEqual(
+            records[3],
+            {
+                "ts": 1003.0,
+                "event": "interaction.like",
+                "post_id": 3,
+                "sentiment": "LEFT",
+            },
+        )
+
+    def test_gzip_blocks_round_trip(self):
+        """Several compressed blocks should read back as one stream."""
+        records = self.write_and_read("run.jsonl.gz", buffer_size=256)
+
+        self.assertEqual([r["post_id"] for r in records], list(range(100)))
+
+    def test_buffered_until_flush(self):
+        """Small writes stay in memory until the buffer fills."""
+        writer = EventStreamWriter(self.path("run.jsonl"))
+        writer.write_event("post.created", {"post_id": 1}, 1.0)
+        self.assertEqual(os.path.getsize(self.path("run.jsonl")), 0)
+
+        writer.flush()
+        self.assertGreater(os.path.getsize(self.path("run.jsonl")), 0)
+        writer.close()
+
+    @unittest.skipUnless(HAS_MSGPACK, "msgpack not installed")
+    def test_msgpack_round_trip(self):
+        """Length-prefixed msgpack records should round trip."""
+        records = self.write_and_read("run.msgpack")
+
+        self.assertEqual(records[-1]["post_id"], 99)
+
+    @unittest.skipUnless(
+        HAS_MSGPACK and HAS_ZSTANDARD, "msgpack or zstandard not installed"
+    )
+    def test_zstd_msgpack_round_trip(self):
+        """zstd compressed msgpack blocks should round trip."""
+        records = self.write_and_read("run.msgpack.zst", buffer_size=256)
+
+        self.assertEqual([r["post_id"] for r in records], list(range(100)))
+
+    def test_simulation_events_reach_sink(self):
+        """Posts and follows should be recorded by a registered sink."""
+        writer = EventStreamWriter(self.path("sim.jsonl"))
+        LoggerService.add_event_sink(writer)
+
+        controller = UserController(
+            User("test_user", "Test bio"), post_controller=MagicMock()
+        )
+        controller.post_controller.analyze_sentiment_async.return_value = (
+            MagicMock(result=MagicMock(return_value=Sentiment.NEUTRAL))
+        )
+        controller.generate_new_followers = MagicMock(return_value=0)
+
+        post = controller.create_post("A perfectly ordinary post")
+        follower = Follower(Sentiment.LEFT, "left_follower")
+        controller.add_follower(follower, post)
+        controller.remove_follower(follower)
+
+        LoggerService.remove_event_sink(writer)
+        writer.close()
+
+        records = {
+            record["event"]: record
+            for record in read_events(self.path("sim.jsonl"))
+        }
+        self.assertEqual(records["post.created"]["post_id"], post.post_id)
+        self.assertEqual(
+            records["follower.added"]["follower_id"], follower.follower_id
+        )
+        self.assertEqual(records["follower.added"]["post_id"], post.post_id)
+        self.assertIn("follower.removed", records)
+
+
+if __name__ == "__main__":
+    unittest.main()
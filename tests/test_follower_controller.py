@@ -0,0 +1,64 @@
+import unittest
+from unittest.mock import MagicMock
+
+from src.controllers.follower_controller import FollowerController
+from src.models.follower import Follower
+from src.models.post import Sentiment
+from src.models.user import User
+from src.services.logger_service import LoggerService
+
+
+class TestFollowerImpactEstimate(unittest.TestCase):
+    def setUp(self):
+        """Set up a user with one follower of each lean."""
+        LoggerService._logger = MagicMock()
+        self.controller = FollowerController()
+        self.user = User("test_user", "Test bio")
+        for sentiment in Sentiment:
+            self.user._followers.append(
+                Follower(sentiment, f"{sentiment.name.lower()}_follower")
+            )
+
+    def test_neutral_post_loses_no_followers(self):
+        """Neutral posts never trigger unfollows."""
+        gained, lost = self.controller.estimate_follower_impact(
+            self.user, Sentiment.NEUTRAL, 10
+        )
+
+        self.assertGreater(gained, 0)
+        self.assertEqual(lost, 0.0)
+
+    def test_political_post_expected_losses(self):
+        """Expected losses should sum the unfollow chance of each follower."""
+        _, lost = self.controller.estimate_follower_impact(
+            self.user, Sentiment.LEFT, 10
+        )
+
+        expected = (
+            sum(
+                self.controller.unfollow_chance(
+                    self.controller.alignment_for_lean(
+                        follower.political_lean, Sentiment.LEFT
+                    )
+                )
+                for follower in self.user.followers
+            )
+            / 100
+        )
+        self.assertAlmostEqual(lost, expected)
+        self.assertGreater(lost, 0)
+
+    def test_gains_scale_with_potential_count(self):
+        """Doubling the reach should double the expected gains."""
+        small, _ = self.controller.estimate_follower_impact(
+            self.user, Sentiment.RIGHT, 5
+        )
+        large, _ = self.controller.estimate_follower_impact(
+            self.user, Sentiment.RIGHT, 10
+        )
+
+        self.assertAlmostEqual(large, small * 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+import os
+import time
+import unittest
+from collections import namedtuple
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import Qt  # noqa: E402
+from PyQt6.QtWidgets import QApplication  # noqa: E402
+
+from src.models.follower_index import FollowerHandleIndex  # noqa: E402
+from src.models.post import Sentiment  # noqa: E402
+from src.views.follower_table_model import FollowerTableModel  # noqa: E402
+
+StubFollower = namedtuple(
+    "StubFollower", "handle political_lean sentiment", defaults=(50, None)
+)
+
+# Per-query budget for prefix searches over a million followers
+PREFIX_QUERY_BUDGET_MS = float(os.getenv("PREFIX_QUERY_BUDGET_MS", "1"))
+
+
+def handles(index):
+    return [follower.handle for follower in index.search("")]
+
+
+class TestFollowerHandleIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = FollowerHandleIndex(
+            StubFollower(handle)
+            for handle in (
+                "patriot_2",
+                "Liberal_7",
+                "patriot_10",
+                "centrist_1",
+                "pat",
+            )
+        )
+
+    def test_prefix_search_is_case_insensitive(self):
+        """Searches match the start of the handle, ignoring case and @."""
+        self.assertEqual(
+            [f.handle for f in self.index.search("PATRIOT_")],
+            ["patriot_10", "patriot_2"],
+        )
+        self.assertEqual(
+            [f.handle for f in self.index.search("@lib")], ["Liberal_7"]
+        )
+        self.assertEqual(len(self.index.search("pat")), 3)
+        self.assertEqual(self.index.search("zzz"), [])
+
+    def test_empty_prefix_matches_everything(self):
+        """An empty search lists every follower in handle order."""
+        self.assertEqual(
+            handles(self.index),
+            ["centrist_1", "Liberal_7", "pat", "patriot_10", "patriot_2"],
+        )
+
+    def test_prefix_query_time_over_a_million_followers(self):
+        """Prefix lookups stay under the budget at a million followers."""
+        prefixes = ("progressive_", "patriot_", "centrist_", "liberal_")
+        index = FollowerHandleIndex(
+            StubFollower(f"{prefixes[i % 4]}{i}") for i in range(1_000_000)
+        )
+        queries = ("pat", "patriot_12", "c", "x", "liberal_99999") * 200
+
+        started = time.perf_counter()
+        for query in queries:
+            index.prefix_range(query)
+        per_query_ms = (time.perf_counter() - started) * 1000 / len(queries)
+
+        self.assertEqual(
+            index.prefix_range("patriot_")[1]
+            - index.prefix_range("patriot_")[0],
+            250_000,
+        )
+        self.assertLess(per_query_ms, PREFIX_QUERY_BUDGET_MS)
+
+
+class TestFollowerTableModel(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.model = FollowerTableModel(
+            [
+                StubFollower("patriot_1", 90, Sentiment.RIGHT),
+                StubFollower("leftist_1", 10, Sentiment.LEFT),
+                StubFollower("patriot_2", 75, Sentiment.RIGHT),
+                StubFollower("centrist_1", 50, Sentiment.NEUTRAL),
+            ]
+        )
+
+    def column(self, column):
+        return [
+            self.model.data(self.model.index(row, column))
+            for row in range(self.model.rowCount())
+        ]
+
+    def test_rows_default_to_handle_order(self):
+        """Rows are listed by handle with @ prefixed."""
+        self.assertEqual(
+            self.column(FollowerTableModel.HANDLE_COLUMN),
+            ["@centrist_1", "@leftist_1", "@patriot_1", "@patriot_2"],
+        )
+
+    def test_sort_by_lean_and_sentiment(self):
+        """Sorting by lean or sentiment reorders the rows."""
+        self.model.sort(
+            FollowerTableModel.LEAN_COLUMN, Qt.SortOrder.DescendingOrder
+        )
+        self.assertEqual(
+            self.column(FollowerTableModel.LEAN_COLUMN), [90, 75, 50, 10]
+        )
+
+        self.model.sort(FollowerTableModel.SENTIMENT_COLUMN)
+        self.assertEqual(
+            self.column(FollowerTableModel.SENTIMENT_COLUMN),
+            ["Left-leaning", "Neutral", "Right-leaning", "Right-leaning"],
+        )
+
+    def test_prefix_filter_keeps_sort_order(self):
+        """Filtering by prefix keeps the chosen sort."""
+        self.model.sort(FollowerTableModel.LEAN_COLUMN)
+        self.model.set_prefix("pat")
+
+        self.assertEqual(self.model.rowCount(), 2)
+        self.assertEqual(
+            self.column(FollowerTableModel.HANDLE_COLUMN),
+            ["@patriot_2", "@patriot_1"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
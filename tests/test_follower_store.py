@@ -0,0 +1,148 @@
+import importlib.util
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+from src.controllers.follower_controller import FollowerController
+from src.models.follower import Follower
+from src.models.post import Post, Sentiment
+from src.services.logger_service import LoggerService
+
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+
+if HAS_NUMPY:
+    import numpy
+
+    from src.models.follower_store import FollowerStore
+
+
+@unittest.skipUnless(HAS_NUMPY, "numpy not installed")
+class TestFollowerStore(unittest.TestCase):
+    def setUp(self):
+        """Keep stores in a temporary directory."""
+        LoggerService._logger = MagicMock()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "followers")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def fill(self, store, count):
+        store.append_columns(
+            range(1, count + 1),
+            [i % 101 for i in range(count)],
+            [Sentiment.LEFT, Sentiment.RIGHT, Sentiment.NEUTRAL] * (count // 3)
+            + [Sentiment.NEUTRAL] * (count % 3),
+            [f"follower_{i}" for i in range(count)],
+        )
+
+    def test_append_grows_files(self):
+        """Appends past the capacity grow the mapped files."""
+        with FollowerStore(self.path, capacity=4) as store:
+            self.fill(store, 1000)
+
+            self.assertEqual(len(store), 1000)
+            self.assertEqual(store.handle(999), "follower_999")
+            self.assertEqual(store.column("political_lean")[202], 0)
+
+    def test_followers_round_trip(self):
+        """Follower objects keep their id, handle, sentiment and lean."""
+        followers = [
+            Follower(Sentiment.LEFT, "left_ü"),
+            Follower(Sentiment.RIGHT, "right"),
+        ]
+        with FollowerStore(self.path) as store:
+            store.append_followers(followers)
+            restored = store.followers()
+
+        self.assertEqual(
+            [
+                (f.follower_id, f.handle, f.sentiment, f.political_lean)
+                for f in restored
+            ],
+            [
+                (f.follower_id, f.handle, f.sentiment, f.political_lean)
+                for f in followers
+            ],
+        )
+
+    def test_readonly_reopen_shares_files(self):
+        """A flushed store can be mapped read-only by another reader."""
+        store = FollowerStore(self.path)
+        self.fill(store, 10)
+        store.flush()
+
+        reader = FollowerStore(self.path, readonly=True)
+        self.assertEqual(len(reader), 10)
+        self.assertIsInstance(reader.column("follower_id"), numpy.memmap)
+        self.assertEqual(reader.handles(8), ["follower_8", "follower_9"])
+        with self.assertRaises(ValueError):
+            reader.append_followers([Follower(Sentiment.LEFT, "late")])
+        reader.close()
+        store.close()
+
+    def test_update_drops_rows_in_chunks(self):
+        """update compacts away the rows a chunk function drops."""
+        with FollowerStore(self.path) as store:
+            self.fill(store, 100)
+
+            removed = store.update(
+                lambda columns: columns["follower_id"] % 2 == 0,
+                chunk_size=7,
+            )
+
+            self.assertEqual(removed, 50)
+            self.assertEqual(
+                store.column("follower_id").tolist(), list(range(2, 101, 2))
+            )
+            self.assertEqual(store.handle(0), "follower_1")
+
+    def test_lean_counts(self):
+        """lean_counts counts followers at each lean."""
+        with FollowerStore(self.path) as store:
+            self.fill(store, 202)
+            counts = store.lean_counts(chunk_size=50)
+
+        self.assertEqual(len(counts), 101)
+        self.assertEqual(counts.sum(), 202)
+        self.assertEqual(counts[0], 2)
+
+    def test_update_store_applies_post(self):
+        """A political post moves leans, adds likes and loses followers."""
+        controller = FollowerController()
+        post = Post("Left take")
+        post.sentiment = Sentiment.LEFT
+        with FollowerStore(self.path) as store:
+            self.fill(store, 3000)
+            before = store.column("political_lean").astype(int).sum()
+
+            unfollowed = controller.update_store(
+                store, post, numpy.random.default_rng(1), chunk_size=512
+            )
+
+            self.assertGreater(unfollowed, 0)
+            self.assertEqual(len(store), 3000 - unfollowed)
+            self.assertEqual(post.followers_lost, unfollowed)
+            self.assertGreater(post.likes, 0)
+            self.assertLess(
+                store.column("political_lean").astype(int).sum(), before
+            )
+            self.assertGreater(store.column("activity").sum(), 0)
+
+    def test_neutral_post_keeps_everyone(self):
+        """Neutral posts never make stored followers unfollow."""
+        controller = FollowerController()
+        with FollowerStore(self.path) as store:
+            self.fill(store, 300)
+
+            unfollowed = controller.update_store(
+                store, Post("Neutral"), numpy.random.default_rng(2)
+            )
+
+            self.assertEqual(unfollowed, 0)
+            self.assertEqual(len(store), 300)
+
+
+if __name__ == "__main__":
+    unittest.main()
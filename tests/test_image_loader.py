@@ -0,0 +1,127 @@
+import os
+import tempfile
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QSize  # noqa: E402
+from PyQt6.QtGui import QColor, QImage  # noqa: E402
+from PyQt6.QtWidgets import QApplication  # noqa: E402
+
+from src.views.image_loader import (  # noqa: E402
+    ImageLoader,
+    ThumbnailTask,
+    thumbnail_key,
+)
+
+
+class TestImageLoader(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        """Create a large picture and an empty thumbnail directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.thumbnail_dir = os.path.join(self.temp_dir.name, "thumbnails")
+        self.image_path = os.path.join(self.temp_dir.name, "photo.png")
+        image = QImage(1200, 900, QImage.Format.Format_RGB32)
+        image.fill(QColor("red"))
+        image.save(self.image_path)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def wait_for(self, loader):
+        # Let the workers finish and deliver their queued signals
+        loader.wait_for_done()
+        self.app.processEvents()
+
+    def test_image_is_decoded_in_the_background(self):
+        """request() returns None until the scaled image is ready."""
+        loader = ImageLoader(thumbnail_dir=self.thumbnail_dir)
+        ready = []
+        loader.image_ready.connect(lambda *args: ready.append(args))
+
+        self.assertIsNone(loader.request(self.image_path, 400, 300))
+        self.wait_for(loader)
+
+        self.assertEqual(ready, [(self.image_path, 400, 300)])
+        pixmap = loader.request(self.image_path, 400, 300)
+        self.assertEqual(pixmap.size(), QSize(400, 300))
+
+    def test_scaled_size_is_known_before_decoding(self):
+        """The placeholder size comes from the image header."""
+        loader = ImageLoader(thumbnail_dir=self.thumbnail_dir)
+
+        self.assertEqual(
+            loader.scaled_size(self.image_path, 400, 300), QSize(400, 300)
+        )
+        self.assertEqual(
+            loader.scaled_size(self.image_path, 2000, 50), QSize(66, 50)
+        )
+
+    def test_thumbnail_is_written_by_file_key(self):
+        """Decoded thumbnails are saved to disk for the next run."""
+        loader = ImageLoader(thumbnail_dir=self.thumbnail_dir)
+        loader.request(self.image_path, 400, 300)
+        self.wait_for(loader)
+
+        expected = f"{thumbnail_key(self.image_path)}_400x300.png"
+        self.assertEqual(os.listdir(self.thumbnail_dir), [expected])
+
+    def test_existing_thumbnail_skips_decoding(self):
+        """A cached thumbnail is used instead of the original."""
+        os.makedirs(self.thumbnail_dir)
+        thumbnail = QImage(10, 10, QImage.Format.Format_RGB32)
+        thumbnail.fill(QColor("blue"))
+        thumbnail.save(
+            os.path.join(
+                self.thumbnail_dir,
+                f"{thumbnail_key(self.image_path)}_400x300.png",
+            )
+        )
+
+        task = ThumbnailTask(self.image_path, 400, 300, self.thumbnail_dir)
+        image = task.load()
+
+        self.assertEqual(image.size(), QSize(10, 10))
+
+    def test_modified_file_gets_new_thumbnail_key(self):
+        """A changed file is not matched to its old thumbnail."""
+        key = thumbnail_key(self.image_path)
+        self.assertEqual(thumbnail_key(self.image_path), key)
+
+        image = QImage(800, 600, QImage.Format.Format_RGB32)
+        image.fill(QColor("green"))
+        image.save(self.image_path)
+        os.utime(self.image_path, ns=(0, 1))
+
+        self.assertNotEqual(thumbnail_key(self.image_path), key)
+
+    def test_scaled_sizes_are_bounded(self):
+        """Only the most recently used sizes are remembered."""
+        loader = ImageLoader(thumbnail_dir=self.thumbnail_dir)
+        loader.MAX_SIZES = 3
+
+        for width in range(100, 600, 100):
+            loader.scaled_size(self.image_path, width, 900)
+
+        self.assertEqual(
+            [key[1] for key in loader._sizes], [300, 400, 500]
+        )
+
+    def test_missing_file_gives_null_pixmap(self):
+        """Unreadable images finish with an empty pixmap."""
+        loader = ImageLoader(thumbnail_dir=self.thumbnail_dir)
+        missing = os.path.join(self.temp_dir.name, "missing.png")
+
+        loader.request(missing, 400, 300)
+        self.wait_for(loader)
+
+        self.assertTrue(loader.request(missing, 400, 300).isNull())
+        self.assertTrue(loader.scaled_size(missing, 400, 300).isEmpty())
+
+
+if __name__ == "__main__":
+    unittest.main()
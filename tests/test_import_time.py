@@ -0,0 +1,86 @@
+import os
+import subprocess
+import sys
+import unittest
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Cumulative budget for importing the model layer, overridable for slow runners
+IMPORT_TIME_BUDGET_MS = float(os.getenv("IMPORT_TIME_BUDGET_MS", "500"))
+
+MODEL_IMPORTS = (
+    "src.models",
+    "src.models.sentiment",
+    "src.models.post",
+    "src.models.user",
+    "src.models.follower",
+    "src.models.company",
+)
+
+# Packages that must only be imported on first use
+DEFERRED_PACKAGES = ("google", "dotenv", "PyQt6.QtWidgets")
+
+
+def run_python(code, *flags):
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def parse_importtime(output, prefix):
+    # Sum the cumulative time of top-level imports whose name starts with
+    # prefix. Nested imports are indented and already counted by their parent
+    total_us = 0
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line.split("|")
+        if len(parts) != 3:
+            continue
+        name = parts[2].rstrip()
+        if name.startswith(" " + prefix):
+            try:
+                total_us += int(parts[1])
+            except ValueError:
+                continue
+    return total_us / 1000
+
+
+class TestImportTime(unittest.TestCase):
+    def test_model_import_time_within_budget(self):
+        """Importing the model layer should stay under the time budget."""
+        result = run_python(
+            f"import {', '.join(MODEL_IMPORTS)}", "-X", "importtime"
+        )
+
+        import_ms = parse_importtime(result.stderr, "src")
+
+        self.assertGreater(import_ms, 0)
+        self.assertLess(
+            import_ms,
+            IMPORT_TIME_BUDGET_MS,
+            f"import src.models took {import_ms:.1f} ms "
+            f"(budget {IMPORT_TIME_BUDGET_MS:.0f} ms)",
+        )
+
+    def test_heavy_packages_are_deferred(self):
+        """Models and controllers should not pull in optional packages."""
+        code = (
+            "import sys\n"
+            f"import {', '.join(MODEL_IMPORTS)}\n"
+            "import src.controllers.post_controller\n"
+            "import src.controllers.user_controller\n"
+            "print('\\n'.join(sys.modules))\n"
+        )
+        loaded = set(run_python(code).stdout.split())
+
+        for package in DEFERRED_PACKAGES:
+            self.assertNotIn(package, loaded)
+
+
+if __name__ == "__main__":
+    unittest.main()
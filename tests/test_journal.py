@@ -0,0 +1,219 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+from src.controllers.main_controller import MainController
+from src.controllers.post_controller import PostController
+from src.controllers.user_controller import UserController
+from src.models.follower import Follower
+from src.models.post import Comment, Sentiment
+from src.models.user import User
+from src.patterns.decorator.sponsered_user import SponsoredUser
+from src.patterns.decorator.verified_user import VerifiedUser
+from src.patterns.interfaces.user_decorator import UserDecorator
+from src.services.journal import JournalWriter, read_journal, replay_journal
+from src.services.logger_service import LoggerService
+from src.services.sentiment_backends import FakeGeminiBackend
+from src.services.sentiment_service import SentimentService
+from src.services.snapshot_service import (
+    load_snapshot,
+    read_manifest,
+    save_snapshot,
+)
+
+
+class TestJournal(unittest.TestCase):
+    def setUp(self):
+        """Journal a controller-driven simulation to a temporary file."""
+        LoggerService._logger = MagicMock()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "world.journal")
+        self.service = SentimentService(
+            backend=FakeGeminiBackend(seed=7, noise=0)
+        )
+        self.controller = UserController(
+            User("test_user", "Test bio"), PostController(self.service)
+        )
+
+    def tearDown(self):
+        LoggerService._event_sinks = []
+        self.service.shutdown()
+        self.temp_dir.cleanup()
+
+    def open_journal(self, **kwargs):
+        journal = JournalWriter(self.path, sync_interval=0, **kwargs)
+        LoggerService.add_event_sink(journal)
+        return journal
+
+    def close_journal(self, journal):
+        LoggerService.remove_event_sink(journal)
+        journal.close()
+
+    def simulate(self):
+        post = self.controller.create_post("Proud patriot and republican")
+        followers = [
+            Follower(Sentiment.RIGHT, "right_1"),
+            Follower(Sentiment.LEFT, "left_1"),
+        ]
+        for follower in followers:
+            self.controller.add_follower(follower, post)
+        post._increment_likes(3)
+        post._add_comment(Comment("Agreed!", Sentiment.RIGHT, "right_1"))
+        self.controller.remove_follower(followers[1])
+        return post
+
+    def test_replay_rebuilds_user(self):
+        """Replaying the journal onto a fresh user reproduces the run."""
+        journal = self.open_journal()
+        post = self.simulate()
+        self.close_journal(journal)
+
+        user, applied, last_seq = replay_journal(
+            self.path, User("test_user", "Test bio")
+        )
+        self.assertGreater(applied, 0)
+        self.assertEqual(last_seq, journal.last_seq)
+        self.assertEqual(len(user._posts), 1)
+        replayed = user._posts[0]
+        self.assertEqual(replayed.post_id, post.post_id)
+        self.assertEqual(replayed.content, post.content)
+        self.assertEqual(replayed.sentiment, Sentiment.RIGHT)
+        self.assertEqual(replayed.likes, post.likes)
+        self.assertEqual(replayed.shares, post.shares)
+        self.assertEqual(
+            [comment.content for comment in replayed.comments],
+            [comment.content for comment in post.comments],
+        )
+        self.assertEqual(
+            [follower.handle for follower in user._followers],
+            [follower.handle for follower in self.controller.user._followers],
+        )
+        self.assertNotIn("left_1", [f.handle for f in user._followers])
+
+    def test_torn_tail_is_ignored(self):
+        """A half-written record is dropped and numbering continues."""
+        journal = self.open_journal()
+        self.simulate()
+        self.close_journal(journal)
+        records = list(read_journal(self.path))
+
+        with open(self.path, "ab") as file:
+            file.write(b"\x00\x00\x00\x00\x00\x00\x00\x63garbage")
+        self.assertEqual(list(read_journal(self.path)), records)
+
+        journal = self.open_journal()
+        self.assertEqual(journal.last_seq, records[-1][0])
+        self.controller.update_profile(bio="New bio")
+        self.close_journal(journal)
+        seqs = [record[0] for record in read_journal(self.path)]
+        self.assertEqual(seqs, list(range(1, len(records) + 2)))
+
+    def test_checkpoint_drops_old_records(self):
+        """Records up to the checkpoint are removed from the file."""
+        journal = self.open_journal()
+        self.simulate()
+        checkpoint = journal.last_seq
+        self.controller.update_profile(bio="New bio")
+        journal.checkpoint(checkpoint)
+        self.close_journal(journal)
+
+        records = list(read_journal(self.path))
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0][0], checkpoint + 1)
+        self.assertEqual(records[0][1], "user.profile_updated")
+
+    def test_group_commit(self):
+        """Records written in a burst share fsyncs."""
+        journal = JournalWriter(self.path, sync_interval=0.05)
+        for i in range(100):
+            journal.write_event(
+                "post.engagement_changed",
+                {"post_id": 1, "likes": i, "shares": 0},
+                float(i),
+            )
+        journal.close()
+
+        self.assertEqual(len(list(read_journal(self.path))), 100)
+        self.assertLess(journal.commit_count, 10)
+
+    def test_replay_after_snapshot(self):
+        """Only the records newer than the snapshot are replayed."""
+        snapshot_path = os.path.join(self.temp_dir.name, "world.snapshot")
+        journal = self.open_journal()
+        post = self.simulate()
+        save_snapshot(
+            snapshot_path,
+            self.controller.user,
+            journal_seq=journal.last_seq,
+        )
+        post._increment_shares(2)
+        self.controller.add_follower(Follower(Sentiment.RIGHT, "right_2"))
+        self.close_journal(journal)
+
+        journal_seq = read_manifest(snapshot_path)["journal_seq"]
+        user, applied, _ = replay_journal(
+            self.path, load_snapshot(snapshot_path), after_seq=journal_seq
+        )
+        self.assertGreater(applied, 0)
+        self.assertEqual(user._posts[0].shares, post.shares)
+        self.assertEqual(user._posts[0].likes, post.likes)
+        self.assertEqual(
+            [follower.handle for follower in user._followers],
+            [follower.handle for follower in self.controller.user._followers],
+        )
+        self.assertEqual(user._followers[-1].handle, "right_2")
+
+    def test_replaying_twice_changes_nothing(self):
+        """Records the state already includes are skipped."""
+        journal = self.open_journal()
+        post = self.simulate()
+        post._remove_comment(post.comments[0])
+        self.close_journal(journal)
+
+        user, _, _ = replay_journal(self.path, User("test_user", "Test bio"))
+        user, _, _ = replay_journal(self.path, user)
+
+        self.assertEqual(
+            [comment.content for comment in user._posts[0].comments],
+            [comment.content for comment in post.comments],
+        )
+        self.assertEqual(
+            len(user._followers), len(self.controller.user._followers)
+        )
+
+    def test_sponsorships_replay_once(self):
+        """A replayed sponsorship is not wrapped around the user again."""
+        journal = JournalWriter(self.path, sync_interval=0)
+        for event, company in [
+            ("user.verified", None),
+            ("sponsorship.started", "EcoTech"),
+            ("sponsorship.ended", "EcoTech"),
+            ("sponsorship.started", "PatriotArms"),
+        ]:
+            journal.write_event(event, {"company": company}, 0.0)
+        journal.close()
+
+        user, _, _ = replay_journal(self.path, User("test_user", "Test bio"))
+        user, _, _ = replay_journal(self.path, user)
+
+        layers = []
+        while isinstance(user, UserDecorator):
+            layers.append(user)
+            user = user._user
+        self.assertEqual(
+            [type(layer) for layer in layers], [SponsoredUser, VerifiedUser]
+        )
+        self.assertEqual(layers[0].company_name, "PatriotArms")
+
+    def test_snapshot_keeps_replayed_seq_without_journal(self):
+        """Snapshots record the replayed seq if the journal is closed."""
+        controller = MainController.__new__(MainController)
+        controller.journal = None
+        controller.journal_seq = 42
+
+        self.assertEqual(controller._journal_seq(), 42)
+
+
+if __name__ == "__main__":
+    unittest.main()
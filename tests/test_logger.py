@@ -0,0 +1,151 @@
+import gzip
+import logging
+import os
+import queue
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+from src.services.logger import (
+    BatchingQueueListener,
+    BoundedQueueHandler,
+    setup_logger,
+)
+from src.services.logger_service import LoggerService
+
+
+class TestAsyncLogger(unittest.TestCase):
+    def setUp(self):
+        """Log to a temporary directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.log_file = os.path.join(self.temp_dir.name, "logs", "app.log")
+
+    def tearDown(self):
+        LoggerService.shutdown()
+        LoggerService._logger = None
+        logger = logging.getLogger("test_async_logger")
+        for handler in logger.handlers:
+            handler.close()
+        logger.handlers = []
+        self.temp_dir.cleanup()
+
+    def make_config(self, **file_config):
+        return {
+            "level": "INFO",
+            "format": "%(levelname)s %(message)s",
+            "console": {"enabled": False},
+            "file": {"enabled": True, "path": self.log_file, **file_config},
+            "async": {"enabled": True, "batch_size": 10},
+        }
+
+    def test_records_are_written_by_listener(self):
+        """Queued records should reach the file once the listener stops."""
+        logger = setup_logger("test_async_logger", self.make_config())
+        self.assertIsInstance(logger.handlers[0], BoundedQueueHandler)
+
+        LoggerService.set_logger(logger)
+        for i in range(25):
+            logger.info("message %d", i)
+        LoggerService.shutdown()
+
+        with open(self.log_file) as f:
+            lines = f.read().splitlines()
+        self.assertEqual(lines, [f"INFO message {i}" for i in range(25)])
+
+    def test_rotated_files_are_compressed(self):
+        """Rotated log files should be gzipped when compress is set."""
+        logger = setup_logger(
+            "test_async_logger",
+            self.make_config(max_size=200, backup_count=2, compress=True),
+        )
+
+        LoggerService.set_logger(logger)
+        for i in range(20):
+            logger.info("a fairly long log message number %d", i)
+        LoggerService.shutdown()
+
+        rotated = f"{self.log_file}.1.gz"
+        self.assertTrue(os.path.exists(rotated))
+        with gzip.open(rotated, "rt") as f:
+            self.assertIn("log message", f.read())
+
+    def test_drop_policy_counts_dropped_records(self):
+        """A full queue should drop records instead of blocking."""
+        handler = BoundedQueueHandler(queue.Queue(maxsize=2), policy="drop")
+        record = logging.makeLogRecord({"msg": "hello"})
+
+        for _ in range(5):
+            handler.handle(record)
+
+        self.assertEqual(handler.dropped, 3)
+
+    def test_listener_flushes_once_per_batch(self):
+        """Handlers should be flushed after a batch, not per record."""
+        log_queue = queue.Queue()
+        target = MagicMock()
+        target.level = logging.NOTSET
+        listener = BatchingQueueListener(log_queue, target, batch_size=50)
+
+        for i in range(10):
+            log_queue.put(
+                logging.makeLogRecord(
+                    {"msg": f"record {i}", "levelno": logging.INFO}
+                )
+            )
+        listener.start()
+        listener.stop()
+
+        self.assertEqual(target.handle.call_count, 10)
+        self.assertLessEqual(target.flush.call_count, 2)
+
+    def test_dropped_records_are_reported(self):
+        """The listener warns about records the queue handler dropped."""
+        log_queue = queue.Queue(maxsize=2)
+        handler = BoundedQueueHandler(log_queue, policy="drop")
+        target = MagicMock()
+        target.level = logging.NOTSET
+        listener = BatchingQueueListener(
+            log_queue, target, queue_handler=handler, logger_name="test"
+        )
+
+        for i in range(5):
+            handler.handle(
+                logging.makeLogRecord(
+                    {"msg": f"record {i}", "levelno": logging.INFO}
+                )
+            )
+        listener.start()
+        listener.stop()
+
+        records = [call.args[0] for call in target.handle.call_args_list]
+        self.assertEqual(len(records), 3)
+        self.assertEqual(records[-1].levelno, logging.WARNING)
+        self.assertEqual(records[-1].name, "test")
+        self.assertEqual(
+            records[-1].getMessage(),
+            "Dropped 3 log records because the log queue was full",
+        )
+
+    def test_listener_stop_drains_queue(self):
+        """Records queued while running are handled before stop returns."""
+        log_queue = queue.Queue()
+        target = MagicMock()
+        target.level = logging.NOTSET
+        listener = BatchingQueueListener(log_queue, target, batch_size=7)
+
+        listener.start()
+        for i in range(50):
+            log_queue.put(
+                logging.makeLogRecord(
+                    {"msg": f"record {i}", "levelno": logging.INFO}
+                )
+            )
+        listener.stop()
+        listener.stop()
+
+        self.assertEqual(target.handle.call_count, 50)
+        self.assertEqual(log_queue.unfinished_tasks, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,14 @@
+import logging
+import time
 import unittest
 from unittest.mock import patch, MagicMock
 
-from src.services.logger_service import LoggerService
+from src.models.post import Sentiment
+from src.services.logger_service import (
+    EventSamplingFilter,
+    LogEvent,
+    LoggerService,
+)
 
 
 class TestLoggerServiceSingleton(unittest.TestCase):
@@ -73,5 +80,162 @@ class TestLoggerServiceSingleton(unittest.TestCase):
             mock_logger.addHandler.assert_called_once_with(mock_handler)
 
 
+class TestStructuredEvents(unittest.TestCase):
+    def setUp(self):
+        """Use a real logger whose level can be changed per test."""
+        self.logger = logging.getLogger("test_structured_events")
+        self.logger.handlers = []
+        self.logger.propagate = False
+        LoggerService.set_logger(self.logger)
+
+    def tearDown(self):
+        LoggerService._logger = None
+
+    def test_disabled_level_skips_logging(self):
+        """Events below the logger level should never reach log()."""
+        self.logger.setLevel(logging.INFO)
+
+        with patch.object(self.logger, "log") as mock_log:
+            LoggerService.log_event("interaction.like", follower="someone")
+
+        mock_log.assert_not_called()
+
+    def test_enabled_level_records_event(self):
+        """Enabled events are logged with a LogEvent message."""
+        self.logger.setLevel(logging.DEBUG)
+
+        with patch.object(self.logger, "log") as mock_log:
+            LoggerService.log_event("interaction.like", follower="someone")
+
+        mock_log.assert_called_once_with(
+            logging.DEBUG, LogEvent("interaction.like", {"follower": "someone"})
+        )
+
+    def test_event_formatting(self):
+        """Events format as name plus key=value fields."""
+        event = LogEvent(
+            "follower.created",
+            {"handle": "moderate_1234", "sentiment": Sentiment.NEUTRAL},
+        )
+
+        self.assertEqual(event.category, "follower")
+        self.assertEqual(
+            str(event),
+            "follower.created handle=moderate_1234 sentiment=NEUTRAL",
+        )
+        self.assertEqual(
+            str(LogEvent("post.initialized", {"content": "x" * 60})),
+            f"post.initialized content={'x' * 50}...",
+        )
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+class TestEventSampling(unittest.TestCase):
+    def setUp(self):
+        """Log events at DEBUG into a list."""
+        self.logger = logging.getLogger("test_event_sampling")
+        self.logger.setLevel(logging.DEBUG)
+        self.logger.propagate = False
+        self.handler = _ListHandler()
+        self.logger.handlers = [self.handler]
+        self.logger.filters = []
+        self.now = 0.0
+
+    def make_filter(self, rules):
+        sampling = EventSamplingFilter(
+            rules, interval=1.0, clock=lambda: self.now
+        )
+        sampling.logger = self.logger
+        self.logger.addFilter(sampling)
+        return sampling
+
+    def log_likes(self, count):
+        for i in range(count):
+            self.logger.debug(LogEvent("interaction.like", {"n": i}))
+
+    def test_sample_rate_keeps_every_nth_event(self):
+        """A 10% sample rate should keep one event in ten."""
+        self.make_filter({"interaction": {"sample_rate": 0.1}})
+
+        self.log_likes(100)
+
+        self.assertEqual(len(self.handler.messages), 10)
+        self.assertEqual(self.handler.messages[1], "interaction.like n=10")
+
+    def test_rate_limit_and_summary(self):
+        """Events over the limit are summarised when the window ends."""
+        sampling = self.make_filter(
+            {"interaction": {"max_per_interval": 5}}
+        )
+
+        self.log_likes(50)
+        self.logger.debug(LogEvent("follower.created", {}))
+        self.assertEqual(len(self.handler.messages), 6)
+
+        self.now = 1.5
+        sampling.flush()
+
+        self.assertEqual(
+            self.handler.messages[-1],
+            "50 interaction.like in last 1.5s "
+            "(45 not logged individually)",
+        )
+
+    def test_configure_sampling_on_logger_service(self):
+        """LoggerService should install and remove the filter."""
+        LoggerService.set_logger(self.logger)
+        try:
+            sampling = LoggerService.configure_sampling(
+                {"follower": {"sample_rate": 0.5}}
+            )
+            self.assertIn(sampling, self.logger.filters)
+
+            LoggerService.configure_sampling({})
+            self.assertNotIn(sampling, self.logger.filters)
+        finally:
+            LoggerService._sampling_filter = None
+            LoggerService._logger = None
+
+    def test_disabled_events_are_summarised_on_timer(self):
+        """DEBUG events under an INFO logger still reach the summary."""
+        self.logger.setLevel(logging.INFO)
+        LoggerService.set_logger(self.logger)
+        try:
+            sampling = LoggerService.configure_sampling(
+                {"interaction": {"sample_rate": 0.1}}, interval=0.2
+            )
+            for i in range(30):
+                LoggerService.log_event("interaction.like", n=i)
+            self.assertEqual(self.handler.messages, [])
+
+            # The window is closed by the timer, not by another event
+            deadline = time.monotonic() + 2
+            while not self.handler.messages and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.assertEqual(len(self.handler.messages), 1)
+            self.assertTrue(
+                self.handler.messages[0].startswith(
+                    "30 interaction.like in last"
+                )
+            )
+            self.assertTrue(
+                self.handler.messages[0].endswith(
+                    "(30 not logged individually)"
+                )
+            )
+        finally:
+            LoggerService.configure_sampling({})
+            LoggerService._logger = None
+        self.assertIsNone(sampling._timer)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,76 @@
+import os
+import unittest
+from unittest.mock import MagicMock
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication  # noqa: E402
+
+from src.models.post import Post  # noqa: E402
+from src.models.user import User  # noqa: E402
+from src.services.logger_service import LoggerService  # noqa: E402
+from src.views.main_window import SocialMediaMainWindow  # noqa: E402
+
+
+class TestLazyTabs(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        LoggerService._logger = MagicMock()
+        self.user = User("test_user", "Test bio")
+        self.window = SocialMediaMainWindow(self.user)
+
+    def tearDown(self):
+        self.window.deleteLater()
+
+    def test_only_the_visible_tab_is_built(self):
+        """Hidden tabs are not constructed at startup."""
+        self.assertTrue(self.window.is_tab_built("Profile"))
+        for name in ("Feed", "Followers", "News"):
+            self.assertFalse(self.window.is_tab_built(name))
+        self.assertFalse(hasattr(self.window, "news_widget"))
+        self.assertIn("tab.Profile", self.window.startup_timings)
+        self.assertIn("init_ui", self.window.startup_timings)
+
+    def test_tab_is_built_on_first_activation(self):
+        """Switching to a tab builds it once, with the controllers set."""
+        user_controller = MagicMock(user=self.user)
+        self.window.set_user_controller(user_controller)
+
+        self.window.tabs.setCurrentIndex(self.window.TABS.index("News"))
+        news_widget = self.window.news_widget
+        self.window.tabs.setCurrentIndex(0)
+        self.window.tabs.setCurrentIndex(self.window.TABS.index("News"))
+
+        self.assertIs(self.window.news_widget, news_widget)
+        self.assertIs(news_widget.user_controller, user_controller)
+        self.assertIn("tab.News", self.window.startup_timings)
+
+    def test_posts_created_before_the_feed_is_built_are_shown(self):
+        """An unbuilt feed picks up earlier posts when it is shown."""
+        post = Post("Hello world", self.user)
+        self.user._posts.append(post)
+        self.window.on_post_created(post)
+
+        self.window.tabs.setCurrentIndex(self.window.TABS.index("Feed"))
+
+        self.assertEqual(self.window.feed_widget.post_model.rowCount(), 1)
+
+    def test_startup_report_is_logged_once(self):
+        """The first paint report records the timings once."""
+        self.window.report_startup()
+        self.window.report_startup()
+
+        self.assertIn("first_paint", self.window.startup_timings)
+        startup_logs = [
+            call
+            for call in LoggerService._logger.log.call_args_list
+            if str(call.args[1]).startswith("ui.startup")
+        ]
+        self.assertEqual(len(startup_logs), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
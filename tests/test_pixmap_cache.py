@@ -0,0 +1,82 @@
+import os
+import tempfile
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtGui import QColor, QPixmap  # noqa: E402
+from PyQt6.QtWidgets import QApplication  # noqa: E402
+
+from src.views.pixmap_cache import PixmapCache  # noqa: E402
+
+
+class TestPixmapCache(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        """Create a picture file to render avatars from."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.picture_path = self.make_picture("picture.png", "red")
+        self.cache = PixmapCache()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def make_picture(self, name, color):
+        path = os.path.join(self.temp_dir.name, name)
+        pixmap = QPixmap(64, 64)
+        pixmap.fill(QColor(color))
+        pixmap.save(path)
+        return path
+
+    def test_same_picture_is_rendered_once(self):
+        """Repeated lookups should share one cached pixmap."""
+        first = self.cache.circular_avatar(self.picture_path, size=40)
+        second = self.cache.circular_avatar(self.picture_path, size=40)
+
+        self.assertEqual(first.cacheKey(), second.cacheKey())
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_size_and_border_are_part_of_the_key(self):
+        """Different sizes or borders are cached separately."""
+        self.cache.circular_avatar(self.picture_path, size=40)
+        self.cache.circular_avatar(self.picture_path, size=100)
+        self.cache.circular_avatar(self.picture_path, size=40, border_size=2)
+
+        self.assertEqual(len(self.cache), 3)
+
+    def test_modified_file_is_reloaded(self):
+        """A new mtime should produce a new cache entry."""
+        self.cache.circular_avatar(self.picture_path, size=40)
+        stat = os.stat(self.picture_path)
+        os.utime(
+            self.picture_path,
+            ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000),
+        )
+
+        self.cache.circular_avatar(self.picture_path, size=40)
+
+        self.assertEqual(self.cache.misses, 2)
+
+    def test_memory_cap_evicts_least_recently_used(self):
+        """Old entries are evicted once the memory cap is exceeded."""
+        entry_bytes = 40 * 40 * 4
+        cache = PixmapCache(max_bytes=entry_bytes * 2)
+        other_path = self.make_picture("other.png", "blue")
+        third_path = self.make_picture("third.png", "green")
+
+        cache.circular_avatar(self.picture_path, size=40)
+        cache.circular_avatar(other_path, size=40)
+        cache.circular_avatar(self.picture_path, size=40)
+        cache.circular_avatar(third_path, size=40)
+
+        self.assertEqual(len(cache), 2)
+        self.assertLessEqual(cache.current_bytes, cache.max_bytes)
+        cache.circular_avatar(self.picture_path, size=40)
+        self.assertEqual(cache.hits, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -132,6 +132,20 @@ class TestPost(unittest.TestCase):
         self.assertEqual(self.post.comments[0], comment)
         mock_slot.assert_called_once()
 
+    def test_comment_pages(self):
+        """Comments can be counted and read a slice at a time."""
+        comments = [
+            Comment(f"Comment {i}", Sentiment.NEUTRAL, "commenter")
+            for i in range(5)
+        ]
+        for comment in comments:
+            self.post._add_comment(comment)
+
+        self.assertEqual(self.post.comment_count, 5)
+        self.assertEqual(self.post.comments_page(0, 2), comments[:2])
+        self.assertEqual(self.post.comments_page(4, 2), comments[4:])
+        self.assertEqual(self.post.comments_page(5, 2), [])
+
     def test_follower_tracking(self):
         """Test follower tracking operations."""
         # Create mock slots
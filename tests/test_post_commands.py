@@ -1,3 +1,4 @@
+import logging
 import unittest
 from unittest.mock import MagicMock
 
@@ -8,7 +9,7 @@ from src.patterns.command.post_commands import (
     LikeCommand,
     ShareCommand,
 )
-from src.services.logger_service import LoggerService
+from src.services.logger_service import LogEvent, LoggerService
 
 
 class TestPostCommands(unittest.TestCase):
@@ -20,6 +21,7 @@ class TestPostCommands(unittest.TestCase):
 
         # Create a mock post
         self.mock_post = MagicMock(spec=Post)
+        self.mock_post.post_id = 42
 
         # Add author attribute to the mock post
         mock_author = MagicMock()
@@ -48,16 +50,32 @@ class TestPostCommands(unittest.TestCase):
         # Check if post._increment_likes was called
         self.mock_post._increment_likes.assert_called_once()
 
-        # Check if logging occurred
-        self.mock_logger.info.assert_called_with(
-            "Follower 'liker' liked post by @test_author"
+        # Check if the event was recorded
+        self.mock_logger.log.assert_called_with(
+            logging.DEBUG,
+            LogEvent(
+                "interaction.like",
+                {
+                    "follower": "liker",
+                    "post_id": 42,
+                    "author": "test_author",
+                },
+            ),
         )
 
         # Test undo
         like_command.undo()
         self.mock_post._decrement_likes.assert_called_once()
-        self.mock_logger.info.assert_called_with(
-            "Undid: Follower 'liker' liked post by @test_author"
+        self.mock_logger.log.assert_called_with(
+            logging.DEBUG,
+            LogEvent(
+                "interaction.like.undo",
+                {
+                    "follower": "liker",
+                    "post_id": 42,
+                    "author": "test_author",
+                },
+            ),
         )
 
     def test_share_command(self):
@@ -71,16 +89,32 @@ class TestPostCommands(unittest.TestCase):
         # Check if post._increment_shares was called
         self.mock_post._increment_shares.assert_called_once()
 
-        # Check if logging occurred
-        self.mock_logger.info.assert_called_with(
-            "Follower 'sharer' shared post by @test_author"
+        # Check if the event was recorded
+        self.mock_logger.log.assert_called_with(
+            logging.DEBUG,
+            LogEvent(
+                "interaction.share",
+                {
+                    "follower": "sharer",
+                    "post_id": 42,
+                    "author": "test_author",
+                },
+            ),
         )
 
         # Test undo
         share_command.undo()
         self.mock_post._decrement_shares.assert_called_once()
-        self.mock_logger.info.assert_called_with(
-            "Undid: Follower 'sharer' shared post by @test_author"
+        self.mock_logger.log.assert_called_with(
+            logging.DEBUG,
+            LogEvent(
+                "interaction.share.undo",
+                {
+                    "follower": "sharer",
+                    "post_id": 42,
+                    "author": "test_author",
+                },
+            ),
         )
 
     def test_comment_command(self):
@@ -94,9 +128,18 @@ class TestPostCommands(unittest.TestCase):
         # Check if post._add_comment was called with the right comment
         self.mock_post._add_comment.assert_called_once_with(self.test_comment)
 
-        # Check if logging occurred
-        self.mock_logger.info.assert_called_with(
-            "Follower 'commenter' commented on post by @test_author"
+        # Check if the event was recorded
+        self.mock_logger.log.assert_called_with(
+            logging.DEBUG,
+            LogEvent(
+                "interaction.comment",
+                {
+                    "follower": "commenter",
+                    "comment": "Test comment",
+                    "post_id": 42,
+                    "author": "test_author",
+                },
+            ),
         )
 
         # Test undo
@@ -106,8 +149,16 @@ class TestPostCommands(unittest.TestCase):
         self.mock_post._remove_comment.assert_called_once_with(
             self.test_comment
         )
-        self.mock_logger.info.assert_called_with(
-            "Undid: Follower 'commenter' commented on post by @test_author"
+        self.mock_logger.log.assert_called_with(
+            logging.DEBUG,
+            LogEvent(
+                "interaction.comment.undo",
+                {
+                    "follower": "commenter",
+                    "post_id": 42,
+                    "author": "test_author",
+                },
+            ),
         )
 
     def test_command_history(self):
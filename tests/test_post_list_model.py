@@ -0,0 +1,90 @@
+import os
+import unittest
+from unittest.mock import MagicMock
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication  # noqa: E402
+
+from src.models.post import Post  # noqa: E402
+from src.models.user import User  # noqa: E402
+from src.services.logger_service import LoggerService  # noqa: E402
+from src.views.post_list_model import PostListModel  # noqa: E402
+from src.views.refresh_coalescer import RefreshCoalescer  # noqa: E402
+
+
+class TestPostListModel(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        """Set up a user with a few posts."""
+        LoggerService._logger = MagicMock()
+        self.user = User("test_user", "Test bio")
+        for i in range(3):
+            self.user._posts.append(Post(f"Post number {i}", self.user))
+        self.model = PostListModel(self.user)
+
+    def test_rows_are_newest_first(self):
+        """The newest post should be shown in the first row."""
+        self.assertEqual(self.model.rowCount(), 3)
+        self.assertIs(
+            self.model.data(self.model.index(0), PostListModel.PostRole),
+            self.user._posts[-1],
+        )
+        self.assertEqual(
+            self.model.data(self.model.index(2)), "Post number 0"
+        )
+
+    def test_post_changes_update_only_their_row(self):
+        """A burst of likes should refresh that post's row once."""
+        changed_rows = []
+        self.model.dataChanged.connect(
+            lambda top, bottom: changed_rows.append((top.row(), bottom.row()))
+        )
+
+        for _ in range(100):
+            self.user._posts[0]._increment_likes()
+        self.assertEqual(changed_rows, [])
+        RefreshCoalescer.get_instance().flush()
+
+        self.assertEqual(changed_rows, [(2, 2)])
+
+    def test_reset_disconnects_old_posts(self):
+        """Posts dropped by a reset should no longer update the model."""
+        old_post = self.user._posts[0]
+        self.user._posts = []
+        self.model.reset_posts()
+
+        changed = []
+        self.model.dataChanged.connect(lambda *args: changed.append(args))
+        old_post._increment_likes()
+        RefreshCoalescer.get_instance().flush()
+
+        self.assertEqual(self.model.rowCount(), 0)
+        self.assertEqual(changed, [])
+
+    def test_add_post_inserts_at_top(self):
+        """A new post is inserted as row 0 without a model reset."""
+        inserted = []
+        resets = []
+        self.model.rowsInserted.connect(
+            lambda parent, first, last: inserted.append((first, last))
+        )
+        self.model.modelReset.connect(lambda: resets.append(True))
+
+        post = Post("A brand new post", self.user)
+        self.user._posts.append(post)
+        self.model.add_post(post)
+        self.model.add_post(post)
+
+        self.assertEqual(inserted, [(0, 0)])
+        self.assertEqual(resets, [])
+        self.assertEqual(self.model.rowCount(), 4)
+        self.assertIs(self.model.post_at(0), post)
+        self.assertEqual(self.model.row_of(self.user._posts[0]), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
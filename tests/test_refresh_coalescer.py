@@ -0,0 +1,70 @@
+import os
+import unittest
+from unittest.mock import MagicMock
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6 import sip  # noqa: E402
+from PyQt6.QtCore import QObject  # noqa: E402
+from PyQt6.QtWidgets import QApplication  # noqa: E402
+
+from src.views.refresh_coalescer import RefreshCoalescer  # noqa: E402
+
+
+class TestRefreshCoalescer(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.coalescer = RefreshCoalescer()
+
+    def test_repeated_marks_refresh_once(self):
+        """Marking a view many times runs its refresh once per frame."""
+        refresh = MagicMock()
+        for _ in range(1000):
+            self.coalescer.mark_dirty(refresh)
+
+        self.assertEqual(self.coalescer.pending_count, 1)
+        self.coalescer.flush()
+
+        refresh.assert_called_once_with()
+        self.assertEqual(self.coalescer.pending_count, 0)
+
+    def test_refreshes_run_in_marking_order(self):
+        """Different refreshes each run once, in the order first marked."""
+        calls = []
+        self.coalescer.mark_dirty(lambda: calls.append("a"), key="a")
+        self.coalescer.mark_dirty(lambda: calls.append("b"), key="b")
+        self.coalescer.mark_dirty(lambda: calls.append("a2"), key="a")
+        self.coalescer.flush()
+
+        self.assertEqual(calls, ["a2", "b"])
+
+    def test_timer_flushes_on_the_next_frame(self):
+        """Pending refreshes run from the event loop after one frame."""
+        refresh = MagicMock()
+        self.coalescer.mark_dirty(refresh)
+        self.assertTrue(self.coalescer._timer.isActive())
+
+        self.coalescer._timer.timeout.emit()
+
+        refresh.assert_called_once_with()
+
+    def test_deleted_owner_is_skipped(self):
+        """Refreshes of deleted views are dropped, and can be discarded."""
+        owner = QObject()
+        refresh = MagicMock()
+        discarded = MagicMock()
+        self.coalescer.mark_dirty(refresh, key="view", owner=owner)
+        self.coalescer.mark_dirty(discarded, key="closed")
+        self.coalescer.discard("closed")
+        sip.delete(owner)
+        self.coalescer.flush()
+
+        refresh.assert_not_called()
+        discarded.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,168 @@
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.patterns.interfaces.sentiment_backend import (
+    SentimentBackendError,
+    SentimentBackendThrottled,
+)
+from src.services.sentiment_backends import FakeGeminiBackend
+from src.services.sentiment_service import SentimentService
+
+
+class TestFakeGeminiBackend(unittest.TestCase):
+    def test_same_seed_gives_same_responses(self):
+        """Two backends with the same seed should behave identically."""
+        prompts = [
+            "Text to analyze: I support universal healthcare",
+            "Text to analyze: We need stronger border security",
+            "Text to analyze: The weather is nice today",
+        ]
+        first = FakeGeminiBackend(seed=42)
+        second = FakeGeminiBackend(seed=42)
+
+        self.assertEqual(
+            [first.generate(p) for p in prompts],
+            [second.generate(p) for p in prompts],
+        )
+
+    def test_latency_is_drawn_from_distribution(self):
+        """Latency should be passed to the injected sleep function."""
+        sleep = MagicMock()
+        backend = FakeGeminiBackend(
+            seed=1,
+            latency_mean=0.2,
+            latency_stddev=0.05,
+            latency_distribution="lognormal",
+            sleep=sleep,
+        )
+
+        backend.generate("Text to analyze: hello")
+
+        sleep.assert_called_once()
+        self.assertGreater(sleep.call_args[0][0], 0)
+
+    def test_error_and_throttle_rates(self):
+        """Error and throttle rates of 1.0 should always fail."""
+        with self.assertRaises(SentimentBackendThrottled):
+            FakeGeminiBackend(seed=1, throttle_rate=1.0).generate("hi")
+
+        with self.assertRaises(SentimentBackendError):
+            FakeGeminiBackend(seed=1, error_rate=1.0).generate("hi")
+
+    def test_invalid_configuration(self):
+        """Unknown distributions and out of range rates are rejected."""
+        with self.assertRaises(ValueError):
+            FakeGeminiBackend(latency_distribution="pareto")
+        with self.assertRaises(ValueError):
+            FakeGeminiBackend(error_rate=1.5)
+
+
+class TestSentimentServiceWithBackend(unittest.TestCase):
+    def test_analyze_uses_injected_backend(self):
+        """The service should score content through the backend."""
+        service = SentimentService(backend=FakeGeminiBackend(seed=3, noise=0))
+
+        self.assertGreater(
+            service.analyze_sentiment("Freedom for every patriot"), 0
+        )
+        self.assertLess(
+            service.analyze_sentiment("Progressive equality now"), 0
+        )
+
+    def test_backend_failures_default_to_neutral(self):
+        """Errors and throttling from the backend should score 0.0."""
+        throttled = SentimentService(
+            backend=FakeGeminiBackend(seed=3, throttle_rate=1.0)
+        )
+        failing = SentimentService(
+            backend=FakeGeminiBackend(seed=3, error_rate=1.0)
+        )
+
+        self.assertEqual(throttled.analyze_sentiment("anything"), 0.0)
+        self.assertEqual(failing.analyze_sentiment("anything"), 0.0)
+
+    def test_results_are_cached_by_content(self):
+        """Repeated content should be answered from the cache."""
+        backend = FakeGeminiBackend(seed=3)
+        service = SentimentService(backend=backend)
+
+        self.assertIsNone(service.get_cached_sentiment("Freedom now"))
+        first = service.analyze_sentiment("Freedom now")
+        second = service.analyze_sentiment("  Freedom now ")
+
+        self.assertEqual(first, second)
+        self.assertEqual(service.get_cached_sentiment("Freedom now"), first)
+        self.assertEqual(backend.request_count, 1)
+
+    def test_failures_are_not_cached(self):
+        """A failed analysis should be retried on the next request."""
+        backend = FakeGeminiBackend(seed=3, error_rate=1.0)
+        service = SentimentService(backend=backend)
+
+        service.analyze_sentiment("anything")
+        service.analyze_sentiment("anything")
+
+        self.assertIsNone(service.get_cached_sentiment("anything"))
+        self.assertEqual(backend.request_count, 2)
+
+    def test_cache_evicts_least_recently_used(self):
+        """The cache should stay within CACHE_SIZE entries."""
+        service = SentimentService(backend=FakeGeminiBackend(seed=3))
+        service.CACHE_SIZE = 2
+
+        service.analyze_sentiment("one")
+        service.analyze_sentiment("two")
+        service.get_cached_sentiment("one")
+        service.analyze_sentiment("three")
+
+        self.assertIsNotNone(service.get_cached_sentiment("one"))
+        self.assertIsNone(service.get_cached_sentiment("two"))
+        self.assertIsNotNone(service.get_cached_sentiment("three"))
+
+
+class TestSharedSentimentService(unittest.TestCase):
+    def setUp(self):
+        """Reset the shared instance before each test."""
+        SentimentService._instance = None
+
+    def tearDown(self):
+        SentimentService._instance = None
+
+    def test_get_instance_is_shared_across_threads(self):
+        """Every thread should receive the same service instance."""
+        instances = []
+
+        def fetch():
+            instances.append(SentimentService.get_instance())
+
+        threads = [threading.Thread(target=fetch) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len({id(instance) for instance in instances}), 1)
+
+    def test_backend_is_created_lazily_once(self):
+        """The backend is only built when the first analysis runs."""
+        backend = FakeGeminiBackend(seed=5)
+        with patch(
+            "src.services.sentiment_service.create_backend_from_env",
+            return_value=backend,
+        ) as factory:
+            service = SentimentService.get_instance()
+            self.assertFalse(service.is_initialized)
+            factory.assert_not_called()
+
+            service.analyze_sentiment("first")
+            service.analyze_sentiment("second")
+
+            factory.assert_called_once()
+            self.assertIs(service.backend, backend)
+            self.assertIsNotNone(service.init_time)
+            self.assertEqual(backend.request_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
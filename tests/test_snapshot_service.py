@@ -0,0 +1,179 @@
+import itertools
+import json
+import os
+import random
+import tempfile
+import unittest
+import zipfile
+from unittest.mock import MagicMock
+
+from src.models.follower import Follower
+from src.models.post import Comment, Post, Sentiment
+from src.models.user import User
+from src.patterns.decorator.sponsered_user import SponsoredUser
+from src.patterns.decorator.verified_user import VerifiedUser
+from src.services.company_service import CompanyService
+from src.services.logger_service import LoggerService
+from src.services.snapshot_service import (
+    MANIFEST_NAME,
+    Autosaver,
+    capture_snapshot,
+    load_snapshot,
+    read_manifest,
+    save_snapshot,
+    write_snapshot,
+)
+
+
+class TestSnapshotService(unittest.TestCase):
+    def setUp(self):
+        """Build a small simulation to save."""
+        LoggerService._logger = MagicMock()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "world.snapshot")
+
+        self.user = User("influencer", "Posting hot takes")
+        self.user._followers = [
+            Follower(Sentiment.LEFT, "left_1"),
+            Follower(Sentiment.RIGHT, "right_1"),
+            Follower(Sentiment.NEUTRAL, "neutral_1"),
+        ]
+        self.user._follower_count = 3
+        self.user._recent_follower_losses = 2
+
+        self.post = Post("Tax the rich", self.user, "picture.png")
+        self.post.sentiment = Sentiment.LEFT
+        self.post._increment_likes()
+        self.post._increment_shares()
+        self.post._add_comment(
+            Comment("Great point!", Sentiment.LEFT, "left_1")
+        )
+        self.post._add_comment(
+            Comment("Thanks!", Sentiment.NEUTRAL, self.user)
+        )
+        self.user._posts.append(self.post)
+
+        self.company_service = CompanyService()
+        company = self.company_service.get_company_by_name("EcoTech")
+        self.decorated = SponsoredUser(VerifiedUser(self.user), company.name)
+        self.decorated._misaligned_posts = 1
+        company.sponsor_user(self.decorated)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_round_trip_restores_user_posts_and_followers(self):
+        """A loaded snapshot has the same state that was saved."""
+        save_snapshot(self.path, self.decorated, self.company_service)
+        restored = load_snapshot(self.path)
+
+        self.assertIsInstance(restored, SponsoredUser)
+        self.assertIsInstance(restored._user, VerifiedUser)
+        self.assertEqual(restored.company_name, "EcoTech")
+        self.assertEqual(restored._misaligned_posts, 1)
+        self.assertEqual(restored.handle, "influencer ✔️ [Sponsored]")
+        self.assertEqual(restored.follower_count, 3)
+        self.assertEqual(restored.recent_follower_losses, 2)
+
+        self.assertEqual(
+            [
+                (f.follower_id, f.handle, f.sentiment, f.political_lean)
+                for f in restored.followers
+            ],
+            [
+                (f.follower_id, f.handle, f.sentiment, f.political_lean)
+                for f in self.user.followers
+            ],
+        )
+
+        (post,) = restored.posts
+        self.assertEqual(post.post_id, self.post.post_id)
+        self.assertEqual(post.content, "Tax the rich")
+        self.assertEqual(post.image_path, "picture.png")
+        self.assertEqual(post.timestamp, self.post.timestamp)
+        self.assertEqual((post.likes, post.shares), (1, 1))
+        self.assertEqual(post.sentiment, Sentiment.LEFT)
+        self.assertIs(post.author, restored)
+
+        first, second = post.comments
+        self.assertEqual(first.content, "Great point!")
+        self.assertEqual(first.author, "left_1")
+        self.assertEqual(first.timestamp, self.post.comments[0].timestamp)
+        self.assertIs(second.author, restored)
+
+    def test_company_sponsorships_and_rng_are_restored(self):
+        """Loading resumes sponsorships and the random sequence."""
+        save_snapshot(self.path, self.decorated, self.company_service)
+        expected = [random.random() for _ in range(3)]
+
+        company_service = CompanyService()
+        restored = load_snapshot(self.path, company_service)
+
+        self.assertEqual([random.random() for _ in range(3)], expected)
+        company = company_service.get_company_by_name("EcoTech")
+        self.assertEqual(company.sponsored_users, [restored])
+        other = company_service.get_company_by_name("Heritage Brands")
+        self.assertEqual(other.sponsored_users, [])
+
+    def test_new_ids_do_not_repeat_saved_ones(self):
+        """Ids keep counting from the saved ones in a fresh process."""
+        save_snapshot(self.path, self.user)
+        Follower._ids = itertools.count(1)
+        Post._ids = itertools.count(1)
+        load_snapshot(self.path)
+
+        saved_ids = {f.follower_id for f in self.user.followers}
+        new_follower = Follower(Sentiment.LEFT, "new")
+        self.assertNotIn(new_follower.follower_id, saved_ids)
+        self.assertGreater(Post("new").post_id, self.post.post_id)
+
+    def test_followers_and_comments_are_stored_as_columns(self):
+        save_snapshot(self.path, self.user)
+
+        manifest = read_manifest(self.path)
+        self.assertEqual(manifest["counts"]["followers"], 3)
+        self.assertEqual(manifest["counts"]["comments"], 2)
+        self.assertEqual(manifest["columns"]["followers.id"]["type"], "q")
+        with zipfile.ZipFile(self.path) as archive:
+            info = archive.getinfo("columns/followers.handle.json")
+            self.assertEqual(info.compress_type, zipfile.ZIP_DEFLATED)
+
+    def test_unsupported_version_is_rejected(self):
+        save_snapshot(self.path, self.user)
+        manifest = read_manifest(self.path)
+        manifest["version"] = 99
+        old_path = f"{self.path}.old"
+        os.replace(self.path, old_path)
+        with zipfile.ZipFile(old_path) as old, zipfile.ZipFile(
+            self.path, "w"
+        ) as archive:
+            for name in old.namelist():
+                if name != MANIFEST_NAME:
+                    archive.writestr(name, old.read(name))
+            archive.writestr(MANIFEST_NAME, json.dumps(manifest))
+
+        with self.assertRaises(ValueError):
+            load_snapshot(self.path)
+
+    def test_autosaver_writes_latest_capture_in_background(self):
+        """The newest captured state is the one left on disk."""
+        autosaver = Autosaver(self.path, lambda: capture_snapshot(self.user))
+        autosaver.save_async()
+        self.user._followers.append(Follower(Sentiment.LEFT, "late"))
+        self.user._follower_count += 1
+        autosaver.save_async()
+        autosaver.shutdown()
+
+        self.assertGreaterEqual(autosaver.save_count, 1)
+        self.assertEqual(load_snapshot(self.path).follower_count, 4)
+
+    def test_write_replaces_file_atomically(self):
+        snapshot = capture_snapshot(self.user)
+        write_snapshot(snapshot, self.path)
+        write_snapshot(snapshot, self.path)
+
+        self.assertEqual(os.listdir(self.temp_dir.name), ["world.snapshot"])
+
+
+if __name__ == "__main__":
+    unittest.main()
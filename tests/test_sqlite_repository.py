@@ -0,0 +1,330 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+from src.controllers.user_controller import UserController
+from src.models.follower import Follower
+from src.models.post import Comment, Post, Sentiment
+from src.models.user import User
+from src.patterns.command.post_commands import (
+    CommentCommand,
+    LikeCommand,
+    ShareCommand,
+)
+from src.services.logger_service import LoggerService
+from src.services.sqlite_repository import SQLiteRepository
+
+
+class TestSQLiteRepository(unittest.TestCase):
+    def setUp(self):
+        """Use a file database in a temporary directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "world.db")
+        self.repository = SQLiteRepository(self.path)
+        LoggerService._logger = MagicMock()
+
+    def tearDown(self):
+        LoggerService._event_sinks = []
+        self.repository.close()
+        self.temp_dir.cleanup()
+
+    def committed_count(self, table):
+        # Rows visible to another connection, i.e. committed
+        connection = sqlite3.connect(self.path)
+        try:
+            return connection.execute(
+                f"SELECT COUNT(*) FROM {table}"
+            ).fetchone()[0]
+        finally:
+            connection.close()
+
+    def test_writes_are_batched(self):
+        """Events are committed in one transaction per batch."""
+        repository = SQLiteRepository(
+            os.path.join(self.temp_dir.name, "batched.db"), batch_size=10
+        )
+        self.path = repository.path
+        for i in range(9):
+            repository.write_event(
+                "post.created", {"post_id": i, "user": "me"}, 100.0 + i
+            )
+        self.assertEqual(self.committed_count("posts"), 0)
+
+        repository.write_event("post.created", {"post_id": 9}, 109.0)
+        self.assertEqual(self.committed_count("posts"), 10)
+        self.assertEqual(repository.transaction_count, 1)
+        repository.close()
+
+    def test_queries_see_pending_writes(self):
+        """Queries flush queued events before reading."""
+        self.repository.write_event(
+            "post.created",
+            {"post_id": 1, "user": "me", "sentiment": Sentiment.LEFT},
+            10.0,
+        )
+        self.repository.write_event(
+            "post.created",
+            {"post_id": 2, "user": "me", "sentiment": Sentiment.RIGHT},
+            20.0,
+        )
+
+        self.assertEqual(
+            [row["post_id"] for row in self.repository.posts_by_author("me")],
+            [2, 1],
+        )
+        self.assertEqual(
+            self.repository.posts_by_sentiment(Sentiment.LEFT)[0]["post_id"],
+            1,
+        )
+        self.assertEqual(
+            [row["post_id"] for row in self.repository.posts_between(15, 25)],
+            [2],
+        )
+
+    def test_unknown_events_are_ignored(self):
+        """Diagnostic events are not stored."""
+        self.repository.write_event("follower.will_follow", {}, 1.0)
+        self.assertEqual(self.repository.event_count, 0)
+
+    def test_lookups_use_indexes(self):
+        """The common lookups are answered from an index."""
+        queries = [
+            "SELECT * FROM posts WHERE author = 'me'",
+            "SELECT * FROM followers WHERE handle = 'x'",
+            "SELECT * FROM followers WHERE political_lean BETWEEN 1 AND 3",
+            "SELECT * FROM comments WHERE post_id = 1",
+            "SELECT * FROM interactions WHERE post_id = 1",
+        ]
+        for query in queries:
+            plan = " ".join(
+                row["detail"]
+                for row in self.repository._query(
+                    "EXPLAIN QUERY PLAN " + query
+                )
+            )
+            self.assertIn("USING INDEX", plan, query)
+
+    def test_simulation_is_mirrored(self):
+        """Controller and command activity lands in the tables."""
+        LoggerService.add_event_sink(self.repository)
+
+        controller = UserController(
+            User("test_user", "Test bio"), post_controller=MagicMock()
+        )
+        controller.post_controller.analyze_sentiment_async.return_value = (
+            MagicMock(result=MagicMock(return_value=Sentiment.NEUTRAL))
+        )
+        controller.generate_new_followers = MagicMock(return_value=0)
+
+        post = controller.create_post("A perfectly ordinary post")
+        left = Follower(Sentiment.LEFT, "left_follower")
+        right = Follower(Sentiment.RIGHT, "right_follower")
+        controller.add_follower(left, post)
+        controller.add_follower(right, post)
+        controller.remove_follower(right)
+
+        LikeCommand(post, "left_follower").execute()
+        ShareCommand(post, "left_follower").execute()
+        CommentCommand(
+            post, Comment("Nice", Sentiment.LEFT, "left_follower")
+        ).execute()
+        second = CommentCommand(
+            post, Comment("Actually no", Sentiment.LEFT, "left_follower")
+        )
+        second.execute()
+        second.undo()
+
+        row = self.repository.post(post.post_id)
+        self.assertEqual(row["author"], "test_user")
+        self.assertEqual((row["likes"], row["shares"]), (1, 1))
+
+        self.assertEqual(self.repository.follower_count(), 1)
+        self.assertEqual(self.repository.follower_count(current=False), 2)
+        self.assertEqual(
+            self.repository.follower_by_handle("left_follower")[
+                "follower_id"
+            ],
+            left.follower_id,
+        )
+        self.assertEqual(
+            [
+                row["handle"]
+                for row in self.repository.followers_by_lean(0, 30)
+            ],
+            ["left_follower"],
+        )
+
+        self.assertEqual(
+            self.repository.follower_sentiment_counts(), {"LEFT": 1}
+        )
+
+        self.assertEqual(
+            [
+                row["content"]
+                for row in self.repository.comments_for_post(post.post_id)
+            ],
+            ["Nice"],
+        )
+        self.assertEqual(self.repository.comment_count(post.post_id), 1)
+        self.assertEqual(
+            len(self.repository.comments_by_author("left_follower")), 1
+        )
+        self.assertEqual(
+            [
+                row["kind"]
+                for row in self.repository.interactions_for_post(
+                    post.post_id
+                )
+            ],
+            ["like", "share", "comment", "comment", "comment.undo"],
+        )
+
+    def test_comments_without_commands_are_mirrored(self):
+        """Comments added straight to a post are stored with a page."""
+        LoggerService.add_event_sink(self.repository)
+        post = Post("A post")
+        for i in range(5):
+            post._add_comment(Comment(f"Comment {i}", Sentiment.LEFT, "a"))
+        post._remove_comment(post.comments[1])
+
+        self.assertEqual(self.repository.comment_count(post.post_id), 4)
+        self.assertEqual(
+            [
+                row["content"]
+                for row in self.repository.comments_for_post(
+                    post.post_id, 1, 2
+                )
+            ],
+            ["Comment 2", "Comment 3"],
+        )
+
+    def test_bulk_engagement_is_mirrored(self):
+        """Counters changed without commands are stored as absolutes."""
+        LoggerService.add_event_sink(self.repository)
+        post = Post("A post")
+        self.repository.write_event(
+            "post.created", {"post_id": post.post_id}, 1.0
+        )
+        post._increment_likes(250)
+        post._increment_shares(40)
+        post._decrement_likes()
+
+        row = self.repository.post(post.post_id)
+        self.assertEqual((row["likes"], row["shares"]), (249, 40))
+
+    def test_sync_backfills_a_restored_world(self):
+        """State that was never logged as events is written on sync."""
+        user = User("test_user", "Test bio")
+        post = Post("Restored post", author=user)
+        post._increment_likes(3)
+        post._add_comment(Comment("First", Sentiment.LEFT, "left_1"))
+        post._add_comment(Comment("Second", Sentiment.RIGHT, "right_1"))
+        user._posts.append(post)
+        followers = [
+            Follower(Sentiment.LEFT, f"left_{i}") for i in range(3)
+        ] + [Follower(Sentiment.RIGHT, "right_1")]
+        user._followers.extend(followers)
+
+        # A follower whose removal was lost with an uncommitted batch
+        gone = Follower(Sentiment.NEUTRAL, "gone")
+        self.repository.write_event(
+            "follower.added",
+            {"follower_id": gone.follower_id, "handle": "gone"},
+            1.0,
+        )
+
+        self.repository.sync(user)
+        self.repository.sync(user)
+
+        self.assertEqual(
+            self.repository.follower_sentiment_counts(),
+            {"LEFT": 3, "RIGHT": 1},
+        )
+        self.assertEqual(self.repository.follower_count(current=False), 5)
+        self.assertEqual(
+            [
+                row["content"]
+                for row in self.repository.comments_for_post(post.post_id)
+            ],
+            ["First", "Second"],
+        )
+        row = self.repository.post(post.post_id)
+        self.assertEqual((row["author"], row["likes"]), ("test_user", 3))
+
+    def test_lean_adjusted_by_follower_id(self):
+        """Followers sharing a handle keep their own lean."""
+        for follower_id in (1, 2):
+            self.repository.write_event(
+                "follower.added",
+                {
+                    "follower_id": follower_id,
+                    "handle": "patriot_1234",
+                    "political_lean": 80,
+                },
+                1.0,
+            )
+        self.repository.write_event(
+            "follower.lean_adjusted",
+            {"follower_id": 2, "handle": "patriot_1234", "new_lean": 90},
+            2.0,
+        )
+
+        self.assertEqual(
+            [
+                (row["follower_id"], row["political_lean"])
+                for row in self.repository.followers_by_lean(0, 100)
+            ],
+            [(1, 80), (2, 90)],
+        )
+
+    def test_database_of_another_run_is_refused(self):
+        """Ids already recorded would be replaced, so reuse is refused."""
+        self.repository.check_ids()
+        next_post = Post("probe")
+        self.repository.write_event(
+            "post.created", {"post_id": next_post.post_id + 1}, 1.0
+        )
+
+        with self.assertRaises(ValueError):
+            self.repository.check_ids()
+
+        # A resumed world hands out ids after the recorded ones
+        Post("later")
+        self.repository.check_ids()
+
+    def test_duplicate_ids_are_not_replaced(self):
+        """Recording an id twice fails rather than replacing the row."""
+        self.repository.write_event("post.created", {"post_id": 1}, 1.0)
+        self.repository.write_event("post.created", {"post_id": 1}, 2.0)
+
+        with self.assertRaises(sqlite3.IntegrityError):
+            self.repository.flush()
+
+    def test_from_env(self):
+        """SQLITE_PATH enables the repository."""
+        os.environ.pop("SQLITE_PATH", None)
+        self.assertIsNone(SQLiteRepository.from_env())
+
+        os.environ["SQLITE_PATH"] = os.path.join(self.temp_dir.name, "e.db")
+        os.environ["SQLITE_BATCH_SIZE"] = "7"
+        try:
+            repository = SQLiteRepository.from_env()
+            self.assertEqual(repository.batch_size, 7)
+            repository.close()
+        finally:
+            del os.environ["SQLITE_PATH"]
+            del os.environ["SQLITE_BATCH_SIZE"]
+
+    def test_reopen_keeps_data(self):
+        """A database can be reopened and queried later."""
+        self.repository.write_event("post.created", {"post_id": 5}, 1.0)
+        self.repository.close()
+
+        self.repository = SQLiteRepository(self.path)
+        self.assertIsNotNone(self.repository.post(5))
+
+
+if __name__ == "__main__":
+    unittest.main()
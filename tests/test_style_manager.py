@@ -0,0 +1,62 @@
+import os
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication, QFrame  # noqa: E402
+
+from src.views.style_manager import THEME_PALETTES, StyleManager  # noqa: E402
+
+
+class TestStyleManager(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.manager = StyleManager()
+
+    def tearDown(self):
+        self.app.setStyleSheet("")
+
+    def test_stylesheets_are_compiled_once_per_theme(self):
+        """Each theme's stylesheet is built once and then reused."""
+        light = self.manager.stylesheet("light")
+
+        self.assertIs(self.manager.stylesheet("light"), light)
+        self.assertIsNot(self.manager.stylesheet("dark"), light)
+        self.assertNotIn("$", light)
+        self.assertIn(
+            THEME_PALETTES["dark"]["card_background"],
+            self.manager.stylesheet("dark"),
+        )
+
+    def test_set_theme_applies_application_stylesheet(self):
+        """Switching theme replaces the application stylesheet."""
+        themes = []
+        self.manager.theme_changed.connect(themes.append)
+
+        self.manager.set_theme("dark")
+        self.assertEqual(
+            self.app.styleSheet(), self.manager.stylesheet("dark")
+        )
+        self.manager.toggle_theme()
+        self.assertEqual(
+            self.app.styleSheet(), self.manager.stylesheet("light")
+        )
+        self.assertEqual(themes, ["dark", "light"])
+
+        with self.assertRaises(ValueError):
+            self.manager.set_theme("sepia")
+
+    def test_set_role_sets_dynamic_properties(self):
+        """Roles and extra properties are stored on the widget."""
+        frame = QFrame()
+        StyleManager.set_role(frame, "company-card", leaning="LEFT")
+
+        self.assertEqual(frame.property("role"), "company-card")
+        self.assertEqual(frame.property("leaning"), "LEFT")
+
+
+if __name__ == "__main__":
+    unittest.main()
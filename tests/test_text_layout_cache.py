@@ -0,0 +1,124 @@
+import os
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QRect  # noqa: E402
+from PyQt6.QtGui import QFont  # noqa: E402
+from PyQt6.QtWidgets import QApplication  # noqa: E402
+
+from src.models.post import Post  # noqa: E402
+from src.views.post_delegate import PostDelegate  # noqa: E402
+from src.views.post_widget import PostBodyLabel  # noqa: E402
+from src.views.text_layout_cache import TextLayoutCache  # noqa: E402
+
+
+class TestTextLayoutCache(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.cache = TextLayoutCache()
+        self.font = QFont()
+        self.text = "A fairly long post body that has to wrap. " * 10
+
+    def test_layout_is_reused_for_same_text_and_width(self):
+        """Repeated lookups should share one prepared layout."""
+        first = self.cache.paragraphs(self.text, 300, self.font)
+        second = self.cache.paragraphs(self.text, 300, self.font)
+
+        self.assertIs(first, second)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_text_wraps_to_width(self):
+        """Narrower widths should give taller text."""
+        narrow = self.cache.height(self.text, 150, self.font)
+        wide = self.cache.height(self.text, 600, self.font)
+
+        self.assertGreater(narrow, wide)
+        self.assertEqual(len(self.cache), 2)
+
+    def test_line_breaks_are_kept(self):
+        """Each line of a multi-line body gets its own line."""
+        single = self.cache.height("a", 300, self.font)
+        multi = self.cache.height("a\nb\n\nd", 300, self.font)
+
+        self.assertEqual(
+            len(self.cache.paragraphs("a\nb\n\nd", 300, self.font)), 4
+        )
+        self.assertGreaterEqual(multi, single * 4)
+
+    def test_edited_text_gets_new_layout(self):
+        """Layouts are keyed by text, so edits are never shown stale."""
+        post = Post("Short")
+        short = self.cache.height(post.content, 300, self.font)
+        post.content = self.text
+        self.assertGreater(
+            self.cache.height(post.content, 300, self.font), short
+        )
+
+    def test_least_recently_used_layouts_are_evicted(self):
+        """The cache should stay within max_entries."""
+        cache = TextLayoutCache(max_entries=2)
+        first = cache.paragraphs("first", 100, self.font)
+        cache.paragraphs("second", 100, self.font)
+        cache.paragraphs("first", 100, self.font)
+        cache.paragraphs("third", 100, self.font)
+
+        self.assertEqual(len(cache), 2)
+        self.assertIs(cache.paragraphs("first", 100, self.font), first)
+        self.assertEqual(cache.misses, 3)
+
+    def test_post_body_is_cut_off_at_max_height(self):
+        """Long post bodies are clipped with a link to show the rest."""
+        label = PostBodyLabel(self.text * 5, max_height=100)
+        link_height = label.fontMetrics().height()
+
+        self.assertTrue(label.is_clipped(200))
+        self.assertEqual(label.heightForWidth(200), 100 + link_height)
+        self.assertLess(PostBodyLabel("Hi").heightForWidth(200), 100)
+        self.assertFalse(PostBodyLabel("Hi").is_clipped(200))
+
+    def test_multi_line_post_body_is_taller(self):
+        """Line breaks in a post body are shown, not run together."""
+        single = PostBodyLabel("a b c d").heightForWidth(300)
+        multi = PostBodyLabel("a\nb\nc\nd").heightForWidth(300)
+
+        self.assertGreater(multi, single * 3)
+
+    def test_expanded_post_body_shows_full_text(self):
+        """Expanding a clipped body grows it to the full text height."""
+        label = PostBodyLabel(self.text * 5, max_height=100)
+        full_height = TextLayoutCache.get_instance().height(
+            label.text, 200, label.font()
+        )
+
+        label.set_expanded(True)
+
+        self.assertEqual(
+            label.heightForWidth(200),
+            full_height + label.fontMetrics().height(),
+        )
+
+    def test_feed_row_expands_long_post(self):
+        """Feed rows of long posts grow when their link is clicked."""
+        delegate = PostDelegate()
+        post = Post(self.text * 5)
+        short = delegate._layout(QRect(0, 0, 400, 0), post, self.font)
+        self.assertIn("more", short)
+        self.assertEqual(
+            short["content"].height(), PostDelegate.CONTENT_MAX_HEIGHT
+        )
+
+        delegate.expanded.add(post.post_id)
+        full = delegate._layout(QRect(0, 0, 400, 0), post, self.font)
+
+        self.assertGreater(full["height"], short["height"])
+        self.assertNotIn(
+            "more",
+            delegate._layout(QRect(0, 0, 400, 0), Post("Hi"), self.font),
+        )
+
+if __name__ == "__main__":
+    unittest.main()
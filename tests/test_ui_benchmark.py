@@ -0,0 +1,51 @@
+import json
+import os
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from benchmarks import ui_benchmark  # noqa: E402
+
+
+class TestUIBenchmark(unittest.TestCase):
+    def test_report_has_timings_for_every_benchmark(self):
+        """A tiny run should time each scenario and count its widgets."""
+        report = ui_benchmark.run_suite(sizes=[2], repeat=2)
+
+        self.assertEqual(
+            [result["benchmark"] for result in report["results"]],
+            list(ui_benchmark.BENCHMARKS),
+        )
+        for result in report["results"]:
+            self.assertLessEqual(result["min_ms"], result["median_ms"])
+            self.assertLessEqual(result["median_ms"], result["p95_ms"])
+            self.assertGreater(result["widget_count"], 0)
+        self.assertEqual(report["environment"]["qpa_platform"], "offscreen")
+        json.dumps(report)
+
+    def test_percentile_interpolates(self):
+        self.assertEqual(ui_benchmark.percentile([1, 2, 3, 4, 5], 0.5), 3)
+        self.assertAlmostEqual(
+            ui_benchmark.percentile([10, 20], 0.95), 19.5
+        )
+
+    def test_compare_reports_median_ratio(self):
+        baseline = {
+            "results": [
+                {"benchmark": "theme.toggle", "size": 10, "median_ms": 2.0}
+            ]
+        }
+        report = {
+            "results": [
+                {"benchmark": "theme.toggle", "size": 10, "median_ms": 3.0},
+                {"benchmark": "theme.toggle", "size": 99, "median_ms": 1.0},
+            ]
+        }
+
+        lines = ui_benchmark.compare(report, baseline)
+        self.assertEqual(len(lines), 1)
+        self.assertIn("(1.50x)", lines[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import unittest
+from concurrent.futures import Future
+from unittest.mock import MagicMock
+
+from src.controllers.post_controller import PostController
+from src.controllers.user_controller import UserController
+from src.models.post import Sentiment
+from src.models.user import User
+from src.services.logger_service import LoggerService
+from src.services.sentiment_backends import FakeGeminiBackend
+from src.services.sentiment_service import SentimentService
+
+
+class TestSpeculativeSentiment(unittest.TestCase):
+    def setUp(self):
+        """Set up a controller backed by the local fake model."""
+        LoggerService._logger = MagicMock()
+        self.service = SentimentService(
+            backend=FakeGeminiBackend(seed=7, noise=0)
+        )
+        self.post_controller = PostController(self.service)
+        self.controller = UserController(
+            User("test_user", "Test bio"), self.post_controller
+        )
+
+    def tearDown(self):
+        self.service.shutdown()
+
+    def test_valid_post_uses_speculative_result(self):
+        """The background analysis should supply the post sentiment."""
+        post = self.controller.create_post("Proud patriot and republican")
+
+        self.assertIsNotNone(post)
+        self.assertEqual(post.sentiment, Sentiment.RIGHT)
+        self.assertEqual(self.service.backend.request_count, 1)
+
+    def test_rejected_post_discards_speculative_result(self):
+        """A post rejected by moderation should cancel its analysis."""
+        future = MagicMock(spec=Future)
+        self.post_controller.analyze_sentiment_async = MagicMock(
+            return_value=future
+        )
+
+        self.assertIsNone(self.controller.create_post("hi"))
+        future.cancel.assert_called_once()
+        future.result.assert_not_called()
+
+    def test_failed_moderation_discards_speculative_result(self):
+        """An interceptor error should cancel the analysis."""
+        future = MagicMock(spec=Future)
+        self.post_controller.analyze_sentiment_async = MagicMock(
+            return_value=future
+        )
+        self.controller.dispatcher.process_post = MagicMock(
+            side_effect=RuntimeError("filter failed")
+        )
+
+        with self.assertRaises(RuntimeError):
+            self.controller.create_post("Proud patriot and republican")
+        future.cancel.assert_called_once()
+
+    def test_cancelled_analysis_falls_back_to_synchronous(self):
+        """A cancelled background analysis should be redone inline."""
+        future = Future()
+        future.cancel()
+        self.post_controller.analyze_sentiment_async = MagicMock(
+            return_value=future
+        )
+
+        post = self.controller.create_post("Progressive equality now")
+
+        self.assertEqual(post.sentiment, Sentiment.LEFT)
+
+    def test_cached_content_resolves_immediately(self):
+        """Already analysed content should not be submitted again."""
+        self.service.analyze_sentiment("Freedom for every patriot")
+
+        future = self.post_controller.analyze_sentiment_async(
+            "Freedom for every patriot"
+        )
+
+        self.assertTrue(future.done())
+        self.assertEqual(future.result(), Sentiment.RIGHT)
+        self.assertIsNone(self.service._executor)
+
+
+if __name__ == "__main__":
+    unittest.main()